@@ -1,6 +1,8 @@
 """Entry point for running DevGenesis as a module"""
 
-from devgenesis.main import main
+import sys
+
+from devgenesis.cli import main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
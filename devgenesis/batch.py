@@ -0,0 +1,414 @@
+"""Generate many projects at once from a YAML or JSON manifest.
+
+A manifest lists the projects to generate, each naming a template::
+
+    defaults:
+      output: generated        # Base folder for projects without a path
+      git_init: false
+    projects:
+      - template: FastAPI + Docker
+        name: billing
+      - template: React + Tailwind + Vite
+        name: dashboard
+        path: front/dashboard
+        options:
+          install_deps: false
+
+A plain list of projects is accepted too. Relative paths are resolved
+against the manifest's folder.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from multiprocessing.util import Finalize
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+from devgenesis.config import BATCH_WORKERS
+from devgenesis.generator import ProjectGenerator, config_from_template, run_generator
+from devgenesis.models import ProjectConfig
+from devgenesis.services.filesystem import drain_deletions
+from devgenesis.services.venv_pool import get_venv_pool
+from devgenesis.services.wheelhouse import get_wheelhouse
+
+# Fields a manifest may not override: they come from the template or the job itself
+_TEMPLATE_FIELDS = {
+    "name",
+    "description",
+    "project_type",
+    "path",
+    "technologies",
+    "structure",
+    "files",
+    "commands",
+}
+_OPTION_ALIASES = {"install_deps": "run_commands"}  # Same names as generate_project_from_template
+OPTION_FIELDS = frozenset(
+    {*(set(ProjectConfig.model_fields) - _TEMPLATE_FIELDS), *_OPTION_ALIASES}
+)
+
+
+@dataclass
+class BatchJob:
+    """One project of a batch."""
+
+    template: str  # Template name, or the path of a template JSON file
+    name: str
+    path: str
+    description: Optional[str] = None
+    options: Dict[str, Any] = field(default_factory=dict)  # ProjectConfig fields to override
+
+
+@dataclass
+class JobResult:
+    """Outcome of one batch job."""
+
+    name: str
+    path: str
+    template: str
+    success: bool
+    duration: float
+    stage_timings: Dict[str, float] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
+@dataclass
+class BatchReport:
+    """Aggregated outcome of :func:`generate_many`."""
+
+    results: List[JobResult]
+    duration: float
+    workers: int
+    started_at: str
+
+    @property
+    def succeeded(self) -> int:
+        return sum(result.success for result in self.results)
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.succeeded
+
+    @property
+    def ok(self) -> bool:
+        return self.failed == 0
+
+    def describe(self) -> str:
+        return (
+            f"{len(self.results)} projet(s) en {self.duration:.1f} s avec {self.workers} "
+            f"processus: {self.succeeded} réussi(s), {self.failed} échec(s)"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "started_at": self.started_at,
+            "duration": self.duration,
+            "workers": self.workers,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "projects": [asdict(result) for result in self.results],
+        }
+
+    def write(self, path: Path) -> None:
+        """Write the report as JSON, atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        os.replace(temporary, path)
+
+
+def _read_manifest(path: Path) -> Any:
+    text = path.read_text(encoding="utf-8")
+    if path.suffix.lower() == ".json":
+        return json.loads(text)
+    import yaml
+
+    return yaml.safe_load(text)
+
+
+def _check_options(options: Mapping[str, Any], where: str) -> Dict[str, Any]:
+    unknown = sorted(set(options) - OPTION_FIELDS)
+    if unknown:
+        raise ValueError(f"{where}: option(s) inconnue(s): {', '.join(unknown)}")
+    return dict(options)
+
+
+def load_batch_manifest(path: Path) -> List[BatchJob]:
+    """Parse a batch manifest; raises ValueError when it is malformed."""
+    try:
+        data = _read_manifest(path)
+    except OSError:
+        raise
+    except Exception as exc:  # json and yaml syntax errors
+        raise ValueError(f"{path}: {exc}") from exc
+
+    if isinstance(data, list):
+        data = {"projects": data}
+    if not isinstance(data, dict) or not isinstance(data.get("projects"), list):
+        raise ValueError(f"{path}: une liste 'projects' est attendue")
+
+    base = path.parent.resolve()
+    defaults = dict(data.get("defaults") or {})
+    output = base / str(defaults.pop("output", "."))
+    default_options = _check_options(defaults, "defaults")
+
+    jobs: List[BatchJob] = []
+    seen: Dict[str, str] = {}
+    for index, entry in enumerate(data["projects"], start=1):
+        where = f"projects[{index}]"
+        if not isinstance(entry, dict) or not entry.get("template") or not entry.get("name"):
+            raise ValueError(f"{where}: 'template' et 'name' sont requis")
+        name = str(entry["name"])
+        project_path = base / str(entry["path"]) if entry.get("path") else output / name
+        project_path = Path(os.path.normpath(project_path))
+        if str(project_path) in seen:
+            other = seen[str(project_path)]
+            raise ValueError(f"{where}: même dossier que {other} ({project_path})")
+        seen[str(project_path)] = name
+
+        template = str(entry["template"])
+        if template.lower().endswith(".json"):
+            template = str(base / template)
+        jobs.append(
+            BatchJob(
+                template=template,
+                name=name,
+                path=str(project_path),
+                description=entry.get("description"),
+                options={**default_options, **_check_options(entry.get("options") or {}, where)},
+            )
+        )
+    return jobs
+
+
+def resolve_templates(jobs: Sequence[BatchJob]) -> Dict[str, Dict[str, Any]]:
+    """Load every template the jobs refer to, once each.
+
+    Names are looked up among the builtin templates first, then in the
+    database for custom ones; ``*.json`` references are read from disk.
+    """
+    from devgenesis.templates.builtin_templates import get_all_builtin_templates
+
+    builtin = {template["name"].lower(): template for template in get_all_builtin_templates()}
+    database = None
+    templates: Dict[str, Dict[str, Any]] = {}
+    for job in jobs:
+        if job.template in templates:
+            continue
+        if job.template.lower().endswith(".json"):
+            with open(job.template, "r", encoding="utf-8") as f:
+                templates[job.template] = json.load(f)
+            continue
+        template = builtin.get(job.template.lower())
+        if template is None:
+            if database is None:
+                from devgenesis.database import DatabaseService
+
+                database = DatabaseService()
+            template = database.get_template_by_name(job.template)
+        if template is None:
+            raise ValueError(f"Template introuvable: {job.template}")
+        templates[job.template] = template
+    return templates
+
+
+def _warm_template_cache(templates: Mapping[str, Dict[str, Any]]) -> None:
+    """Compile every Jinja source once so workers find it in the bytecode cache.
+
+    With the fork start method the workers also inherit the compiled
+    templates in memory.
+    """
+    from devgenesis.services.template_engine import get_template_engine
+
+    engine = get_template_engine()
+    for template in templates.values():
+        for file in template.get("files", []):
+            if file.get("is_template") and file.get("content"):
+                try:
+                    engine.get_template(file["content"])
+                except Exception:
+                    continue  # Reported by the job that renders it
+
+
+_worker_templates: Dict[str, Dict[str, Any]] = {}
+
+
+def _drain_worker() -> None:
+    """Finish the background work left by the worker's jobs before it exits."""
+    drain_deletions()
+    get_wheelhouse().drain()
+    pool = get_venv_pool()
+    if pool is not None:
+        pool.drain()
+
+
+def _init_worker(templates: Dict[str, Dict[str, Any]]) -> None:
+    """Receive the resolved templates once per worker instead of once per job."""
+    global _worker_templates
+    _worker_templates = templates
+    # Pool workers exit without running atexit handlers, but they do run these finalizers
+    Finalize(None, _drain_worker, exitpriority=10)
+
+
+def _job_config(job: BatchJob, template: Dict[str, Any]) -> ProjectConfig:
+    config = config_from_template(template, job.name, job.path, description=job.description)
+    options = {_OPTION_ALIASES.get(key, key): value for key, value in job.options.items()}
+    return ProjectConfig.model_validate({**config.model_dump(), **options})
+
+
+def run_job(job: BatchJob, template: Optional[Dict[str, Any]] = None) -> JobResult:
+    """Generate one project; never raises, failures are reported in the result."""
+    messages: Dict[str, List[str]] = {"error": [], "warning": []}
+
+    def collect(message: str, level: str = "info") -> None:
+        if level in messages:
+            messages[level].append(message)
+
+    start = time.perf_counter()
+    success = False
+    stage_timings: Dict[str, float] = {}
+    try:
+        if template is None:
+            template = _worker_templates[job.template]
+        Path(job.path).parent.mkdir(parents=True, exist_ok=True)
+        generator = ProjectGenerator(_job_config(job, template), collect)
+        success = run_generator(generator, collect, dry_run=False)
+        stage_timings = generator.stage_timings
+    except Exception as exc:
+        messages["error"].append(f"{type(exc).__name__}: {exc}")
+
+    return JobResult(
+        name=job.name,
+        path=job.path,
+        template=job.template,
+        success=success,
+        duration=time.perf_counter() - start,
+        stage_timings=stage_timings,
+        errors=messages["error"],
+        warnings=messages["warning"],
+    )
+
+
+def generate_many(
+    jobs: Sequence[BatchJob],
+    workers: int = BATCH_WORKERS,
+    report_path: Optional[Path] = None,
+    progress_callback: Optional[Callable[[str, str], None]] = None,
+) -> BatchReport:
+    """Generate ``jobs`` on a pool of ``workers`` processes.
+
+    Results are listed in the order of ``jobs``. With ``workers=1`` the
+    projects are generated one after the other in this process.
+    """
+    started_at = datetime.now().isoformat()
+    start = time.perf_counter()
+    templates = resolve_templates(jobs)
+    workers = max(1, min(workers, len(jobs) or 1))
+    results: List[Optional[JobResult]] = [None] * len(jobs)
+
+    def report(index: int, result: JobResult) -> None:
+        results[index] = result
+        if progress_callback:
+            done = sum(item is not None for item in results)
+            status = "OK" if result.success else "ÉCHEC"
+            detail = f": {result.errors[-1]}" if result.errors else ""
+            progress_callback(
+                f"[{done}/{len(jobs)}] {status} {result.name} ({result.duration:.1f} s){detail}",
+                "success" if result.success else "error",
+            )
+
+    if workers == 1:
+        for index, job in enumerate(jobs):
+            report(index, run_job(job, templates[job.template]))
+    else:
+        _warm_template_cache(templates)
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(templates,)
+        ) as executor:
+            futures = {executor.submit(run_job, job): index for index, job in enumerate(jobs)}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    result = future.result()
+                except Exception as exc:  # The worker process died
+                    job = jobs[index]
+                    result = JobResult(
+                        job.name, job.path, job.template, False, 0.0, errors=[str(exc)]
+                    )
+                report(index, result)
+
+    batch = BatchReport(
+        results=[result for result in results if result is not None],
+        duration=time.perf_counter() - start,
+        workers=workers,
+        started_at=started_at,
+    )
+    if report_path is not None:
+        batch.write(report_path)
+    return batch
+
+
+def main(argv: Optional[Sequence[str]] = None, output: Callable[[str], None] = print) -> int:
+    """Generate the projects of a manifest; exit status 1 when any of them failed."""
+    parser = argparse.ArgumentParser(
+        prog="devgenesis-batch",
+        description="Génère plusieurs projets décrits dans un manifeste YAML ou JSON",
+    )
+    parser.add_argument("manifest", type=Path, help="Manifeste YAML ou JSON")
+    parser.add_argument(
+        "-j", "--workers", type=int, default=BATCH_WORKERS, help="Projets générés en parallèle"
+    )
+    parser.add_argument(
+        "--report", type=Path, help="Rapport JSON (par défaut à côté du manifeste)"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        jobs = load_batch_manifest(args.manifest)
+    except (OSError, ValueError) as exc:
+        output(f"ERREUR: {exc}")
+        return 2
+
+    report_path = args.report or args.manifest.with_name(f"{args.manifest.stem}.report.json")
+    try:
+        report = generate_many(
+            jobs,
+            workers=args.workers,
+            report_path=report_path,
+            progress_callback=lambda message, level: output(message),
+        )
+    except (OSError, ValueError) as exc:
+        output(f"ERREUR: {exc}")
+        return 2
+
+    output(report.describe())
+    output(f"Rapport: {report_path}")
+    return 0 if report.ok else 1
+
+
+__all__ = [
+    "BatchJob",
+    "BatchReport",
+    "JobResult",
+    "OPTION_FIELDS",
+    "generate_many",
+    "load_batch_manifest",
+    "main",
+    "resolve_templates",
+    "run_job",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""Command-line entry point for DevGenesis.
+
+Only argparse is imported up front: each subcommand imports what it needs
+when it runs, so ``devgenesis --help`` stays fast and Qt is loaded by the
+``gui`` subcommand alone.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+
+def _load_template(reference: str) -> Dict[str, Any]:
+    """Find a template by name, id, or the path of a template JSON file"""
+    if reference.lower().endswith(".json"):
+        with open(reference, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    from devgenesis.database import DatabaseService
+
+    db = DatabaseService()
+    template = (
+        db.get_template_by_id(int(reference))
+        if reference.isdigit()
+        else db.get_template_by_name(reference)
+    )
+    if template is None:
+        # Names are matched case-insensitively as a fallback, as typed in a shell
+        wanted = reference.lower()
+        summary = next(
+            (item for item in db.list_template_summaries() if item.name.lower() == wanted), None
+        )
+        template = db.get_template_by_id(summary.id) if summary else None
+    if template is None:
+        raise ValueError(f"Template introuvable: {reference} (voir `devgenesis list-templates`)")
+    return template
+
+
+def _project_path(args: argparse.Namespace) -> str:
+    from pathlib import Path
+
+    return str(Path(args.path) if args.path else Path(args.output) / args.name)
+
+
+def _add_project_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("template", help="Nom ou id du template, ou fichier template .json")
+    parser.add_argument("name", help="Nom du projet")
+    location = parser.add_mutually_exclusive_group()
+    location.add_argument(
+        "-o", "--output", default=".", help="Dossier parent du projet (par défaut: courant)"
+    )
+    location.add_argument("--path", help="Chemin complet du projet")
+    parser.add_argument("-d", "--description", help="Description du projet")
+    parser.add_argument("--no-git", action="store_true", help="Ne pas initialiser Git")
+    parser.add_argument("--no-venv", action="store_true", help="Ne pas créer de venv Python")
+    parser.add_argument("--no-install", action="store_true", help="Ne pas lancer les commandes")
+
+
+def _build_plan(args: argparse.Namespace) -> Tuple[Dict[str, Any], Any]:
+    from devgenesis.generator import build_generation_plan
+
+    template = _load_template(args.template)
+    return template, build_generation_plan(
+        template,
+        args.name,
+        _project_path(args),
+        description=args.description,
+        git_init=not args.no_git,
+        create_venv=not args.no_venv,
+        install_deps=not args.no_install,
+    )
+
+
+def _generate(args: argparse.Namespace, output: Callable[[str], None]) -> int:
+    from devgenesis.generator import generate_project_from_plan
+
+    if args.offline:
+        os.environ["DEVGENESIS_OFFLINE"] = "1"
+    template, plan = _build_plan(args)
+    success = generate_project_from_plan(plan)
+
+    from devgenesis.database import DatabaseService
+
+    DatabaseService().add_project_history(
+        plan.config.name,
+        plan.config.path,
+        template["name"],
+        [technology.name for technology in plan.config.technologies],
+        status="success" if success else "error",
+    )
+    return 0 if success else 1
+
+
+def _preview(args: argparse.Namespace, output: Callable[[str], None]) -> int:
+    _, plan = _build_plan(args)
+    preview = plan.preview()
+    if args.json:
+        output(json.dumps(preview, ensure_ascii=False, indent=2))
+        return 0
+    for directory in preview["directories"]:
+        output(f"{directory}/")
+    for file in preview["files"]:
+        output(file["path"])
+    if preview["commands"]:
+        output("")
+        for command in preview["commands"]:
+            output(f"$ {command}")
+    return 0
+
+
+def _list_templates(args: argparse.Namespace, output: Callable[[str], None]) -> int:
+    from devgenesis.database import DatabaseService
+
+    templates = DatabaseService().list_template_summaries(args.type)
+    rows = [
+        {
+            "id": template.id,
+            "name": template.name,
+            "project_type": template.project_type,
+            "is_builtin": template.is_builtin,
+            "description": template.description,
+        }
+        for template in templates
+    ]
+    if args.json:
+        output(json.dumps(rows, ensure_ascii=False, indent=2))
+        return 0
+    for row in rows:
+        origin = "intégré" if row["is_builtin"] else "perso"
+        output(f"{row['id']:>4}  {row['name']:<32} {row['project_type']:<16} {origin}")
+    return 0
+
+
+def _history(args: argparse.Namespace, output: Callable[[str], None]) -> int:
+    from devgenesis.database import DatabaseService
+
+    history = DatabaseService().get_project_history(limit=args.limit)
+    if args.json:
+        output(json.dumps(history, ensure_ascii=False, indent=2))
+        return 0
+    if not history:
+        output("Aucun projet dans l'historique")
+    for item in history:
+        output(
+            f"{item['created_at'] or '':<26} {item['status']:<8} {item['project_name']:<24} "
+            f"{item['template_name'] or '-':<28} {item['project_path']}"
+        )
+    return 0
+
+
+def _gui(args: argparse.Namespace, output: Callable[[str], None]) -> int:
+    from devgenesis.main import main as gui_main
+
+    gui_main()
+    return 0
+
+
+# Subcommands that hand their arguments to another tool's own ``main``
+_DELEGATED = {
+    "batch": ("devgenesis.batch", "Générer les projets d'un manifeste"),
+    "verify": ("devgenesis.services.manifest", "Vérifier des projets générés"),
+    "wheelhouse": ("devgenesis.services.wheelhouse", "Gérer le wheelhouse local"),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="devgenesis",
+        description="Générateur universel de projets (sans argument: interface graphique)",
+    )
+    subcommands = parser.add_subparsers(dest="command", metavar="COMMANDE")
+
+    generate = subcommands.add_parser("generate", help="Générer un projet")
+    _add_project_arguments(generate)
+    generate.add_argument(
+        "--offline", action="store_true", help="pip n'utilise que le wheelhouse local"
+    )
+    generate.set_defaults(handler=_generate)
+
+    preview = subcommands.add_parser("preview", help="Afficher ce qui serait généré")
+    _add_project_arguments(preview)
+    preview.add_argument("--json", action="store_true", help="Aperçu complet au format JSON")
+    preview.set_defaults(handler=_preview)
+
+    list_templates = subcommands.add_parser("list-templates", help="Lister les templates")
+    list_templates.add_argument("--type", help="Filtrer par type de projet")
+    list_templates.add_argument("--json", action="store_true", help="Sortie JSON")
+    list_templates.set_defaults(handler=_list_templates)
+
+    history = subcommands.add_parser("history", help="Historique des projets générés")
+    history.add_argument("-n", "--limit", type=int, default=50, help="Nombre d'entrées")
+    history.add_argument("--json", action="store_true", help="Sortie JSON")
+    history.set_defaults(handler=_history)
+
+    gui = subcommands.add_parser("gui", help="Lancer l'interface graphique")
+    gui.set_defaults(handler=_gui)
+
+    for name, (_, help_text) in _DELEGATED.items():
+        subcommands.add_parser(name, help=help_text, add_help=False)  # Listed in --help only
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None, output: Callable[[str], None] = print) -> int:
+    """Run a subcommand; without one, start the GUI."""
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv and argv[0] in _DELEGATED:
+        import importlib
+
+        return importlib.import_module(_DELEGATED[argv[0]][0]).main(argv[1:], output=output)
+
+    args = build_parser().parse_args(argv)
+    handler = getattr(args, "handler", _gui)
+    try:
+        return handler(args, output)
+    except (OSError, ValueError) as exc:
+        print(f"Erreur: {exc}", file=sys.stderr)
+        return 2
+    except Exception as exc:
+        from jinja2 import TemplateError  # Only loaded once something already failed
+
+        if not isinstance(exc, TemplateError):
+            raise
+        print(f"Erreur: {exc}", file=sys.stderr)
+        return 2
+
+
+__all__ = ["build_parser", "main"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,16 +10,37 @@ ROOT_DIR = APP_DIR.parent
 TEMPLATES_DIR = APP_DIR / "templates"
 USER_TEMPLATES_DIR = ROOT_DIR / "user_templates"
 DATABASE_PATH = ROOT_DIR / "devgenesis.db"
-
-# Ensure directories exist
-USER_TEMPLATES_DIR.mkdir(exist_ok=True)
-TEMPLATES_DIR.mkdir(exist_ok=True)
+USER_DATA_DIR = Path.home() / ".devgenesis"
+TEMPLATE_BYTECODE_CACHE_DIR = USER_DATA_DIR / "jinja-cache"
+BLOB_STORE_DIR = USER_DATA_DIR / "blobs"  # Binary template assets, addressed by SHA-256
+SNAPSHOT_CACHE_DIR = USER_DATA_DIR / "snapshots"  # Rendered trees reused across generations
+DEPENDENCY_CACHE_DIR = USER_DATA_DIR / "deps"  # node_modules / site-packages keyed by manifest
+VENV_POOL_DIR = USER_DATA_DIR / "venv-pool"  # Virtual environments built ahead of time
+WHEELHOUSE_DIR = USER_DATA_DIR / "wheelhouse"  # Wheels for installing without a package index
 
 # Application settings
 APP_NAME = "DevGenesis"
 APP_VERSION = "1.0.0"
 APP_DESCRIPTION = "Générateur universel de projets et environnements de développement"
 
+# Template rendering
+TEMPLATE_CACHE_SIZE = 512  # Compiled Jinja2 templates kept in memory
+TEMPLATE_BYTECODE_CACHE_MAX_ENTRIES = 2000  # Oldest bytecode files are pruned beyond this count
+TEMPLATE_BODY_CACHE_SIZE = 16  # Full templates kept in memory, at least; grows to the catalog size
+
+# Generation
+FILE_WRITE_WORKERS = 8  # Concurrent file writes while materialising a project
+STREAM_RENDER_THRESHOLD = 1024 * 1024  # Template sources above this size are streamed to disk
+SNAPSHOT_CACHE_MAX_ENTRIES = 50  # Oldest snapshots are pruned beyond this count
+COMMAND_CONCURRENCY = 4  # Template commands allowed to run at the same time
+COMMAND_TIMEOUT = 300  # Seconds a template command may run in total
+COMMAND_IDLE_TIMEOUT = 180  # Seconds a template command may stay silent
+DEPENDENCY_CACHE_MAX_ENTRIES = 20  # Installed dependency sets kept for reuse
+VENV_POOL_SIZE = 2  # Ready venvs kept per interpreter
+WHEELHOUSE_PREFETCH_TIMEOUT = 900  # Seconds a background "pip wheel" download may take
+EXIT_DRAIN_TIMEOUT = 5  # Seconds a process waits at exit for background work before cancelling it
+BATCH_WORKERS = 4  # Projects generated at the same time by batch mode
+
 # UI Configuration
 UI_CONFIG = {
     "window_title": f"{APP_NAME} v{APP_VERSION}",
@@ -163,3 +184,9 @@ def save_user_config(config: Dict[str, Any]) -> None:
     config_file = ROOT_DIR / "user_config.json"
     with open(config_file, "w", encoding="utf-8") as f:
         json.dump(config, f, indent=2, ensure_ascii=False)
+
+
+def ensure_directories() -> None:
+    """Create the application folders (at startup, not on import)"""
+    USER_TEMPLATES_DIR.mkdir(exist_ok=True)
+    TEMPLATES_DIR.mkdir(exist_ok=True)
@@ -3,7 +3,6 @@
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 import json
-import yaml
 
 from devgenesis.config import ROOT_DIR
 
@@ -79,6 +78,8 @@ class CustomProjectConfig:
                 if import_file.suffix == '.json':
                     config = json.load(f)
                 elif import_file.suffix in ['.yml', '.yaml']:
+                    import yaml
+
                     config = yaml.safe_load(f)
                 else:
                     return False
@@ -1,24 +1,132 @@
 """Database service layer for DevGenesis"""
 
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
+from bisect import insort
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Dict, Any
+from sqlalchemy.orm import Session, load_only
 import json
+import threading
 
-from devgenesis.models import (
+from devgenesis.config import TEMPLATE_BODY_CACHE_SIZE
+from devgenesis.orm import (
     ProjectTemplate,
     ProjectHistory,
     SessionLocal,
     init_database,
 )
-from devgenesis.templates.builtin_templates import get_all_builtin_templates
+
+
+@dataclass(frozen=True)
+class TemplateSummary:
+    """What template listings show, without the template's files and commands."""
+
+    id: int
+    name: str
+    description: Optional[str]
+    project_type: str
+    is_builtin: bool
+    updated_at: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, template: Dict[str, Any]) -> "TemplateSummary":
+        return cls(
+            id=template["id"],
+            name=template["name"],
+            description=template.get("description"),
+            project_type=template["project_type"],
+            is_builtin=bool(template.get("is_builtin")),
+            updated_at=template.get("updated_at"),
+        )
+
+
+# Columns read for a summary; the JSON bodies stay deferred
+_SUMMARY_COLUMNS = (
+    ProjectTemplate.id,
+    ProjectTemplate.name,
+    ProjectTemplate.description,
+    ProjectTemplate.project_type,
+    ProjectTemplate.is_builtin,
+    ProjectTemplate.updated_at,
+)
+
+
+def _summary_from_row(template: ProjectTemplate) -> TemplateSummary:
+    return TemplateSummary(
+        id=template.id,
+        name=template.name,
+        description=template.description,
+        project_type=template.project_type,
+        is_builtin=bool(template.is_builtin),
+        updated_at=template.updated_at.isoformat() if template.updated_at else None,
+    )
+
+
+class _TemplateCatalog:
+    """Every template summary, indexed by id, name and project type."""
+
+    def __init__(self, summaries: List[TemplateSummary]):
+        self.by_id: Dict[int, TemplateSummary] = {}  # In database order
+        self.by_name: Dict[str, TemplateSummary] = {}
+        self.by_type: Dict[str, List[int]] = {}  # Sorted ids
+        for summary in summaries:
+            self.add(summary)
+
+    def add(self, summary: TemplateSummary) -> None:
+        if summary.id in self.by_id:  # Already read by a concurrent load
+            self.remove(summary.id)
+        self.by_id[summary.id] = summary
+        self.by_name[summary.name] = summary
+        insort(self.by_type.setdefault(summary.project_type, []), summary.id)
+
+    def remove(self, template_id: int) -> None:
+        summary = self.by_id.pop(template_id, None)
+        if summary is None:
+            return
+        self.by_name.pop(summary.name, None)
+        ids = self.by_type.get(summary.project_type, [])
+        if template_id in ids:
+            ids.remove(template_id)
+        if not ids:
+            self.by_type.pop(summary.project_type, None)
+
+    def replace(self, summary: TemplateSummary) -> None:
+        old = self.by_id.get(summary.id)
+        if old is not None:
+            self.by_name.pop(old.name, None)
+            if old.project_type != summary.project_type:
+                self.remove(summary.id)
+                self.add(summary)
+                return
+        self.by_id[summary.id] = summary  # Keeps its position in the listing
+        self.by_name[summary.name] = summary
+        if old is None:
+            insort(self.by_type.setdefault(summary.project_type, []), summary.id)
 
 
 class DatabaseService:
-    """Service for database operations"""
+    """Service for database operations
+
+    Template summaries are read from the database once, then served from an
+    in-memory catalog that the template write methods of this instance keep
+    up to date. Full templates are fetched by id when needed and kept in an
+    LRU cache large enough for the whole catalog (``body_cache_size`` at
+    least), so browsing the templates never evicts one. The returned
+    dictionaries are shallow copies: their nested lists are shared with the
+    cache and must not be modified.
+    """
 
-    def __init__(self):
+    def __init__(self, body_cache_size: int = TEMPLATE_BODY_CACHE_SIZE):
         init_database()
         self._ensure_builtin_templates()
+        self._catalog: Optional[_TemplateCatalog] = None
+        self._bodies: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._body_cache_size = body_cache_size
+        self._catalog_lock = threading.RLock()
+        self.catalog_hits = 0
+        self.catalog_misses = 0
+        self.body_hits = 0
+        self.body_misses = 0
 
     def _get_session(self) -> Session:
         """Get a database session"""
@@ -34,7 +142,9 @@ class DatabaseService:
             if existing_count > 0:
                 return
             
-            # Add built-in templates
+            # Add built-in templates; the catalog module is only loaded to seed them
+            from devgenesis.templates.builtin_templates import get_all_builtin_templates
+
             builtin_templates = get_all_builtin_templates()
             
             for template_data in builtin_templates:
@@ -54,8 +164,85 @@ class DatabaseService:
         finally:
             session.close()
 
+    def _get_catalog(self) -> _TemplateCatalog:
+        """Return the template catalog, reading it from the database on first use"""
+        with self._catalog_lock:
+            if self._catalog is not None:
+                self.catalog_hits += 1
+                return self._catalog
+            self.catalog_misses += 1
+            session = self._get_session()
+            try:
+                rows = session.query(ProjectTemplate).options(load_only(*_SUMMARY_COLUMNS)).all()
+                self._catalog = _TemplateCatalog([_summary_from_row(row) for row in rows])
+            finally:
+                session.close()
+            return self._catalog
+
+    def _get_bodies(self, template_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """Return the full templates for ``template_ids``, in order, reading missing ones at once"""
+        with self._catalog_lock:
+            template_ids = list(template_ids)
+            found: Dict[int, Dict[str, Any]] = {}
+            for template_id in template_ids:
+                body = self._bodies.get(template_id)
+                if body is not None:
+                    self._bodies.move_to_end(template_id)
+                    self.body_hits += 1
+                    found[template_id] = body
+            missing = [template_id for template_id in template_ids if template_id not in found]
+            if missing:
+                self.body_misses += len(missing)
+                session = self._get_session()
+                try:
+                    rows = session.query(ProjectTemplate).filter(ProjectTemplate.id.in_(missing))
+                    for row in rows.all():
+                        found[row.id] = self._remember_body(row.to_dict())
+                finally:
+                    session.close()
+            return [dict(found[i]) for i in template_ids if i in found]
+
+    def _max_bodies(self) -> int:
+        catalog_size = len(self._catalog.by_id) if self._catalog is not None else 0
+        return max(self._body_cache_size, catalog_size)
+
+    def _remember_body(self, template: Dict[str, Any]) -> Dict[str, Any]:
+        with self._catalog_lock:
+            self._bodies[template["id"]] = template
+            self._bodies.move_to_end(template["id"])
+            while len(self._bodies) > self._max_bodies():
+                self._bodies.popitem(last=False)
+        return template
+
+    def invalidate_catalog(self) -> None:
+        """Forget the cached templates, e.g. after another process changed the database"""
+        with self._catalog_lock:
+            self._catalog = None
+            self._bodies.clear()
+
+    def catalog_info(self) -> Dict[str, int]:
+        """Return hit/miss counters for the template catalog and the template body cache"""
+        with self._catalog_lock:
+            return {
+                "hits": self.catalog_hits,
+                "misses": self.catalog_misses,
+                "size": len(self._catalog.by_id) if self._catalog is not None else 0,
+                "body_hits": self.body_hits,
+                "body_misses": self.body_misses,
+                "bodies": len(self._bodies),
+                "max_bodies": self._max_bodies(),
+            }
+
+    def list_template_summaries(self, project_type: Optional[str] = None) -> List[TemplateSummary]:
+        """List templates without loading their files, optionally for one project type"""
+        with self._catalog_lock:
+            catalog = self._get_catalog()
+            if project_type is None:
+                return list(catalog.by_id.values())
+            return [catalog.by_id[i] for i in catalog.by_type.get(project_type, [])]
+
     def get_all_templates(self) -> List[Dict[str, Any]]:
-        """Get all templates from database"""
+        """Get all templates from database, with their files (prefer list_template_summaries)"""
         session = self._get_session()
         try:
             templates = session.query(ProjectTemplate).all()
@@ -65,30 +252,23 @@ class DatabaseService:
 
     def get_template_by_id(self, template_id: int) -> Optional[Dict[str, Any]]:
         """Get a template by ID"""
-        session = self._get_session()
-        try:
-            template = session.query(ProjectTemplate).filter_by(id=template_id).first()
-            return template.to_dict() if template else None
-        finally:
-            session.close()
+        with self._catalog_lock:
+            if template_id not in self._get_catalog().by_id:
+                return None
+            bodies = self._get_bodies([template_id])
+            return bodies[0] if bodies else None
 
     def get_template_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Get a template by name"""
-        session = self._get_session()
-        try:
-            template = session.query(ProjectTemplate).filter_by(name=name).first()
-            return template.to_dict() if template else None
-        finally:
-            session.close()
+        with self._catalog_lock:
+            summary = self._get_catalog().by_name.get(name)
+            return self.get_template_by_id(summary.id) if summary else None
 
     def get_templates_by_type(self, project_type: str) -> List[Dict[str, Any]]:
-        """Get templates by project type"""
-        session = self._get_session()
-        try:
-            templates = session.query(ProjectTemplate).filter_by(project_type=project_type).all()
-            return [template.to_dict() for template in templates]
-        finally:
-            session.close()
+        """Get templates by project type, filtered by the catalog and read from the body cache"""
+        with self._catalog_lock:
+            catalog = self._get_catalog()
+            return self._get_bodies(catalog.by_type.get(project_type, []))
 
     def create_template(
         self,
@@ -116,9 +296,14 @@ class DatabaseService:
             session.add(template)
             session.commit()
             session.refresh(template)
-            return template.to_dict()
+            created = template.to_dict()
         finally:
             session.close()
+        with self._catalog_lock:
+            if self._catalog is not None:
+                self._catalog.add(TemplateSummary.from_dict(created))
+            self._remember_body(created)
+        return dict(created)
 
     def update_template(
         self,
@@ -147,9 +332,14 @@ class DatabaseService:
             
             session.commit()
             session.refresh(template)
-            return template.to_dict()
+            updated = template.to_dict()
         finally:
             session.close()
+        with self._catalog_lock:
+            if self._catalog is not None:
+                self._catalog.replace(TemplateSummary.from_dict(updated))
+            self._remember_body(updated)
+        return dict(updated)
 
     def delete_template(self, template_id: int) -> bool:
         """Delete a template"""
@@ -166,9 +356,13 @@ class DatabaseService:
             
             session.delete(template)
             session.commit()
-            return True
         finally:
             session.close()
+        with self._catalog_lock:
+            if self._catalog is not None:
+                self._catalog.remove(template_id)
+            self._bodies.pop(template_id, None)
+        return True
 
     def add_project_history(
         self,
@@ -1,5 +1,7 @@
 """Project generator engine for DevGenesis."""
 
+import dataclasses
+import functools
 import json
 import os
 import re
@@ -7,45 +9,142 @@ import shlex
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
-
-from jinja2 import Template
-from rich.console import Console
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
 
+from devgenesis.config import STREAM_RENDER_THRESHOLD
 from devgenesis.logger import get_logger
-from devgenesis.models import FileTemplate, ProjectConfig, TechnologyConfig
+from devgenesis.models import CommandTemplate, FileTemplate, ProjectConfig, TechnologyConfig
+from devgenesis.plan import GenerationPlan, PlannedFile, normalize_relative_path
+from devgenesis.services.blobs import get_blob_store
+from devgenesis.services.dependency_cache import (
+    DependencyInstall,
+    detect_install,
+    get_dependency_cache,
+    venv_python_version,
+)
+from devgenesis.services.filesystem import (
+    copy_file,
+    defer_delete,
+    make_directory,
+    open_directory,
+    replace_directory,
+    write_bytes,
+    write_text_chunks,
+)
+from devgenesis.services.git_repository import (
+    FileSource,
+    GitSettings,
+    commit_files,
+    init_repository,
+    read_git_settings,
+)
+from devgenesis.services.manifest import (
+    MANIFEST_ALGORITHM,
+    SUMMARY_FILE,
+    hash_bytes,
+    hash_chunks,
+    hash_file,
+    manifest_entry,
+)
+from devgenesis.services.process import IdleTimeoutExpired, run_streaming, terminate
+from devgenesis.services.snapshots import get_snapshot_cache, snapshot_key
+from devgenesis.services.stages import Stage, run_stages
+from devgenesis.services.template_engine import PreparedText, get_template_engine, render_source
+from devgenesis.services.venv_pool import get_venv_pool, relocate_venv
+from devgenesis.services.wheelhouse import (
+    get_wheelhouse,
+    interpreter_version,
+    is_pip_install,
+    requirements_file,
+)
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+class CommandCancelled(Exception):
+    """A template command stopped because a sibling command failed"""
+
+
+@dataclasses.dataclass
+class UpdateReport:
+    """Outcome of re-applying a template to an existing project"""
+
+    created: List[str] = dataclasses.field(default_factory=list)
+    updated: List[str] = dataclasses.field(default_factory=list)
+    removed: List[str] = dataclasses.field(default_factory=list)
+    unchanged: List[str] = dataclasses.field(default_factory=list)
+    conflicts: List[Tuple[str, str]] = dataclasses.field(default_factory=list)
+
+    def describe(self) -> str:
+        return (
+            f"{len(self.created)} créé(s), {len(self.updated)} mis à jour, "
+            f"{len(self.removed)} supprimé(s), {len(self.unchanged)} inchangé(s), "
+            f"{len(self.conflicts)} conflit(s)"
+        )
 
 
 class ProjectGenerator:
     """Main project generator class"""
 
-    def __init__(self, config: ProjectConfig, progress_callback: Optional[Callable] = None):
+    def __init__(
+        self,
+        config: ProjectConfig,
+        progress_callback: Optional[Callable] = None,
+        plan: Optional[GenerationPlan] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ):
         self.config = config
         self.destination_path = Path(config.path)
         self.progress_callback = progress_callback
-        self.console = Console()
         self.logger = get_logger("generator")
         self._workspace_holder: Optional[Path] = None
         self._workspace_root: Optional[Path] = None
+        self._prepared_structure: Optional[List[PreparedText]] = None
+        self._prepared_files: Optional[List[Tuple[PreparedText, Optional[PreparedText]]]] = None
+        self._plan = plan
+        self._context = context  # Fixed rendering variables, e.g. replayed by update()
+        self.file_timings: Dict[str, float] = {}  # Seconds spent writing each file
+        self.stage_timings: Dict[str, float] = {}  # Seconds spent in each post-generation stage
+        self._git_ready = False
+        self._git_settings: Optional[GitSettings] = None  # Set when written in-process
+        self._written: Dict[str, os.stat_result] = {}  # Planned files as written, before commands
+        self._commands_cancelled = threading.Event()
+        self._processes: Set[subprocess.Popen] = set()  # Template commands currently running
+        self._processes_lock = threading.Lock()
+
+    @functools.cached_property
+    def console(self) -> "Console":
+        """Terminal output; rich is only imported once something is logged"""
+        from rich.console import Console
+
+        return Console()
 
     def _log(self, message: str, level: str = "info") -> None:
         """Log a message"""
         if self.progress_callback:
             self.progress_callback(message, level)
 
+        from rich.markup import escape
+
+        # Command output and paths may contain brackets that rich would parse as tags
+        text = escape(message)
         if level == "error":
-            self.console.print(f"[red]❌ {message}[/red]")
+            self.console.print(f"[red]❌ {text}[/red]")
             self.logger.error(message)
         elif level == "success":
-            self.console.print(f"[green]✓ {message}[/green]")
+            self.console.print(f"[green]✓ {text}[/green]")
             self.logger.info(message)
         elif level == "warning":
-            self.console.print(f"[yellow]⚠ {message}[/yellow]")
+            self.console.print(f"[yellow]⚠ {text}[/yellow]")
             self.logger.warning(message)
         else:
-            self.console.print(f"[blue]ℹ {message}[/blue]")
+            self.console.print(f"[blue]ℹ {text}[/blue]")
             self.logger.info(message)
 
     @property
@@ -65,25 +164,29 @@ class ProjectGenerator:
         self._workspace_root.mkdir(parents=True, exist_ok=True)
 
     def _finalize_workspace(self) -> None:
-        """Move the generated project into its final destination."""
-        if not self._workspace_root:
-            return
-
-        if self.destination_path.exists():
-            shutil.rmtree(self.destination_path)
+        """Swap the generated project into its final destination.
 
-        shutil.move(str(self._workspace_root), str(self.destination_path))
+        The workspace sits next to the destination, so this is a rename; a
+        previous destination is moved into the workspace holder, which is
+        deleted in the background.
+        """
+        if not self._workspace_root or not self._workspace_holder:
+            return
 
-        if self._workspace_holder and self._workspace_holder.exists():
-            shutil.rmtree(self._workspace_holder, ignore_errors=True)
+        replace_directory(
+            self._workspace_root,
+            self.destination_path,
+            self._workspace_holder / f"{self.destination_path.name}.previous",
+        )
+        defer_delete(self._workspace_holder)
 
         self._workspace_root = None
         self._workspace_holder = None
 
     def _rollback_workspace(self) -> None:
-        """Clean up a temporary workspace after a failure."""
+        """Discard a temporary workspace after a failure, in the background."""
         if self._workspace_holder and self._workspace_holder.exists():
-            shutil.rmtree(self._workspace_holder, ignore_errors=True)
+            defer_delete(self._workspace_holder)
         self._workspace_root = None
         self._workspace_holder = None
 
@@ -94,99 +197,372 @@ class ProjectGenerator:
         return text.lower()
 
     def _render_template(self, content: str, context: Dict[str, Any]) -> str:
-        """Render a Jinja2 template"""
-        template = Template(content)
-        return template.render(**context)
+        """Render a Jinja2 template through the shared compiled-template cache"""
+        return get_template_engine().render(content, context)
 
-    def _create_directory_structure(self) -> None:
-        """Create the project directory structure"""
-        self._log(f"Création de la structure du projet dans {self.project_path}")
-        
-        # Create main project directory
-        self.project_path.mkdir(parents=True, exist_ok=True)
-        
-        # Create subdirectories
-        context = {
+    def _prepare_sources(self) -> None:
+        """Classify structure entries, file paths and bodies once as literal or templated."""
+        if self._prepared_structure is not None:
+            return
+
+        engine = get_template_engine()
+        self._prepared_structure = [
+            engine.prepare(directory) for directory in self.config.structure
+        ]
+        self._prepared_files = [
+            (
+                engine.prepare(file_template.path),
+                engine.prepare(file_template.content)
+                if file_template.is_template and file_template.asset is None
+                else None,
+            )
+            for file_template in self.config.files
+        ]
+
+    def _structure_context(self) -> Dict[str, Any]:
+        """Variables available to directory names"""
+        return {
             "project_name": self.config.name,
             "project_name_snake": self._to_snake_case(self.config.name),
         }
-        
-        for directory in self.config.structure:
-            # Render directory name with template variables
-            dir_name = self._render_template(directory, context)
-            dir_path = self.project_path / dir_name
-            dir_path.mkdir(parents=True, exist_ok=True)
-            self._log(f"Créé: {dir_path.relative_to(self.project_path)}", "success")
 
-    def _create_files(self) -> None:
-        """Create project files from templates"""
-        self._log("Génération des fichiers du projet")
-        
-        context = {
+    def _template_context(self) -> Dict[str, Any]:
+        """Variables available to file paths and file contents"""
+        if self._context is not None:
+            return dict(self._context)
+        return {
             "project_name": self.config.name,
             "project_name_snake": self._to_snake_case(self.config.name),
             "description": self.config.description or "",
             "author": os.environ.get("USER", "DevGenesis User"),
             "year": datetime.now().year,
         }
-        
-        for file_template in self.config.files:
-            # Render file path with template variables
-            file_path_str = self._render_template(file_template.path, context)
-            file_path = self.project_path / file_path_str
-            
-            # Ensure parent directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Render file content
-            if file_template.is_template:
-                content = self._render_template(file_template.content, context)
+
+    @staticmethod
+    def _encode_content(content: str) -> bytes:
+        """Encode a file body exactly as a text-mode write would"""
+        if os.linesep != "\n":
+            content = content.replace("\n", os.linesep)
+        return content.encode("utf-8")
+
+    def build_plan(self) -> GenerationPlan:
+        """Render the template once into an immutable generation plan."""
+        if self._plan is not None:
+            return self._plan
+
+        self._prepare_sources()
+        structure_context = self._structure_context()
+        context = self._template_context()
+
+        directories = tuple(
+            normalize_relative_path(directory.render(structure_context))
+            for directory in self._prepared_structure
+        )
+
+        bodies = self._render_bodies(context)
+        files: List[PlannedFile] = []
+        for file_template, (path, body), content in zip(
+            self.config.files, self._prepared_files, bodies
+        ):
+            file_path = normalize_relative_path(path.render(context))
+            if file_template.asset is not None:
+                files.append(self._plan_asset(file_path, file_template))
+                continue
+            if content is None:
+                # Deferred: rendered chunk by chunk straight into the file
+                files.append(PlannedFile(file_path, b"", True, source=body.source))
+                continue
+            files.append(
+                PlannedFile(
+                    path=file_path,
+                    content=self._encode_content(content),
+                    is_template=file_template.is_template,
+                )
+            )
+
+        commands = tuple(self.config.commands) if self.config.run_commands else ()
+
+        self._plan = GenerationPlan(
+            config=self.config,
+            context=context,
+            directories=directories,
+            files=tuple(files),
+            commands=commands,
+        )
+        return self._plan
+
+    @staticmethod
+    def _plan_asset(file_path: str, file_template: FileTemplate) -> PlannedFile:
+        """Reference a binary blob without reading it"""
+        store = get_blob_store()
+        if not store.exists(file_template.asset):
+            raise ValueError(f"Ressource binaire introuvable pour {file_path}")
+        size = file_template.size
+        if size is None:
+            size = store.size(file_template.asset)
+        return PlannedFile(file_path, b"", asset=file_template.asset, size=size)
+
+    def _should_stream(self, body: PreparedText) -> bool:
+        """Whether a templated body is rendered to disk instead of into memory"""
+        if body.is_literal:
+            return False
+        return self.config.stream_render or len(body.source) >= STREAM_RENDER_THRESHOLD
+
+    def _render_bodies(self, context: Dict[str, Any]) -> List[Optional[str]]:
+        """Render every file body, optionally spreading Jinja work over processes.
+
+        Bodies that will be streamed at write time are returned as None.
+        """
+        bodies: List[Optional[str]] = []
+        pending: Dict[int, str] = {}
+        for index, (file_template, (_, body)) in enumerate(
+            zip(self.config.files, self._prepared_files)
+        ):
+            if file_template.asset is not None:
+                bodies.append(None)
+            elif body is None:
+                bodies.append(file_template.content)
+            elif self._should_stream(body):
+                bodies.append(None)
+            elif body.is_literal or not self.config.render_in_processes:
+                bodies.append(body.render(context))
             else:
-                content = file_template.content
-            
-            # Write file
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
-            
-            self._log(f"Créé: {file_path.relative_to(self.project_path)}", "success")
+                bodies.append(None)
+                pending[index] = body.source
+
+        if len(pending) == 1:
+            index, source = pending.popitem()
+            bodies[index] = render_source(source, context)
+        elif pending:
+            workers = min(self.config.write_workers, len(pending), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                indexes = list(pending)
+                rendered = executor.map(
+                    render_source, [pending[i] for i in indexes], [context] * len(indexes)
+                )
+                for index, content in zip(indexes, rendered):
+                    bodies[index] = content
 
-    def _initialize_git(self) -> None:
-        """Initialize Git repository"""
+        return bodies
+
+    def _create_directory_structure(self) -> None:
+        """Create the project directory structure.
+
+        The plan already merged structure entries and file parents into a
+        deduplicated, parent-first list, so each directory is created once.
+        """
+        self._log(f"Création de la structure du projet dans {self.project_path}")
+        
+        # Create main project directory
+        self.project_path.mkdir(parents=True, exist_ok=True)
+        
+        # Create subdirectories
+        plan = self.build_plan()
+        with open_directory(self.project_path) as dir_fd:
+            for relative in plan.mkdirs:
+                make_directory(self.project_path, relative, dir_fd)
+
+        for dir_name in plan.directories:
+            self._log(f"Créé: {Path(dir_name)}", "success")
+
+    def _materialise(
+        self, planned: PlannedFile, relative: str, dir_fd: Optional[int] = None
+    ) -> None:
+        """Write the body of ``planned`` to ``relative`` under the project root"""
+        if planned.asset is not None:
+            copy_file(get_blob_store().path_for(planned.asset), self.project_path, relative, dir_fd)
+        elif planned.source is not None:
+            chunks = get_template_engine().generate(planned.source, self.build_plan().context)
+            write_text_chunks(self.project_path, relative, chunks, dir_fd)
+        else:
+            write_bytes(self.project_path, relative, planned.content, dir_fd)
+
+    def _write_file(self, planned: PlannedFile, dir_fd: Optional[int] = None) -> float:
+        """Write one planned file and return the elapsed time in seconds"""
+        start = time.perf_counter()
+        self._materialise(planned, planned.path, dir_fd)
+        return time.perf_counter() - start
+
+    def _create_files(self) -> None:
+        """Create project files from the generation plan.
+
+        Writes run on a bounded thread pool; results are consumed in plan order
+        so the log stays deterministic whatever the completion order.
+        """
+        self._log("Génération des fichiers du projet")
+
+        files = self.build_plan().files
+        # When a path is planned twice the last entry wins, as with sequential writes
+        last_index = {planned.path: index for index, planned in enumerate(files)}
+        workers = max(1, min(self.config.write_workers, len(files)))
+        started = time.perf_counter()
+
+        with open_directory(self.project_path) as dir_fd, ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="devgenesis-write"
+        ) as executor:
+            futures: List[Optional[Future]] = [
+                executor.submit(self._write_file, planned, dir_fd)
+                if last_index[planned.path] == index
+                else None
+                for index, planned in enumerate(files)
+            ]
+            try:
+                for planned, future in zip(files, futures):
+                    elapsed = future.result() if future is not None else 0.0
+                    self.file_timings[planned.path] = elapsed
+                    self.logger.info("Écriture de %s: %.2f ms", planned.path, elapsed * 1000)
+                    self._log(f"Créé: {Path(planned.path)}", "success")
+            except BaseException:
+                for future in futures:
+                    if future is not None:
+                        future.cancel()
+                raise
+
+        total_ms = (time.perf_counter() - started) * 1000
+        self._log(f"{len(files)} fichiers écrits en {total_ms:.0f} ms ({workers} threads)")
+
+    def _snapshot_key(self) -> str:
+        return snapshot_key(self.build_plan())
+
+    def _lookup_snapshot(self) -> Optional[str]:
+        """Return the snapshot key when a cached tree exists for the rendered plan"""
+        if not self.config.snapshot_cache:
+            return None
+
+        key = self._snapshot_key()
+        return key if get_snapshot_cache().contains(key) else None
+
+    def _restore_snapshot(self, key: str) -> None:
+        """Materialise the cached tree in the workspace"""
+        started = time.perf_counter()
+        self.project_path.mkdir(parents=True, exist_ok=True)
+        count = get_snapshot_cache().materialise(key, self.project_path)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._log(
+            f"Arborescence restaurée depuis le cache: {count} fichiers en {elapsed_ms:.0f} ms",
+            "success",
+        )
+
+    def _store_snapshot(self) -> None:
+        """Keep a copy of the freshly rendered tree for identical future generations"""
+        if not self.config.snapshot_cache:
+            return
+        try:
+            get_snapshot_cache().store(self._snapshot_key(), self.project_path, self.build_plan())
+        except OSError as exc:
+            self._log(f"Impossible de mettre l'arborescence en cache: {exc}", "warning")
+
+    def _git(self, *args: str, input: Optional[str] = None) -> subprocess.CompletedProcess:
+        """Run a git command in the project, raising on failure"""
+        return subprocess.run(
+            ["git", "--literal-pathspecs", *args],
+            cwd=self.project_path,
+            input=input,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+
+    def _use_native_git(self) -> bool:
+        """Whether the repository can be written without git.
+
+        ``.gitattributes`` may ask for filters or line-ending conversion,
+        which only git itself applies.
+        """
+        return self.config.native_git and not any(
+            path.rsplit("/", 1)[-1] == ".gitattributes" for path in self._unique_planned_files()
+        )
+
+    def _init_git_repository(self) -> None:
+        """Create an empty Git repository"""
+        self._git_ready = False
+        self._git_settings = None
         if not self.config.git_init:
             return
-        
+
         self._log("Initialisation du dépôt Git")
-        
+
         try:
-            subprocess.run(
-                ["git", "init"],
-                cwd=self.project_path,
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+            if self._use_native_git():
+                init_repository(self.project_path)
+                self._git_settings = read_git_settings(self.project_path)
+            else:
+                self._git("init")
+            self._git_ready = True
+        except subprocess.CalledProcessError as e:
+            self._log(f"Erreur lors de l'initialisation Git: {e.stderr or e}", "warning")
+        except FileNotFoundError:
+            self._log("Git n'est pas installé sur ce système", "warning")
+        except OSError as e:
+            self._log(f"Erreur lors de l'initialisation Git: {e}", "warning")
 
-            subprocess.run(
-                ["git", "add", "."],
+    def _record_written_files(self) -> None:
+        """Keep the stat data of the planned files before any command can rewrite them"""
+        self._written = {
+            path: os.stat(self.project_path / path) for path in self._unique_planned_files()
+        }
+
+    def _commit_git_native(self) -> None:
+        """Commit the planned bodies, reading from disk only those not held in memory.
+
+        The index records the files as they were written, so a command that
+        rewrote one of them shows up as a local modification.
+        """
+        files: Dict[str, FileSource] = {}
+        for path, planned in self._unique_planned_files().items():
+            in_memory = planned.asset is None and planned.source is None
+            files[path] = planned.content if in_memory else self.project_path / path
+        files[SUMMARY_FILE] = self.project_path / SUMMARY_FILE
+        commit_files(
+            self.project_path,
+            files,
+            "Initial commit from DevGenesis",
+            self._git_settings,
+            stats=self._written,
+        )
+
+    def _commit_git(self) -> None:
+        """Commit the generated files and the summary.
+
+        Paths are listed explicitly rather than ``git add .`` so that the venv
+        and whatever the dependency commands installed stay out of the commit.
+        """
+        if not self._git_ready:
+            return
+
+        if self._git_settings is not None:
+            try:
+                self._commit_git_native()
+                self._log("Dépôt Git initialisé", "success")
+            except OSError as e:
+                self._log(f"Erreur lors de l'initialisation Git: {e}", "warning")
+            return
+
+        paths = [*self._unique_planned_files(), SUMMARY_FILE]
+        try:
+            # Listing an ignored path makes ``git add`` fail, ``git add .`` skipped them
+            ignored = subprocess.run(
+                ["git", "check-ignore", "--stdin", "-z"],
                 cwd=self.project_path,
-                check=True,
+                input="\0".join(paths),
                 capture_output=True,
                 text=True,
             )
+            if ignored.returncode not in (0, 1):
+                raise subprocess.CalledProcessError(
+                    ignored.returncode, ignored.args, ignored.stdout, ignored.stderr
+                )
+            excluded = set(ignored.stdout.split("\0"))
+            tracked = [path for path in paths if path not in excluded]
 
-            subprocess.run(
-                ["git", "commit", "-m", "Initial commit from DevGenesis"],
-                cwd=self.project_path,
-                check=True,
-                capture_output=True,
-                text=True,
+            self._git(
+                "add", "--pathspec-from-file=-", "--pathspec-file-nul", input="\0".join(tracked)
             )
+            self._git("commit", "-m", "Initial commit from DevGenesis")
 
             self._log("Dépôt Git initialisé", "success")
         except subprocess.CalledProcessError as e:
             self._log(f"Erreur lors de l'initialisation Git: {e.stderr or e}", "warning")
-        except FileNotFoundError:
-            self._log("Git n'est pas installé sur ce système", "warning")
 
     def _create_virtual_environment(self) -> None:
         """Create Python virtual environment"""
@@ -204,6 +580,10 @@ class ProjectGenerator:
         self._log("Création de l'environnement virtuel Python")
         
         venv_path = self.project_path / "venv"
+        pool = get_venv_pool() if self.config.venv_pool else None
+        if pool is not None and pool.acquire(venv_path):
+            self._log("Environnement virtuel créé (depuis le pool)", "success")
+            return
         
         try:
             subprocess.run(
@@ -216,59 +596,270 @@ class ProjectGenerator:
         except subprocess.CalledProcessError as e:
             self._log(f"Erreur lors de la création du venv: {e}", "warning")
 
-    def _run_commands(self) -> None:
-        """Run post-generation commands"""
-        if not self.config.commands or not self.config.run_commands:
-            return
+    def _relocate_virtual_environment(self) -> None:
+        """Point the venv at the final destination before the workspace is moved there"""
+        venv_path = self.project_path / "venv"
+        if self._workspace_root is not None and venv_path.is_dir():
+            relocate_venv(venv_path, self._workspace_root, self.destination_path)
 
-        self._log("Exécution des commandes d'installation")
+    def _resolve_command(self, command: str) -> str:
+        """Point a leading ``pip``/``python`` at the project venv when there is one"""
+        venv_path = self.project_path / "venv"
+        if not venv_path.exists() or not command.startswith(("pip ", "python ")):
+            return command
+
+        if os.name == "nt":
+            python_exe = venv_path / "Scripts" / "python.exe"
+            pip_exe = venv_path / "Scripts" / "pip.exe"
+        else:
+            python_exe = venv_path / "bin" / "python"
+            pip_exe = venv_path / "bin" / "pip"
+
+        if command.startswith("pip "):
+            return command.replace("pip", str(pip_exe), 1)
+        return command.replace("python", str(python_exe), 1)
+
+    def _cacheable_install(self, args: List[str], cwd: Path) -> Optional[DependencyInstall]:
+        """Describe an npm/pip install whose result the dependency cache can replay"""
+        if not self.config.dependency_cache or get_dependency_cache() is None:
+            return None
+        venv_path = self.project_path / "venv"
+        try:
+            return detect_install(args, cwd, venv_path if venv_path.is_dir() else None)
+        except (OSError, UnicodeDecodeError):
+            return None
 
-        for command in self.config.commands:
-            self._log(f"Exécution: {command}")
+    def _restore_dependencies(self, install: DependencyInstall) -> bool:
+        """Replay a cached install; on any problem the command simply runs"""
+        try:
+            return get_dependency_cache().restore(install)
+        except OSError as e:
+            self._log(f"Cache de dépendances inutilisable, installation normale: {e}", "warning")
+            return False
 
+    @property
+    def _offline(self) -> bool:
+        return self.config.offline or os.environ.get("DEVGENESIS_OFFLINE") == "1"
+
+    def _use_wheelhouse(
+        self, args: List[str], cwd: Path, prefix: str
+    ) -> Tuple[List[str], Optional[str]]:
+        """Send pip to the local wheelhouse when it has everything, or always offline.
+
+        Returns the command to run and, for an online ``pip install -r``, the
+        requirements to collect into the wheelhouse once it succeeded.
+        """
+        if not is_pip_install(args):
+            return args, None
+
+        requirements: Optional[str] = None
+        name = requirements_file(args)
+        if name is not None:
             try:
-                venv_path = self.project_path / "venv"
-
-                resolved_command = command
-                if venv_path.exists() and command.startswith(("pip ", "python ")):
-                    if os.name == "nt":
-                        python_exe = venv_path / "Scripts" / "python.exe"
-                        pip_exe = venv_path / "Scripts" / "pip.exe"
-                    else:
-                        python_exe = venv_path / "bin" / "python"
-                        pip_exe = venv_path / "bin" / "pip"
-
-                    if command.startswith("pip "):
-                        resolved_command = command.replace("pip", str(pip_exe), 1)
-                    elif command.startswith("python "):
-                        resolved_command = command.replace("python", str(python_exe), 1)
-
-                result = subprocess.run(
-                    shlex.split(resolved_command),
-                    cwd=self.project_path,
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=300,
+                requirements = (cwd / name).read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError):
+                requirements = None
+
+        wheelhouse = get_wheelhouse()
+        version = venv_python_version(self.project_path / "venv") or interpreter_version("python")
+        if self._offline or (
+            requirements is not None and version and wheelhouse.satisfies(requirements, version)
+        ):
+            self._log(f"{prefix}Installation depuis le wheelhouse local ({wheelhouse.root})")
+            return wheelhouse.install_args(args), None
+        return args, requirements
+
+    def _track_process(self, process: subprocess.Popen) -> None:
+        """Register a started command so a failing sibling can stop it"""
+        with self._processes_lock:
+            self._processes.add(process)
+            if self._commands_cancelled.is_set():
+                terminate(process)
+
+    def _cancel_commands(self) -> None:
+        """Stop every running command and keep the pending ones from starting"""
+        self._commands_cancelled.set()
+        with self._processes_lock:
+            for process in self._processes:
+                terminate(process)
+
+    def _run_command(self, command: CommandTemplate, label: Optional[str]) -> None:
+        """Run one template command; a failure cancels the sibling commands"""
+        if self._commands_cancelled.is_set():
+            raise CommandCancelled(command.run)
+
+        prefix = f"[{label}] " if label else ""
+
+        try:
+            self._log(f"{prefix}Exécution: {command.run}")
+            cwd = self.project_path
+            if command.cwd:
+                cwd = cwd / normalize_relative_path(command.cwd)
+
+            args = shlex.split(self._resolve_command(command.run))
+            install = self._cacheable_install(args, cwd)
+            if install is not None and self._restore_dependencies(install):
+                self._log(
+                    f"{prefix}Dépendances restaurées depuis le cache: {command.run}", "success"
                 )
+                return
 
-                for line in result.stdout.splitlines():
-                    if line.strip():
-                        self._log(line.strip(), "info")
+            args, collect = self._use_wheelhouse(args, cwd, prefix)
 
-                self._log(f"Commande réussie: {command}", "success")
+            def forward(stream: str, line: str) -> None:
+                if line.strip():
+                    self._log(f"{prefix}{line.strip()}", "info")
 
-            except subprocess.CalledProcessError as exc:
-                stderr = exc.stderr.strip() if exc.stderr else str(exc)
-                if stderr:
-                    self._log(stderr, "error")
-                return
+            process: Optional[subprocess.Popen] = None
+
+            def track(started: subprocess.Popen) -> None:
+                nonlocal process
+                process = started
+                self._track_process(started)
+
+            try:
+                result = run_streaming(
+                    args,
+                    forward,
+                    cwd=cwd,
+                    on_start=track,
+                )
+            except IdleTimeoutExpired as e:
+                self._log(
+                    f"{prefix}Aucune sortie depuis {e.timeout:.0f} s, "
+                    f"commande arrêtée: {command.run}",
+                    "error",
+                )
+                raise
             except subprocess.TimeoutExpired:
-                self._log(f"Timeout pour la commande: {command}", "error")
-                return
-            except Exception as e:
-                self._log(f"Erreur lors de l'exécution: {e}", "error")
-                return
+                self._log(f"{prefix}Timeout pour la commande: {command.run}", "error")
+                raise
+            finally:
+                if process is not None:
+                    with self._processes_lock:
+                        self._processes.discard(process)
+
+            if result.returncode != 0 and self._commands_cancelled.is_set():
+                raise CommandCancelled(command.run)
+
+            if result.returncode != 0:
+                details = "\n".join(result.stderr_tail or result.tail).strip()
+                message = details or f"Échec de la commande (code {result.returncode})"
+                self._log(f"{prefix}{message}", "error")
+                raise subprocess.CalledProcessError(
+                    result.returncode, command.run, "\n".join(result.tail), details
+                )
+
+            self._log(f"{prefix}Commande réussie: {command.run}", "success")
+            if install is not None and get_dependency_cache().store(install):
+                self._log(f"{prefix}Dépendances mises en cache pour les prochaines générations")
+            if collect is not None:
+                get_wheelhouse().collect_async(collect)
+
+        except CommandCancelled:
+            raise
+        except subprocess.SubprocessError:
+            self._cancel_commands()
+            raise
+        except Exception as e:
+            self._log(f"{prefix}Erreur lors de l'exécution: {e}", "error")
+            self._cancel_commands()
+            raise
+
+    def _command_stages(self) -> List[Stage]:
+        """Schedule the template commands; plain strings keep running one after another"""
+        commands = self.build_plan().commands
+        # Output only needs a prefix when commands can interleave
+        labelled = any(isinstance(command, CommandTemplate) for command in commands)
+
+        stages: List[Stage] = []
+        previous: Optional[str] = None
+        for index, command in enumerate(commands, start=1):
+            if isinstance(command, str):
+                spec = CommandTemplate(run=command)
+                key = f"#{index}"
+                depends_on: Tuple[str, ...] = (previous,) if previous else ()
+                previous = key
+            else:
+                spec = command
+                key = command.name or f"#{index}"
+                depends_on = tuple(command.depends_on)
+
+            label = (spec.name or spec.run.split(maxsplit=1)[0]) if labelled else None
+            stages.append(Stage(key, functools.partial(self._run_command, spec, label), depends_on))
+        return stages
+
+    def _run_commands(self) -> None:
+        """Run post-generation commands"""
+        stages = self._command_stages()
+        if not stages:
+            return
+
+        self._log("Exécution des commandes d'installation")
+        self._commands_cancelled.clear()
+
+        try:
+            report = run_stages(stages, max_workers=self.config.command_concurrency)
+        except ValueError as e:
+            self._log(f"Commandes du template invalides: {e}", "error")
+            return
+
+        cancelled = len(report.skipped) + sum(
+            isinstance(error, CommandCancelled) for error in report.failed.values()
+        )
+        if cancelled:
+            self._log(f"{cancelled} commande(s) annulée(s) après un échec", "warning")
+
+    def _post_generation_stages(self) -> List[Stage]:
+        """Post-generation steps and what each of them has to wait for"""
+        return [
+            Stage("git_init", self._init_git_repository),
+            Stage("venv", self._create_virtual_environment),
+            Stage("commands", self._run_commands, depends_on=("venv",)),
+            # The manifest only needs the plan; the commit waits for everything else
+            Stage("summary", self._create_summary_file),
+            Stage("git_commit", self._commit_git, depends_on=("git_init", "summary", "commands")),
+        ]
+
+    def _run_post_generation_stages(self) -> None:
+        """Run independent post-generation steps concurrently"""
+        stages = self._post_generation_stages()
+        start = time.perf_counter()
+        report = run_stages(stages)
+        elapsed = time.perf_counter() - start
+
+        self.stage_timings = report.timings
+        timings = ", ".join(
+            f"{name} {seconds * 1000:.0f} ms" for name, seconds in report.timings.items()
+        )
+        self._log(f"Étapes terminées en {elapsed * 1000:.0f} ms ({timings})")
+
+        for stage in stages:
+            if stage.name in report.failed:
+                raise report.failed[stage.name]
+
+    def _planned_hash(self, planned: PlannedFile, algorithm: str = MANIFEST_ALGORITHM) -> str:
+        """Manifest hash of a planned body, computed without touching the project"""
+        if planned.asset is not None:
+            return hash_file(get_blob_store().path_for(planned.asset), algorithm)
+        if planned.source is not None:
+            chunks = get_template_engine().generate(planned.source, self.build_plan().context)
+            return hash_chunks((self._encode_content(chunk) for chunk in chunks), algorithm)
+        return hash_bytes(planned.content, algorithm)
+
+    def _unique_planned_files(self) -> Dict[str, PlannedFile]:
+        """Planned files by path; when a path is planned twice the last entry wins"""
+        return {planned.path: planned for planned in self.build_plan().files}
+
+    def _build_manifest(self) -> Dict[str, Any]:
+        """Describe every generated file by its size, mtime and content hash"""
+        files = []
+        for path, planned in self._unique_planned_files().items():
+            # Hashed from the plan, like the commit, and stamped as written: the commands
+            # run meanwhile, and whatever they rewrite is reported by verify
+            digest = self._planned_hash(planned)
+            files.append(manifest_entry(self.project_path, path, digest, self._written.get(path)))
+        return {"algorithm": MANIFEST_ALGORITHM, "files": files}
 
     def _create_summary_file(self) -> None:
         """Create a project summary file"""
@@ -282,14 +873,136 @@ class ProjectGenerator:
             ],
             "created_at": datetime.now().isoformat(),
             "generator": "DevGenesis v1.0.0",
+            "context": self.build_plan().context,
+            "manifest": self._build_manifest(),
         }
         
-        summary_path = self.project_path / ".devgenesis.json"
+        summary_path = self.project_path / SUMMARY_FILE
         with open(summary_path, "w", encoding="utf-8") as f:
             json.dump(summary, f, indent=2, ensure_ascii=False)
         
         self._log("Fichier de résumé créé", "success")
 
+    def _replace_file(self, planned: PlannedFile) -> None:
+        """Atomically replace one file of an existing project"""
+        target = Path(planned.path)
+        temporary = str(target.with_name(f".{target.name}.devgenesis-tmp"))
+        try:
+            self._materialise(planned, temporary)
+            os.replace(self.project_path / temporary, self.project_path / target)
+        except BaseException:
+            (self.project_path / temporary).unlink(missing_ok=True)
+            raise
+
+    def update(self) -> Optional[UpdateReport]:
+        """Re-apply the template to an existing project.
+
+        Only files whose rendered output changed since the last generation are
+        rewritten, and only if the user has not modified them; anything else
+        is reported as a conflict and left untouched.
+        """
+        summary_path = self.destination_path / SUMMARY_FILE
+        try:
+            with open(summary_path, "r", encoding="utf-8") as f:
+                summary = json.load(f)
+            entries = {entry["path"]: entry for entry in summary["manifest"]["files"]}
+            previous = {path: entry["hash"] for path, entry in entries.items()}
+            # Keep the recorded algorithm so old and new hashes stay comparable
+            algorithm = summary["manifest"].get("algorithm", "blake2b")
+        except (OSError, ValueError, KeyError, TypeError):
+            self._log(
+                f"Aucun manifeste exploitable dans {summary_path}: mise à jour impossible",
+                "error",
+            )
+            return None
+
+        try:
+            self._log(f"🔄 Mise à jour du projet: {self.config.name}")
+            if self._context is None and self._plan is None and summary.get("context"):
+                # Re-render with the original variables so only template changes show up
+                self._context = summary["context"]
+
+            report = UpdateReport()
+            plan = self.build_plan()
+            planned_files = self._unique_planned_files()
+            manifest_files: Dict[str, Dict[str, Any]] = {}
+
+            with open_directory(self.project_path) as dir_fd:
+                for relative in plan.mkdirs:
+                    make_directory(self.project_path, relative, dir_fd)
+
+            for path, planned in planned_files.items():
+                new_hash = self._planned_hash(planned, algorithm)
+                old_hash = previous.get(path)
+
+                if new_hash == old_hash:
+                    # Disk was not inspected: keep the recorded size/mtime for verify
+                    manifest_files[path] = entries[path]
+                    report.unchanged.append(path)
+                    continue
+
+                target = self.project_path / path
+                disk_hash = hash_file(target, algorithm) if target.is_file() else None
+
+                if disk_hash == new_hash:
+                    report.unchanged.append(path)
+                elif old_hash is None and disk_hash is None:
+                    self._replace_file(planned)
+                    report.created.append(path)
+                    self._log(f"Créé: {Path(path)}", "success")
+                elif old_hash is not None and disk_hash == old_hash:
+                    self._replace_file(planned)
+                    report.updated.append(path)
+                    self._log(f"Mis à jour: {Path(path)}", "success")
+                else:
+                    reason = "supprimé localement" if disk_hash is None else "modifié localement"
+                    report.conflicts.append((path, reason))
+                    self._log(f"Conflit ({reason}), fichier conservé: {Path(path)}", "warning")
+                    if old_hash is not None:
+                        manifest_files[path] = entries[path]
+                    continue
+
+                manifest_files[path] = manifest_entry(self.project_path, path, new_hash)
+
+            for path, old_hash in previous.items():
+                if path in planned_files:
+                    continue
+                target = self.project_path / path
+                if not target.is_file():
+                    continue
+                if hash_file(target, algorithm) == old_hash:
+                    target.unlink()
+                    report.removed.append(path)
+                    self._log(f"Supprimé (retiré du template): {Path(path)}", "success")
+                else:
+                    report.conflicts.append((path, "retiré du template mais modifié localement"))
+                    self._log(f"Conflit, fichier conservé: {Path(path)}", "warning")
+
+            manifest = {"algorithm": algorithm, "files": list(manifest_files.values())}
+            summary.update(
+                {
+                    "technologies": [
+                        {"name": tech.name, "version": tech.version}
+                        for tech in self.config.technologies
+                    ],
+                    "updated_at": datetime.now().isoformat(),
+                    "context": plan.context,
+                    "manifest": manifest,
+                }
+            )
+            temporary = summary_path.with_name(f".{SUMMARY_FILE}.devgenesis-tmp")
+            with open(temporary, "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=2, ensure_ascii=False)
+            os.replace(temporary, summary_path)
+
+            level = "warning" if report.conflicts else "success"
+            self._log(report.describe(), level)
+            return report
+
+        except Exception as e:
+            self._log(f"Erreur lors de la mise à jour: {e}", "error")
+            return None
+
     def generate(self) -> bool:
         """Generate the complete project"""
         try:
@@ -303,25 +1016,25 @@ class ProjectGenerator:
                 )
                 return False
 
+            snapshot_key = self._lookup_snapshot()
+            self.build_plan()
             self._prepare_workspace()
 
-            # Step 1: Create directory structure
-            self._create_directory_structure()
+            if snapshot_key is not None:
+                # Steps 1-2: Clone the cached rendered tree
+                self._restore_snapshot(snapshot_key)
+            else:
+                # Step 1: Create directory structure
+                self._create_directory_structure()
 
-            # Step 2: Create files
-            self._create_files()
-            
-            # Step 3: Initialize Git
-            self._initialize_git()
+                # Step 2: Create files
+                self._create_files()
+                self._store_snapshot()
+            self._record_written_files()
             
-            # Step 4: Create virtual environment
-            self._create_virtual_environment()
-
-            # Step 5: Run installation commands
-            self._run_commands()
-
-            # Step 6: Create summary file
-            self._create_summary_file()
+            # Steps 3-6: Git, venv, installation commands and summary file
+            self._run_post_generation_stages()
+            self._relocate_virtual_environment()
 
             self._log(
                 f"✅ Projet généré avec succès dans {self.destination_path}",
@@ -370,65 +1083,19 @@ class ProjectGenerator:
 
     def build_preview(self) -> Dict[str, Any]:
         """Return a dry-run preview of the generation plan."""
-        context = {
-            "project_name": self.config.name,
-            "project_name_snake": self._to_snake_case(self.config.name),
-            "description": self.config.description or "",
-            "author": os.environ.get("USER", "DevGenesis User"),
-            "year": datetime.now().year,
-        }
-
-        directories: List[str] = []
-        for directory in self.config.structure:
-            directories.append(self._render_template(directory, context))
-
-        files: List[Dict[str, Any]] = []
-        readme_preview: Optional[str] = None
-        gitignore_preview: Optional[str] = None
-        for file_template in self.config.files:
-            file_path = self._render_template(file_template.path, context)
-            content = (
-                self._render_template(file_template.content, context)
-                if file_template.is_template
-                else file_template.content
-            )
-            files.append({"path": file_path, "preview": content[:400]})
-            if file_path.lower().endswith("readme.md"):
-                readme_preview = content
-            if Path(file_path).name == ".gitignore":
-                gitignore_preview = content
-
-        commands: List[str] = []
-        if self.config.git_init:
-            commands.append("git init")
-        if self.config.create_venv:
-            commands.append("python -m venv venv")
-        if self.config.run_commands:
-            commands.extend(self.config.commands)
+        return self.build_plan().preview()
 
-        return {
-            "directories": directories,
-            "files": files,
-            "commands": commands,
-            "readme": readme_preview,
-            "gitignore": gitignore_preview,
-        }
 
-
-def generate_project_from_template(
+def config_from_template(
     template: Dict[str, Any],
     project_name: str,
     project_path: str,
     description: Optional[str] = None,
-    progress_callback: Optional[Callable] = None,
     git_init: bool = True,
     create_venv: bool = True,
     install_deps: bool = True,
-    dry_run: bool = False,
-) -> bool:
-    """Generate a project from a template dictionary"""
-    
-    # Convert template to ProjectConfig
+) -> ProjectConfig:
+    """Convert a template dictionary into a ProjectConfig"""
     technologies = [
         TechnologyConfig(
             name=tech["name"],
@@ -440,13 +1107,15 @@ def generate_project_from_template(
     files = [
         FileTemplate(
             path=file["path"],
-            content=file["content"],
+            content=file.get("content", ""),
             is_template=file.get("is_template", False),
+            asset=file.get("asset"),
+            size=file.get("size"),
         )
         for file in template["files"]
     ]
     
-    config = ProjectConfig(
+    return ProjectConfig(
         name=project_name,
         description=description or template["description"],
         project_type=template["project_type"],
@@ -460,8 +1129,55 @@ def generate_project_from_template(
         run_commands=install_deps,
     )
 
-    # Validate configuration
-    generator = ProjectGenerator(config, progress_callback)
+
+def generate_project_from_template(
+    template: Dict[str, Any],
+    project_name: str,
+    project_path: str,
+    description: Optional[str] = None,
+    progress_callback: Optional[Callable] = None,
+    git_init: bool = True,
+    create_venv: bool = True,
+    install_deps: bool = True,
+    dry_run: bool = False,
+    plan: Optional[GenerationPlan] = None,
+) -> bool:
+    """Generate a project from a template dictionary.
+
+    When ``plan`` comes from a previous preview of the same inputs, it is
+    reused as-is and nothing is rendered again.
+    """
+    if plan is not None:
+        return generate_project_from_plan(plan, progress_callback, dry_run=dry_run)
+
+    config = config_from_template(
+        template,
+        project_name,
+        project_path,
+        description=description,
+        git_init=git_init,
+        create_venv=create_venv,
+        install_deps=install_deps,
+    )
+    return run_generator(ProjectGenerator(config, progress_callback), progress_callback, dry_run)
+
+
+def generate_project_from_plan(
+    plan: GenerationPlan,
+    progress_callback: Optional[Callable] = None,
+    dry_run: bool = False,
+) -> bool:
+    """Generate (or replay) a project from a previously built plan"""
+    generator = ProjectGenerator(plan.config, progress_callback, plan=plan)
+    return run_generator(generator, progress_callback, dry_run)
+
+
+def run_generator(
+    generator: ProjectGenerator,
+    progress_callback: Optional[Callable],
+    dry_run: bool,
+) -> bool:
+    """Validate the configuration, then preview or generate"""
     is_valid, errors = generator.validate_config()
 
     if not is_valid:
@@ -480,7 +1196,7 @@ def generate_project_from_template(
     return generator.generate()
 
 
-def preview_project_from_template(
+def build_generation_plan(
     template: Dict[str, Any],
     project_name: str,
     project_path: str,
@@ -488,42 +1204,78 @@ def preview_project_from_template(
     git_init: bool = True,
     create_venv: bool = True,
     install_deps: bool = True,
-) -> Dict[str, Any]:
-    """Return a dry-run plan for the requested generation."""
-
-    technologies = [
-        TechnologyConfig(
-            name=tech["name"],
-            version=tech.get("version"),
-        )
-        for tech in template["technologies"]
-    ]
-
-    files = [
-        FileTemplate(
-            path=file["path"],
-            content=file["content"],
-            is_template=file.get("is_template", False),
-        )
-        for file in template["files"]
-    ]
-
-    config = ProjectConfig(
-        name=project_name,
-        description=description or template["description"],
-        project_type=template["project_type"],
-        path=project_path,
-        technologies=technologies,
-        structure=template["structure"],
-        files=files,
-        commands=template.get("commands", []),
+) -> GenerationPlan:
+    """Validate the inputs and render the template into a generation plan."""
+    config = config_from_template(
+        template,
+        project_name,
+        project_path,
+        description=description,
         git_init=git_init,
         create_venv=create_venv,
-        run_commands=install_deps,
+        install_deps=install_deps,
     )
-
     generator = ProjectGenerator(config)
     is_valid, errors = generator.validate_config()
     if not is_valid:
         raise ValueError("; ".join(errors))
-    return generator.build_preview()
+    return generator.build_plan()
+
+
+def update_project_from_template(
+    template: Dict[str, Any],
+    project_path: str,
+    progress_callback: Optional[Callable] = None,
+) -> Optional[UpdateReport]:
+    """Re-apply a (possibly updated) template to a project generated earlier.
+
+    Project name and description are read back from the project's
+    ``.devgenesis.json``; returns None when the project cannot be updated.
+    """
+    summary_path = Path(project_path) / SUMMARY_FILE
+    try:
+        with open(summary_path, "r", encoding="utf-8") as f:
+            summary = json.load(f)
+    except (OSError, ValueError) as exc:
+        if progress_callback:
+            progress_callback(f"Impossible de lire {summary_path}: {exc}", "error")
+        return None
+
+    config = config_from_template(
+        template,
+        summary.get("project_name") or Path(project_path).name,
+        project_path,
+        description=summary.get("description"),
+        git_init=False,
+        create_venv=False,
+        install_deps=False,
+    )
+    generator = ProjectGenerator(config, progress_callback)
+    is_valid, errors = generator.validate_config()
+    if not is_valid:
+        if progress_callback:
+            for error in errors:
+                progress_callback(error, "error")
+        return None
+    return generator.update()
+
+
+def preview_project_from_template(
+    template: Dict[str, Any],
+    project_name: str,
+    project_path: str,
+    description: Optional[str] = None,
+    git_init: bool = True,
+    create_venv: bool = True,
+    install_deps: bool = True,
+) -> Dict[str, Any]:
+    """Return a dry-run plan for the requested generation."""
+    return build_generation_plan(
+        template,
+        project_name,
+        project_path,
+        description=description,
+        git_init=git_init,
+        create_venv=create_venv,
+        install_deps=install_deps,
+    ).preview()
@@ -0,0 +1,182 @@
+"""Import-time budget for the DevGenesis entry points.
+
+Each module is imported in a fresh interpreter under ``-X importtime``;
+the check fails when an import gets slower than its budget (or than a
+saved baseline), loads a heavy dependency it should leave for later, or
+touches the filesystem::
+
+    python -m devgenesis.import_budget
+    python -m devgenesis.import_budget --save baseline.json
+    python -m devgenesis.import_budget --baseline baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+# Loaded on first use by the code that needs them, never by a plain import
+_HEAVY = ("jinja2", "rich", "yaml", "devgenesis.templates.builtin_templates")
+_HEADLESS = ("PySide6", "devgenesis.ui")
+
+
+@dataclass(frozen=True)
+class ImportBudget:
+    module: str
+    milliseconds: float
+    forbidden: Tuple[str, ...]
+
+
+BUDGETS = (
+    ImportBudget(
+        "devgenesis.cli",
+        60,
+        (*_HEAVY, *_HEADLESS, "sqlalchemy", "pydantic", "devgenesis.generator"),
+    ),
+    ImportBudget("devgenesis.config", 60, (*_HEAVY, *_HEADLESS, "sqlalchemy", "pydantic")),
+    ImportBudget("devgenesis.generator", 400, (*_HEAVY, *_HEADLESS, "sqlalchemy")),
+    ImportBudget("devgenesis.database", 800, (*_HEAVY, *_HEADLESS)),
+    # The database is opened by a worker thread once the window is drawn
+    ImportBudget("devgenesis.ui.main_window", 1500, (*_HEAVY, "sqlalchemy")),
+)
+_REGRESSION_TOLERANCE = 0.25  # Relative slowdown against a baseline before it counts
+_REGRESSION_FLOOR_MS = 5.0  # Ignore noise on imports that are fast anyway
+
+
+@dataclass
+class ImportMeasure:
+    module: str
+    milliseconds: Optional[float] = None  # Median cumulative import time; None if it failed
+    loaded: Set[str] = field(default_factory=set)
+    side_effects: List[str] = field(default_factory=list)  # Paths created under HOME
+    error: Optional[str] = None
+
+
+def _import_once(module: str, home: Path) -> Tuple[float, Set[str]]:
+    root = Path(__file__).resolve().parent.parent
+    env = {
+        **os.environ,
+        "HOME": str(home),
+        "USERPROFILE": str(home),
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(root), os.environ.get("PYTHONPATH")])),
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    loaded: Set[str] = set()
+    cumulative: Optional[int] = None
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # Column headers
+        name = parts[2].strip()
+        loaded.add(name)
+        if name == module:
+            cumulative = int(parts[1])
+    if result.returncode != 0 or cumulative is None:
+        message = result.stderr.strip().splitlines()[-1:] or [f"code {result.returncode}"]
+        raise RuntimeError(message[0])
+    return cumulative / 1000, loaded
+
+
+def measure(module: str, runs: int = 5) -> ImportMeasure:
+    """Import ``module`` ``runs`` times, each in a new interpreter with an empty HOME."""
+    report = ImportMeasure(module)
+    timings: List[float] = []
+    with tempfile.TemporaryDirectory(prefix="devgenesis-import-") as directory:
+        home = Path(directory)
+        try:
+            for _ in range(runs):
+                milliseconds, loaded = _import_once(module, home)
+                timings.append(milliseconds)
+                report.loaded |= loaded
+        except RuntimeError as exc:
+            report.error = str(exc)
+            return report
+        report.side_effects = sorted(
+            str(path.relative_to(home)) for path in home.rglob("*") if path.parent == home
+        )
+    report.milliseconds = statistics.median(timings)
+    return report
+
+
+def violations(
+    budget: ImportBudget, report: ImportMeasure, baseline: Optional[float] = None
+) -> List[str]:
+    """What ``report`` breaks, as human-readable lines (empty when it is within budget)."""
+    problems: List[str] = []
+    if report.milliseconds is not None and report.milliseconds > budget.milliseconds:
+        problems.append(f"{report.milliseconds:.0f} ms > budget {budget.milliseconds:.0f} ms")
+    if (
+        report.milliseconds is not None
+        and baseline is not None
+        and report.milliseconds > baseline * (1 + _REGRESSION_TOLERANCE)
+        and report.milliseconds - baseline > _REGRESSION_FLOOR_MS
+    ):
+        problems.append(f"régression: {report.milliseconds:.0f} ms contre {baseline:.0f} ms")
+    for name in budget.forbidden:
+        if any(loaded == name or loaded.startswith(name + ".") for loaded in report.loaded):
+            problems.append(f"importe {name}")
+    for path in report.side_effects:
+        problems.append(f"crée ~/{path} à l'import")
+    return problems
+
+
+def main(argv: Optional[Sequence[str]] = None, output: Callable[[str], None] = print) -> int:
+    """Check every budget; exit status 1 on any violation."""
+    parser = argparse.ArgumentParser(
+        prog="devgenesis-import-budget",
+        description="Vérifie le temps d'import et les dépendances chargées par les points d'entrée",
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Imports mesurés par module")
+    parser.add_argument("--baseline", type=Path, help="Mesures de référence (JSON)")
+    parser.add_argument("--save", type=Path, help="Enregistrer les mesures (JSON)")
+    args = parser.parse_args(argv)
+
+    baseline: Dict[str, float] = {}
+    if args.baseline is not None:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    status = 0
+    measured: Dict[str, float] = {}
+    for budget in BUDGETS:
+        report = measure(budget.module, args.runs)
+        if report.error is not None:
+            # e.g. PySide6 missing on a headless machine
+            output(f"IGNORÉ {budget.module}: {report.error}")
+            continue
+        measured[budget.module] = report.milliseconds
+        problems = violations(budget, report, baseline.get(budget.module))
+        status = status or (1 if problems else 0)
+        output(
+            f"{'ÉCHEC' if problems else 'OK':<5} {budget.module:<28} "
+            f"{report.milliseconds:7.1f} ms / {budget.milliseconds:.0f} ms"
+        )
+        for problem in problems:
+            output(f"      {problem}")
+
+    if args.save is not None:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(measured, f, indent=2)
+    return status
+
+
+__all__ = ["BUDGETS", "ImportBudget", "ImportMeasure", "main", "measure", "violations"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,24 @@
 """Main entry point for DevGenesis application"""
 
 import sys
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
-
-from devgenesis.ui.main_window import MainWindow
+import time
 
 
 def main():
     """Main application entry point"""
+    started = time.perf_counter()
+    # Imported here so the Qt and UI imports are part of the measured startup
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import Qt
+
+    from devgenesis.config import ensure_directories
+    from devgenesis.ui.main_window import MainWindow
+    from devgenesis.ui.startup import StartupTimer
+
+    startup = StartupTimer(started)
+    startup.mark("imports")
+    ensure_directories()
+
     # Enable High DPI scaling
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
@@ -21,7 +31,7 @@ def main():
     app.setApplicationVersion("1.0.0")
 
     # Create and show main window
-    window = MainWindow()
+    window = MainWindow(startup)
     window.show()
 
     # Run application
@@ -1,77 +1,10 @@
-"""Database models for DevGenesis."""
+"""Validation models for DevGenesis; the database models are in ``devgenesis.orm``."""
 
-import json
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, List, Optional, Union
 
 from pydantic import BaseModel, Field
-from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text, create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-
-from devgenesis.config import DATABASE_PATH
-
-Base = declarative_base()
-
-
-class ProjectTemplate(Base):
-    """Database model for project templates"""
-
-    __tablename__ = "project_templates"
-
-    id = Column(Integer, primary_key=True)
-    name = Column(String(200), unique=True, nullable=False)
-    description = Column(Text)
-    project_type = Column(String(100), nullable=False)
-    technologies = Column(Text, nullable=False)  # JSON string
-    structure = Column(Text, nullable=False)  # JSON string
-    files = Column(Text, nullable=False)  # JSON string
-    commands = Column(Text)  # JSON string
-    is_builtin = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "project_type": self.project_type,
-            "technologies": json.loads(self.technologies),
-            "structure": json.loads(self.structure),
-            "files": json.loads(self.files),
-            "commands": json.loads(self.commands) if self.commands else [],
-            "is_builtin": self.is_builtin,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-        }
-
-
-class ProjectHistory(Base):
-    """Database model for project generation history"""
-
-    __tablename__ = "project_history"
-
-    id = Column(Integer, primary_key=True)
-    project_name = Column(String(200), nullable=False)
-    project_path = Column(String(500), nullable=False)
-    template_name = Column(String(200))
-    technologies = Column(Text)  # JSON string
-    created_at = Column(DateTime, default=datetime.utcnow)
-    status = Column(String(50), default="success")  # success, failed, in_progress
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return {
-            "id": self.id,
-            "project_name": self.project_name,
-            "project_path": self.project_path,
-            "template_name": self.template_name,
-            "technologies": json.loads(self.technologies) if self.technologies else [],
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "status": self.status,
-        }
+
+from devgenesis.config import COMMAND_CONCURRENCY, FILE_WRITE_WORKERS
 
 
 # Pydantic models for validation
@@ -88,8 +21,19 @@ class FileTemplate(BaseModel):
     """Template for a file to be generated"""
 
     path: str
-    content: str
+    content: str = ""
     is_template: bool = False  # If true, use Jinja2 templating
+    asset: Optional[str] = None  # SHA-256 of a binary blob copied instead of ``content``
+    size: Optional[int] = None  # Size of the asset blob in bytes
+
+
+class CommandTemplate(BaseModel):
+    """A post-generation command that may run alongside the others"""
+
+    run: str
+    name: Optional[str] = None  # Prefix of its output lines, and target of ``depends_on``
+    cwd: Optional[str] = None  # Directory relative to the project root
+    depends_on: List[str] = Field(default_factory=list)  # Names of commands to wait for
 
 
 class ProjectConfig(BaseModel):
@@ -102,26 +46,38 @@ class ProjectConfig(BaseModel):
     technologies: List[TechnologyConfig]
     structure: List[str]  # List of directories to create
     files: List[FileTemplate]
-    commands: List[str] = Field(default_factory=list)  # Commands to run after generation
+    # Commands to run after generation: plain strings run in order, one after the other
+    commands: List[Union[str, CommandTemplate]] = Field(default_factory=list)
     git_init: bool = True
     create_venv: bool = True
     run_commands: bool = True
-
-
-# Database initialization
-engine = create_engine(f"sqlite:///{DATABASE_PATH}", echo=False)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-
-def init_database() -> None:
-    """Initialize the database"""
-    Base.metadata.create_all(bind=engine)
-
-
-def get_db():
-    """Get database session"""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    write_workers: int = Field(default=FILE_WRITE_WORKERS, ge=1)  # Concurrent file writes
+    render_in_processes: bool = False  # Render template bodies in a process pool
+    stream_render: bool = False  # Stream every templated body straight to disk
+    snapshot_cache: bool = False  # Reuse a cached rendered tree for identical inputs
+    dependency_cache: bool = True  # Restore npm/pip installs from ~/.devgenesis/deps
+    venv_pool: bool = True  # Take the venv from ~/.devgenesis/venv-pool when one is ready
+    offline: bool = False  # pip installs only from the local wheelhouse
+    native_git: bool = True  # Write the Git repository in-process instead of running git
+    command_concurrency: int = Field(default=COMMAND_CONCURRENCY, ge=1)
+
+
+_ORM_NAMES = {
+    "Base",
+    "ProjectTemplate",
+    "ProjectHistory",
+    "SessionLocal",
+    "get_db",
+    "get_engine",
+    "init_database",
+}
+
+
+def __getattr__(name: str) -> Any:
+    # The SQLAlchemy models live in devgenesis.orm so that importing the
+    # validation models does not load SQLAlchemy
+    if name in _ORM_NAMES:
+        from devgenesis import orm
+
+        return getattr(orm, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,113 @@
+"""SQLAlchemy models and the lazily created database engine."""
+
+import json
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Boolean, Column, DateTime, Integer, String, Text, create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import Session, sessionmaker
+
+from devgenesis.config import DATABASE_PATH
+
+Base = declarative_base()
+
+
+class ProjectTemplate(Base):
+    """Database model for project templates"""
+
+    __tablename__ = "project_templates"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(200), unique=True, nullable=False)
+    description = Column(Text)
+    project_type = Column(String(100), nullable=False)
+    technologies = Column(Text, nullable=False)  # JSON string
+    structure = Column(Text, nullable=False)  # JSON string
+    files = Column(Text, nullable=False)  # JSON string
+    commands = Column(Text)  # JSON string
+    is_builtin = Column(Boolean, default=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "project_type": self.project_type,
+            "technologies": json.loads(self.technologies),
+            "structure": json.loads(self.structure),
+            "files": json.loads(self.files),
+            "commands": json.loads(self.commands) if self.commands else [],
+            "is_builtin": self.is_builtin,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
+class ProjectHistory(Base):
+    """Database model for project generation history"""
+
+    __tablename__ = "project_history"
+
+    id = Column(Integer, primary_key=True)
+    project_name = Column(String(200), nullable=False)
+    project_path = Column(String(500), nullable=False)
+    template_name = Column(String(200))
+    technologies = Column(Text)  # JSON string
+    created_at = Column(DateTime, default=datetime.utcnow)
+    status = Column(String(50), default="success")  # success, failed, in_progress
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            "id": self.id,
+            "project_name": self.project_name,
+            "project_path": self.project_path,
+            "template_name": self.template_name,
+            "technologies": json.loads(self.technologies) if self.technologies else [],
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "status": self.status,
+        }
+
+
+# Database initialization, on first use rather than at import
+_engine: Optional[Engine] = None
+_session_factory: Optional[sessionmaker] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    """Return the application engine, creating it on first use"""
+    global _engine, _session_factory
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                engine = create_engine(f"sqlite:///{DATABASE_PATH}", echo=False)
+                _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+                _engine = engine
+    return _engine
+
+
+def SessionLocal() -> Session:  # Named like the sessionmaker it used to be
+    """Open a session on the application database"""
+    get_engine()
+    return _session_factory()
+
+
+def init_database() -> None:
+    """Initialize the database"""
+    Base.metadata.create_all(bind=get_engine())
+
+
+def get_db():
+    """Get database session"""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
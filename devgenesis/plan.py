@@ -0,0 +1,292 @@
+"""Immutable generation plans shared between preview and generation."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from devgenesis.models import CommandTemplate, ProjectConfig
+from devgenesis.services.template_engine import get_template_engine
+
+PLAN_FORMAT_VERSION = 1
+PREVIEW_LENGTH = 400
+DOCUMENT_PREVIEW_LENGTH = 64 * 1024  # Cap for README/.gitignore rendered from a stream
+
+_SEPARATORS = re.compile(r"[\\/]" if os.name == "nt" else "/")
+
+
+def normalize_relative_path(path: str) -> str:
+    """Return ``path`` as a clean POSIX-style path relative to the project root.
+
+    Raises ``ValueError`` for absolute paths or any attempt to leave the project.
+    """
+    if os.path.isabs(path) or Path(path).drive or path.startswith(("/", "\\")):
+        raise ValueError(f"Chemin absolu interdit dans un template: {path}")
+
+    parts: List[str] = []
+    for part in _SEPARATORS.split(path):
+        if part in ("", "."):
+            continue
+        if part == "..":
+            raise ValueError(f"Chemin hors du projet interdit dans un template: {path}")
+        parts.append(part)
+    return "/".join(parts)
+
+
+def plan_directory_layout(directories: Iterable[str], file_paths: Iterable[str]) -> Tuple[str, ...]:
+    """Merge structure entries and file parents into the directories to create.
+
+    Every directory appears once, parents before children, so each one can be
+    created with a single ``mkdir``. File/directory collisions are reported
+    before anything touches the disk.
+    """
+    files: Set[str] = set()
+    wanted: Set[str] = set()
+    for directory in directories:
+        normalized = normalize_relative_path(directory)
+        if normalized:
+            wanted.add(normalized)
+    for file_path in file_paths:
+        normalized = normalize_relative_path(file_path)
+        if not normalized:
+            raise ValueError("Un fichier du template n'a pas de chemin")
+        files.add(normalized)
+        parent = normalized.rpartition("/")[0]
+        if parent:
+            wanted.add(parent)
+
+    needed: Set[str] = set()
+    for directory in wanted:
+        while directory and directory not in needed:
+            needed.add(directory)
+            directory = directory.rpartition("/")[0]
+
+    collisions = sorted(files & needed)
+    if collisions:
+        raise ValueError(
+            "Conflit fichier/dossier dans le template: " + ", ".join(collisions)
+        )
+
+    return tuple(sorted(needed, key=lambda item: (item.count("/"), item)))
+
+
+def describe_command(command: Union[str, CommandTemplate]) -> str:
+    """Return how a template command is shown in the preview."""
+    if isinstance(command, str):
+        return command
+    text = f"[{command.name}] {command.run}" if command.name else command.run
+    if command.cwd:
+        text += f" (dans {command.cwd})"
+    if command.depends_on:
+        text += f" après {', '.join(command.depends_on)}"
+    return text
+
+
+@dataclass(frozen=True)
+class PlannedFile:
+    """A rendered file ready to be written to disk."""
+
+    path: str
+    content: bytes
+    is_template: bool = False
+    source: Optional[str] = None  # Template rendered straight to disk instead of ``content``
+    asset: Optional[str] = None  # Blob digest copied from the blob store instead of ``content``
+    size: Optional[int] = None  # Asset size, known without reading the blob
+
+    @property
+    def is_streamed(self) -> bool:
+        return self.source is not None
+
+    @property
+    def is_asset(self) -> bool:
+        return self.asset is not None
+
+    def text(self) -> str:
+        """Return the file body decoded as UTF-8."""
+        return self.content.decode("utf-8")
+
+    def prefix(self, context: Dict[str, Any], limit: int) -> str:
+        """Return the first ``limit`` characters without rendering or decoding the rest."""
+        if self.asset is not None:
+            size = f"{self.size} octets" if self.size is not None else "taille inconnue"
+            return f"[Ressource binaire – {size}]"
+        if self.source is not None:
+            return get_template_engine().render_prefix(self.source, context, limit)
+        # A UTF-8 character is at most 4 bytes; drop a possibly truncated tail
+        return self.content[: limit * 4].decode("utf-8", errors="ignore")[:limit]
+
+
+@dataclass(frozen=True)
+class GenerationPlan:
+    """Everything ``ProjectGenerator`` needs to materialise a project.
+
+    A plan is rendered once; the preview dialog and the generator consume the
+    same instance so clicking "Générer" after "Aperçu" does not render again.
+    """
+
+    config: ProjectConfig
+    context: Dict[str, Any]
+    directories: Tuple[str, ...]
+    files: Tuple[PlannedFile, ...]
+    commands: Tuple[Union[str, CommandTemplate], ...]
+    content_hash: str = field(default="")
+    mkdirs: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "mkdirs",
+            plan_directory_layout(self.directories, (planned.path for planned in self.files)),
+        )
+        if not self.content_hash:
+            object.__setattr__(self, "content_hash", self.compute_hash())
+
+    def compute_hash(self) -> str:
+        """Return a digest of the rendered tree and commands."""
+        digest = hashlib.blake2b(digest_size=20)
+        for directory in self.directories:
+            digest.update(b"D\0" + directory.encode("utf-8") + b"\0")
+        streamed = False
+        for planned in self.files:
+            if planned.asset is not None:
+                digest.update(b"A\0" + planned.path.encode("utf-8") + b"\0")
+                digest.update(planned.asset.encode("ascii"))
+                continue
+            if planned.source is not None:
+                streamed = True
+                digest.update(b"S\0" + planned.path.encode("utf-8") + b"\0")
+                digest.update(planned.source.encode("utf-8"))
+                continue
+            digest.update(b"F\0" + planned.path.encode("utf-8") + b"\0")
+            digest.update(len(planned.content).to_bytes(8, "little"))
+            digest.update(planned.content)
+        if streamed:
+            # Streamed bodies are only rendered at write time, from this context
+            digest.update(json.dumps(self.context, sort_keys=True, default=str).encode("utf-8"))
+        for command in self.commands:
+            if isinstance(command, CommandTemplate):
+                spec = json.dumps(command.model_dump(mode="json"), sort_keys=True)
+                digest.update(b"G\0" + spec.encode("utf-8") + b"\0")
+            else:
+                digest.update(b"C\0" + command.encode("utf-8") + b"\0")
+        return digest.hexdigest()
+
+    def preview(self) -> Dict[str, Any]:
+        """Return the dry-run preview displayed by ``PreviewDialog``."""
+        files: List[Dict[str, Any]] = []
+        readme_preview: Optional[str] = None
+        gitignore_preview: Optional[str] = None
+        for planned in self.files:
+            files.append(
+                {"path": planned.path, "preview": planned.prefix(self.context, PREVIEW_LENGTH)}
+            )
+            is_readme = planned.path.lower().endswith("readme.md")
+            is_gitignore = Path(planned.path).name == ".gitignore"
+            if (is_readme or is_gitignore) and not planned.is_asset:
+                content = (
+                    planned.prefix(self.context, DOCUMENT_PREVIEW_LENGTH)
+                    if planned.is_streamed
+                    else planned.text()
+                )
+                if is_readme:
+                    readme_preview = content
+                if is_gitignore:
+                    gitignore_preview = content
+
+        commands: List[str] = []
+        if self.config.git_init:
+            commands.append("git init")
+        if self.config.create_venv:
+            commands.append("python -m venv venv")
+        commands.extend(describe_command(command) for command in self.commands)
+
+        return {
+            "directories": list(self.directories),
+            "files": files,
+            "commands": commands,
+            "readme": readme_preview,
+            "gitignore": gitignore_preview,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialise the plan to JSON-compatible data."""
+        return {
+            "version": PLAN_FORMAT_VERSION,
+            "content_hash": self.content_hash,
+            "config": self.config.model_dump(mode="json", exclude={"files"}),
+            "context": self.context,
+            "directories": list(self.directories),
+            "files": [
+                {
+                    "path": planned.path,
+                    "content": base64.b64encode(planned.content).decode("ascii"),
+                    "is_template": planned.is_template,
+                    "source": planned.source,
+                    "asset": planned.asset,
+                    "size": planned.size,
+                }
+                for planned in self.files
+            ],
+            "commands": [
+                command if isinstance(command, str) else command.model_dump(mode="json")
+                for command in self.commands
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GenerationPlan":
+        """Rebuild a plan serialised with :meth:`to_dict`."""
+        version = data.get("version")
+        if version != PLAN_FORMAT_VERSION:
+            raise ValueError(f"Version de plan non supportée: {version}")
+
+        plan = cls(
+            config=ProjectConfig(**data["config"], files=[]),
+            context=dict(data["context"]),
+            directories=tuple(data["directories"]),
+            files=tuple(
+                PlannedFile(
+                    path=item["path"],
+                    content=base64.b64decode(item["content"]),
+                    is_template=item.get("is_template", False),
+                    source=item.get("source"),
+                    asset=item.get("asset"),
+                    size=item.get("size"),
+                )
+                for item in data["files"]
+            ),
+            commands=tuple(
+                command if isinstance(command, str) else CommandTemplate(**command)
+                for command in data["commands"]
+            ),
+        )
+        if data.get("content_hash") and data["content_hash"] != plan.content_hash:
+            raise ValueError("Le plan de génération est corrompu (empreinte invalide)")
+        return plan
+
+    def save(self, path: Path) -> None:
+        """Write the plan to a JSON file so it can be replayed later."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: Path) -> "GenerationPlan":
+        """Load a plan previously written with :meth:`save`."""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+__all__ = [
+    "GenerationPlan",
+    "PlannedFile",
+    "PLAN_FORMAT_VERSION",
+    "describe_command",
+    "normalize_relative_path",
+    "plan_directory_layout",
+]
@@ -0,0 +1,81 @@
+"""Content-addressed storage for binary template assets."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from devgenesis.config import BLOB_STORE_DIR
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+_CHUNK_SIZE = 1024 * 1024
+
+
+class BlobStore:
+    """Store files outside the template JSON, addressed by their SHA-256 digest."""
+
+    def __init__(self, root: Path = BLOB_STORE_DIR) -> None:
+        self.root = root
+
+    def path_for(self, digest: str) -> Path:
+        """Return where the blob with ``digest`` lives (whether or not it exists)."""
+
+        if not _DIGEST_RE.match(digest):
+            raise ValueError(f"Empreinte de ressource invalide: {digest}")
+        return self.root / digest[:2] / digest[2:]
+
+    def exists(self, digest: str) -> bool:
+        return self.path_for(digest).is_file()
+
+    def size(self, digest: str) -> int:
+        """Return the blob size from its metadata, without reading it."""
+
+        return self.path_for(digest).stat().st_size
+
+    def add_file(self, source: Path) -> Tuple[str, int]:
+        """Copy ``source`` into the store and return ``(digest, size)``."""
+
+        digest = hashlib.sha256()
+        with open(source, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        hexdigest = digest.hexdigest()
+
+        target = self.path_for(hexdigest)
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=".incoming-")
+            os.close(fd)
+            try:
+                shutil.copyfile(source, tmp_name)
+                os.replace(tmp_name, target)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        return hexdigest, target.stat().st_size
+
+    def asset_entry(self, project_path: str, source: Path) -> Dict[str, Any]:
+        """Store ``source`` and return the template ``files`` entry referencing it."""
+
+        digest, size = self.add_file(source)
+        return {"path": project_path, "asset": digest, "size": size}
+
+
+_store: Optional[BlobStore] = None
+
+
+def get_blob_store() -> BlobStore:
+    """Return the default blob store under ``~/.devgenesis/blobs``."""
+
+    global _store
+    if _store is None:
+        _store = BlobStore()
+    return _store
+
+
+__all__ = ["BlobStore", "get_blob_store"]
@@ -0,0 +1,307 @@
+"""Cache of installed dependencies keyed by the manifest that produced them."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import FrozenSet, List, Optional, Sequence
+
+from devgenesis.config import DEPENDENCY_CACHE_DIR, DEPENDENCY_CACHE_MAX_ENTRIES
+from devgenesis.services.filesystem import clone_tree, copy_file
+
+DEPENDENCY_CACHE_FORMAT_VERSION = 1
+_CONTENT_DIR = "content"
+_SCRIPTS_DIR = "scripts"
+_LOCKFILE = "package-lock.json"
+_META_FILE = "meta.json"
+_VENV_MARKER = b"@@DEVGENESIS_VENV@@"  # Stands for the venv path inside cached scripts
+_MAX_SCRIPT_SIZE = 64 * 1024
+
+_NPM_INSTALLS = (("install",), ("i",), ("ci",))
+_PIP_REQUIREMENT_FLAGS = ("-r", "--requirement")
+
+
+@dataclass(frozen=True)
+class DependencyInstall:
+    """An install command whose result can be cached and restored."""
+
+    kind: str  # "npm" or "pip"
+    key: str
+    target: Path  # node_modules, or the venv's site-packages
+    lockfile: Optional[Path] = None  # package-lock.json written by npm
+    venv: Optional[Path] = None
+    scripts_before: FrozenSet[str] = frozenset()  # venv/bin entries present before the install
+
+
+@functools.lru_cache(maxsize=None)
+def _tool_version(program: str) -> Optional[str]:
+    try:
+        result = subprocess.run(
+            [program, "--version"], capture_output=True, text=True, timeout=30, check=True
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def _digest(payload: dict) -> str:
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=20).hexdigest()
+
+
+def platform_tag() -> str:
+    """Operating system and CPU, for keys of anything holding compiled code."""
+
+    return f"{sys.platform}-{os.uname().machine if hasattr(os, 'uname') else ''}"
+
+
+def venv_python_version(venv: Path) -> Optional[str]:
+    """Interpreter version recorded in ``pyvenv.cfg``, without starting Python."""
+
+    try:
+        lines = (venv / "pyvenv.cfg").read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return None
+    values = {}
+    for line in lines:
+        name, _, value = line.partition("=")
+        values[name.strip()] = value.strip()
+    return values.get("version_info") or values.get("version")
+
+
+def _site_packages(venv: Path) -> Optional[Path]:
+    if os.name == "nt":
+        candidate = venv / "Lib" / "site-packages"
+        return candidate if candidate.is_dir() else None
+    candidates = sorted(venv.glob("lib/python*/site-packages"))
+    return candidates[0] if len(candidates) == 1 else None
+
+
+def _is_self_contained(requirements: str) -> bool:
+    """True when the requirements only name index packages (no paths, URLs or includes)."""
+
+    for line in requirements.splitlines():
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        if line.startswith(("-", ".", "/", "\\")) or "file:" in line or "://" in line:
+            return False
+    return True
+
+
+def _has_local_dependencies(package: dict) -> bool:
+    """True when package.json points at local paths, whose content the key can't see."""
+
+    for section in ("dependencies", "devDependencies", "optionalDependencies"):
+        for spec in (package.get(section) or {}).values():
+            if isinstance(spec, str) and spec.startswith(("file:", "link:", ".", "/", "~")):
+                return True
+    return bool(package.get("workspaces"))
+
+
+def _detect_npm(args: Sequence[str], cwd: Path) -> Optional[DependencyInstall]:
+    package_json = cwd / "package.json"
+    versions = (_tool_version("node"), _tool_version(args[0]))
+    if not package_json.is_file() or None in versions:
+        return None
+    try:
+        if _has_local_dependencies(json.loads(package_json.read_text(encoding="utf-8"))):
+            return None
+    except (ValueError, AttributeError):
+        return None
+
+    lockfile = cwd / _LOCKFILE
+    key = _digest(
+        {
+            "format": DEPENDENCY_CACHE_FORMAT_VERSION,
+            "kind": "npm",
+            "args": list(args[1:]),
+            "package.json": package_json.read_text(encoding="utf-8"),
+            "lockfile": lockfile.read_text(encoding="utf-8") if lockfile.is_file() else None,
+            "toolchain": versions,
+            "platform": platform_tag(),
+        }
+    )
+    return DependencyInstall("npm", key, cwd / "node_modules", lockfile=lockfile)
+
+
+def _detect_pip(args: Sequence[str], cwd: Path, venv: Path) -> Optional[DependencyInstall]:
+    if os.name == "nt":
+        return None  # Script launchers embed the venv path in compiled .exe files
+
+    requirements_path = cwd / args[3]
+    site_packages = _site_packages(venv)
+    version = venv_python_version(venv)
+    if not requirements_path.is_file() or site_packages is None or version is None:
+        return None
+    requirements = requirements_path.read_text(encoding="utf-8")
+    if not _is_self_contained(requirements):
+        return None
+
+    key = _digest(
+        {
+            "format": DEPENDENCY_CACHE_FORMAT_VERSION,
+            "kind": "pip",
+            "requirements": requirements,
+            "python": version,
+            "platform": platform_tag(),
+        }
+    )
+    scripts = frozenset(os.listdir(venv / "bin"))
+    return DependencyInstall("pip", key, site_packages, venv=venv, scripts_before=scripts)
+
+
+def detect_install(
+    args: Sequence[str], cwd: Path, venv: Optional[Path] = None
+) -> Optional[DependencyInstall]:
+    """Recognise ``npm install``/``npm ci`` and ``pip install -r FILE`` into ``venv``.
+
+    Returns None for any other command, or when the result would depend on
+    something the key does not capture.
+    """
+
+    if not args:
+        return None
+    program = Path(args[0]).name.lower()
+
+    if program in ("npm", "npm.cmd") and tuple(args[1:]) in _NPM_INSTALLS:
+        return _detect_npm(args, cwd)
+
+    if (
+        venv is not None
+        and program.startswith("pip")
+        and Path(args[0]).parent == venv / "bin"
+        and len(args) == 4
+        and args[1] == "install"
+        and args[2] in _PIP_REQUIREMENT_FLAGS
+    ):
+        return _detect_pip(args, cwd, venv)
+    return None
+
+
+class DependencyCache:
+    """Installed dependency trees under ``~/.devgenesis/deps/<key>``.
+
+    Restoring clones the cached tree (reflinks where the filesystem supports
+    them), so a hit needs neither the network nor the package manager.
+    """
+
+    def __init__(
+        self, root: Path = DEPENDENCY_CACHE_DIR, max_entries: int = DEPENDENCY_CACHE_MAX_ENTRIES
+    ) -> None:
+        self.root = root
+        self.max_entries = max_entries
+
+    def _entry(self, key: str) -> Path:
+        return self.root / key
+
+    def contains(self, key: str) -> bool:
+        return (self._entry(key) / _META_FILE).is_file()
+
+    def restore(self, install: DependencyInstall) -> bool:
+        """Materialise a cached install; returns False on a miss."""
+
+        entry = self._entry(install.key)
+        if not self.contains(install.key):
+            return False
+        os.utime(entry)  # Mark as recently used for pruning
+
+        install.target.mkdir(parents=True, exist_ok=True)
+        clone_tree(entry / _CONTENT_DIR, install.target)
+
+        if install.lockfile is not None and (entry / _LOCKFILE).is_file():
+            if not install.lockfile.exists():
+                copy_file(entry / _LOCKFILE, install.lockfile.parent, install.lockfile.name)
+
+        if install.venv is not None and (entry / _SCRIPTS_DIR).is_dir():
+            venv = os.fsencode(install.venv)
+            for script in (entry / _SCRIPTS_DIR).iterdir():
+                target = install.venv / "bin" / script.name
+                target.write_bytes(script.read_bytes().replace(_VENV_MARKER, venv))
+                target.chmod(0o755)
+        return True
+
+    def _store_scripts(self, install: DependencyInstall, destination: Path) -> None:
+        """Keep the console scripts the install added, with the venv path abstracted."""
+
+        destination.mkdir()
+        bin_dir = install.venv / "bin"
+        venv = os.fsencode(install.venv)
+        for name in sorted(set(os.listdir(bin_dir)) - install.scripts_before):
+            path = bin_dir / name
+            if not path.is_file() or path.is_symlink() or path.stat().st_size > _MAX_SCRIPT_SIZE:
+                continue
+            (destination / name).write_bytes(path.read_bytes().replace(venv, _VENV_MARKER))
+
+    def store(self, install: DependencyInstall) -> bool:
+        """Copy a finished install into the cache. Returns False if it already existed."""
+
+        if self.contains(install.key) or not install.target.is_dir():
+            return False
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{install.key}-", dir=self.root))
+        try:
+            (staging / _CONTENT_DIR).mkdir()
+            clone_tree(install.target, staging / _CONTENT_DIR)
+            if install.lockfile is not None and install.lockfile.is_file():
+                copy_file(install.lockfile, staging, _LOCKFILE)
+            if install.venv is not None:
+                self._store_scripts(install, staging / _SCRIPTS_DIR)
+            with open(staging / _META_FILE, "w", encoding="utf-8") as f:
+                json.dump({"format": DEPENDENCY_CACHE_FORMAT_VERSION, "kind": install.kind}, f)
+            os.rename(staging, self._entry(install.key))
+        except OSError:
+            # Lost a race with another writer, or the cache is not writable
+            shutil.rmtree(staging, ignore_errors=True)
+            return False
+
+        self.prune()
+        return True
+
+    def prune(self) -> None:
+        """Drop the least recently used entries beyond ``max_entries``."""
+
+        try:
+            entries: List[Path] = [
+                entry for entry in self.root.iterdir() if not entry.name.startswith(".")
+            ]
+        except OSError:
+            return
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[: len(entries) - self.max_entries]:
+            shutil.rmtree(entry, ignore_errors=True)
+
+
+_cache: Optional[DependencyCache] = None
+
+
+def get_dependency_cache() -> Optional[DependencyCache]:
+    """Return the default dependency cache, or None when ``DEVGENESIS_DEPENDENCY_CACHE=0``."""
+
+    global _cache
+    if os.environ.get("DEVGENESIS_DEPENDENCY_CACHE") == "0":
+        return None
+    if _cache is None:
+        _cache = DependencyCache()
+    return _cache
+
+
+__all__ = [
+    "DependencyCache",
+    "DependencyInstall",
+    "detect_install",
+    "get_dependency_cache",
+    "platform_tag",
+    "venv_python_version",
+]
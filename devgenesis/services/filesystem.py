@@ -0,0 +1,327 @@
+"""Low-level filesystem helpers used while materialising projects."""
+
+from __future__ import annotations
+
+import atexit
+import errno
+import os
+import queue
+import shutil
+import stat
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+DIR_FD_SUPPORTED = os.mkdir in os.supports_dir_fd and os.open in os.supports_dir_fd
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+_STREAM_BUFFER_SIZE = 64 * 1024
+_FICLONE = 0x40049409  # ioctl request from <linux/fs.h>
+_AT_FDCWD = -100
+_RENAME_EXCHANGE = 2
+
+
+@contextmanager
+def open_directory(path: Path) -> Iterator[Optional[int]]:
+    """Yield a directory file descriptor, or None where ``dir_fd`` is unsupported."""
+
+    if not DIR_FD_SUPPORTED:
+        yield None
+        return
+
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        yield fd
+    finally:
+        os.close(fd)
+
+
+def make_directory(root: Path, relative: str, dir_fd: Optional[int] = None) -> None:
+    """Create a single directory (no parents) relative to ``root``."""
+
+    try:
+        if dir_fd is None:
+            os.mkdir(root / relative)
+        else:
+            os.mkdir(relative, dir_fd=dir_fd)
+    except FileExistsError:
+        if not (root / relative).is_dir():
+            raise
+
+
+def _open_for_write(root: Path, relative: str, dir_fd: Optional[int]) -> int:
+    if dir_fd is None:
+        return os.open(root / relative, _WRITE_FLAGS, 0o666)
+    return os.open(relative, _WRITE_FLAGS, 0o666, dir_fd=dir_fd)
+
+
+def write_bytes(root: Path, relative: str, content: bytes, dir_fd: Optional[int] = None) -> None:
+    """Create or truncate ``relative`` under ``root`` and write ``content``."""
+
+    with os.fdopen(_open_for_write(root, relative, dir_fd), "wb") as f:
+        f.write(content)
+
+
+def write_text_chunks(
+    root: Path, relative: str, chunks: Iterable[str], dir_fd: Optional[int] = None
+) -> None:
+    """Write text chunks through a buffered UTF-8 handle without joining them."""
+
+    with os.fdopen(
+        _open_for_write(root, relative, dir_fd),
+        "w",
+        encoding="utf-8",
+        buffering=_STREAM_BUFFER_SIZE,
+    ) as f:
+        for chunk in chunks:
+            f.write(chunk)
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> bool:
+    """Copy ``size`` bytes inside the kernel; return False if no zero-copy call works."""
+
+    copiers = []
+    if hasattr(os, "copy_file_range"):
+        copiers.append(
+            lambda offset, count: os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+        )
+    if hasattr(os, "sendfile"):
+        copiers.append(lambda offset, count: os.sendfile(dst_fd, src_fd, offset, count))
+
+    for copier in copiers:
+        offset = 0
+        try:
+            while offset < size:
+                copied = copier(offset, size - offset)
+                if copied == 0:
+                    break
+                offset += copied
+        except OSError:
+            pass  # Unsupported here (EXDEV, ENOSYS, EINVAL...)
+        if offset == size:
+            return True
+        # Failed or stopped short (some filesystems report 0 instead of an error, or the
+        # source shrank): restart with the next method
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+        os.ftruncate(dst_fd, 0)
+    return False
+
+
+def copy_file(source: Path, root: Path, relative: str, dir_fd: Optional[int] = None) -> None:
+    """Copy ``source`` to ``relative`` under ``root`` without passing through user space.
+
+    Uses ``copy_file_range`` then ``sendfile`` and falls back to
+    ``shutil.copyfileobj`` where neither is available.
+    """
+
+    with open(source, "rb", buffering=0) as src:
+        size = os.fstat(src.fileno()).st_size
+        with os.fdopen(_open_for_write(root, relative, dir_fd), "wb", buffering=0) as dst:
+            if size and not _kernel_copy(src.fileno(), dst.fileno(), size):
+                shutil.copyfileobj(src, dst, _STREAM_BUFFER_SIZE)
+
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    """Share ``src_fd``'s extents with ``dst_fd`` (btrfs, XFS...); False if unsupported."""
+
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+
+    try:
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+    except OSError:
+        return False
+    return True
+
+
+def clone_file(source: Path, root: Path, relative: str, dir_fd: Optional[int] = None) -> None:
+    """Copy-on-write clone of ``source`` when the filesystem allows it, else a kernel copy.
+
+    Executable bits are carried over, so cloned scripts stay runnable.
+    """
+
+    with open(source, "rb", buffering=0) as src:
+        mode = stat.S_IMODE(os.fstat(src.fileno()).st_mode)
+        with os.fdopen(_open_for_write(root, relative, dir_fd), "wb", buffering=0) as dst:
+            if mode & 0o111 and hasattr(os, "fchmod"):
+                os.fchmod(dst.fileno(), mode)
+            if _reflink(src.fileno(), dst.fileno()):
+                return
+    copy_file(source, root, relative, dir_fd)
+
+
+def clone_tree(source: Path, destination: Path) -> int:
+    """Recreate ``source`` under the existing ``destination`` directory.
+
+    Directories are created once, parents first; files are reflinked where
+    possible and symbolic links are recreated as links (``node_modules/.bin``
+    relies on them). Returns the number of files cloned.
+    """
+
+    count = 0
+    with open_directory(destination) as dir_fd:
+        for current, dirnames, filenames in os.walk(source):
+            relative_dir = os.path.relpath(current, source)
+            prefix = "" if relative_dir == "." else relative_dir.replace(os.sep, "/") + "/"
+            for dirname in sorted(dirnames):
+                if os.path.islink(os.path.join(current, dirname)):
+                    _copy_link(Path(current) / dirname, destination / (prefix + dirname))
+                    continue
+                make_directory(destination, prefix + dirname, dir_fd)
+            for filename in filenames:
+                if os.path.islink(os.path.join(current, filename)):
+                    _copy_link(Path(current) / filename, destination / (prefix + filename))
+                else:
+                    clone_file(Path(current) / filename, destination, prefix + filename, dir_fd)
+                count += 1
+    return count
+
+
+def _copy_link(source: Path, destination: Path) -> None:
+    """Recreate the symbolic link ``source`` at ``destination``, replacing a previous entry."""
+
+    target = os.readlink(source)
+    if destination.is_symlink() or destination.is_file():
+        destination.unlink()
+    os.symlink(target, destination, target_is_directory=source.is_dir())
+
+
+_renameat2 = None
+_renameat2_loaded = False
+
+
+def _load_renameat2():
+    """Return libc's ``renameat2`` (glibc >= 2.28), or None where it is missing."""
+
+    global _renameat2, _renameat2_loaded
+    if not _renameat2_loaded:
+        _renameat2_loaded = True
+        if sys.platform.startswith("linux"):
+            import ctypes
+
+            try:
+                function = ctypes.CDLL(None, use_errno=True).renameat2
+            except (AttributeError, OSError):
+                function = None
+            if function is not None:
+                function.argtypes = [
+                    ctypes.c_int,
+                    ctypes.c_char_p,
+                    ctypes.c_int,
+                    ctypes.c_char_p,
+                    ctypes.c_uint,
+                ]
+                function.restype = ctypes.c_int
+                _renameat2 = function
+    return _renameat2
+
+
+def exchange_paths(first: Path, second: Path) -> bool:
+    """Atomically swap two existing paths; False if the platform or filesystem can't."""
+
+    function = _load_renameat2()
+    if function is None:
+        return False
+
+    import ctypes
+
+    result = function(
+        _AT_FDCWD, os.fsencode(first), _AT_FDCWD, os.fsencode(second), _RENAME_EXCHANGE
+    )
+    if result == 0:
+        return True
+    error = ctypes.get_errno()
+    if error in (errno.EINVAL, errno.ENOSYS, errno.EXDEV, errno.ENOTSUP):
+        return False
+    raise OSError(error, os.strerror(error), str(first), None, str(second))
+
+
+def replace_directory(source: Path, destination: Path, trash: Path) -> None:
+    """Move ``source`` to ``destination``; a previous ``destination`` ends up at ``trash``.
+
+    Within one filesystem this is a single ``renameat2(RENAME_EXCHANGE)`` on
+    Linux, or two renames elsewhere, so no file is copied or deleted here.
+    Deleting ``trash`` is left to the caller (see :func:`defer_delete`).
+    """
+
+    if destination.exists() or destination.is_symlink():
+        if exchange_paths(source, destination):
+            os.rename(source, trash)
+            return
+        os.rename(destination, trash)
+
+    try:
+        os.rename(source, destination)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        shutil.move(str(source), str(destination))
+
+
+class _Reaper:
+    """Daemon thread deleting trees handed over by :func:`defer_delete`."""
+
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[Path]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, path: Path) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="devgenesis-reaper", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.drain)
+        self._queue.put(path)
+
+    def _run(self) -> None:
+        while True:
+            path = self._queue.get()
+            try:
+                shutil.rmtree(path, ignore_errors=True)
+            finally:
+                self._queue.task_done()
+
+    def drain(self) -> None:
+        """Block until every submitted tree has been deleted."""
+
+        self._queue.join()
+
+
+_reaper = _Reaper()
+
+
+def defer_delete(path: Path) -> None:
+    """Delete ``path`` recursively on a background thread.
+
+    Pending deletions are finished before the interpreter exits.
+    """
+
+    _reaper.submit(path)
+
+
+def drain_deletions() -> None:
+    """Wait for deletions queued with :func:`defer_delete`."""
+
+    _reaper.drain()
+
+
+__all__ = [
+    "DIR_FD_SUPPORTED",
+    "clone_file",
+    "clone_tree",
+    "copy_file",
+    "defer_delete",
+    "drain_deletions",
+    "exchange_paths",
+    "make_directory",
+    "open_directory",
+    "replace_directory",
+    "write_bytes",
+    "write_text_chunks",
+]
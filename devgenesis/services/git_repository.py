@@ -0,0 +1,418 @@
+"""Write a Git repository and its first commit without running ``git``.
+
+Objects are stored loose (zlib-compressed), the index is written in version 2
+format, and ``.gitignore`` rules are applied by a small matcher, so the
+result is what ``git init && git add . && git commit`` would have produced.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+DEFAULT_BRANCH = "master"
+DEFAULT_IDENTITY = ("DevGenesis", "devgenesis@localhost")
+_ZERO_SHA = "0" * 40
+_CHUNK_SIZE = 1024 * 1024
+_SETTINGS_PATTERN = r"^(user\.(name|email)|init\.defaultbranch|core\.excludesfile)$"
+
+FileSource = Union[bytes, Path]  # Body in memory, or a file to stream it from
+
+
+@dataclass(frozen=True)
+class GitSettings:
+    """The few ``git config`` values a first commit depends on."""
+
+    author: Tuple[str, str] = DEFAULT_IDENTITY
+    committer: Tuple[str, str] = DEFAULT_IDENTITY
+    branch: str = DEFAULT_BRANCH
+    excludes_file: Optional[Path] = None
+
+
+def read_git_settings(cwd: Optional[Path] = None) -> GitSettings:
+    """Identity, default branch and global excludes, with a single ``git config`` call.
+
+    Works without git installed: the ``GIT_AUTHOR_*``/``GIT_COMMITTER_*``
+    variables still apply, then the DevGenesis defaults.
+    """
+
+    values: Dict[str, str] = {}
+    try:
+        result = subprocess.run(
+            ["git", "config", "-z", "--get-regexp", _SETTINGS_PATTERN],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        for record in result.stdout.split("\0"):
+            name, _, value = record.partition("\n")
+            if name:
+                values[name.lower()] = value  # Later (more specific) files win
+    except (OSError, subprocess.SubprocessError):
+        pass
+
+    def identity(role: str) -> Tuple[str, str]:
+        return (
+            os.environ.get(f"GIT_{role}_NAME") or values.get("user.name") or DEFAULT_IDENTITY[0],
+            os.environ.get(f"GIT_{role}_EMAIL") or values.get("user.email") or DEFAULT_IDENTITY[1],
+        )
+
+    excludes = values.get("core.excludesfile")
+    if excludes:
+        excludes_file: Optional[Path] = Path(excludes).expanduser()
+    else:
+        config_home = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+        excludes_file = Path(config_home) / "git" / "ignore"
+    return GitSettings(
+        author=identity("AUTHOR"),
+        committer=identity("COMMITTER"),
+        branch=values.get("init.defaultbranch") or DEFAULT_BRANCH,
+        excludes_file=excludes_file,
+    )
+
+
+def _glob_to_regex(pattern: str) -> str:
+    parts: List[str] = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if pattern.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+            continue
+        if pattern.startswith("**", index):
+            parts.append(".*")
+            index += 2
+            continue
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "\\" and index + 1 < len(pattern):
+            index += 1
+            parts.append(re.escape(pattern[index]))
+        elif char == "[":
+            end = pattern.find("]", index + 2)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[index + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                parts.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+                index = end
+        else:
+            parts.append(re.escape(char))
+        index += 1
+    return "".join(parts)
+
+
+@dataclass(frozen=True)
+class _IgnoreRule:
+    regex: "re.Pattern[str]"
+    negated: bool
+    directory_only: bool
+    anchored: bool  # Matched against the whole relative path, not just the name
+
+
+def _parse_ignore(text: str) -> List[_IgnoreRule]:
+    rules = []
+    for line in text.splitlines():
+        line = re.sub(r"(?<!\\)\s+$", "", line)
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        elif line.startswith("\\"):
+            line = line[1:]
+        directory_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        anchored = "/" in line
+        regex = re.compile(_glob_to_regex(line.lstrip("/")) + r"\Z", re.DOTALL)
+        rules.append(_IgnoreRule(regex, negated, directory_only, anchored))
+    return rules
+
+
+class GitIgnore:
+    """``.gitignore`` matcher for the paths of a new repository.
+
+    Sources are added from the lowest to the highest precedence: the global
+    excludes file, then the root ``.gitignore``, then nested ones.
+    """
+
+    def __init__(self) -> None:
+        self._sources: List[Tuple[str, List[_IgnoreRule]]] = []
+
+    def add(self, base: str, text: str) -> None:
+        """Add the rules of a ``.gitignore`` located in directory ``base`` ("" for the root)."""
+
+        self._sources.append((base.strip("/"), _parse_ignore(text)))
+
+    def _match(self, path: str, is_dir: bool) -> bool:
+        ignored = False
+        for base, rules in self._sources:
+            if base and not path.startswith(base + "/"):
+                continue
+            relative = path[len(base) + 1 :] if base else path
+            name = relative.rsplit("/", 1)[-1]
+            for rule in rules:
+                if rule.directory_only and not is_dir:
+                    continue
+                if rule.regex.match(relative if rule.anchored else name):
+                    ignored = not rule.negated
+        return ignored
+
+    def ignored(self, path: str) -> bool:
+        """True when the file ``path`` would be skipped by ``git add .``."""
+
+        parts = path.split("/")
+        # A file inside an ignored directory cannot be re-included
+        for depth in range(1, len(parts)):
+            if self._match("/".join(parts[:depth]), is_dir=True):
+                return True
+        return self._match(path, is_dir=False)
+
+
+def build_ignore(
+    files: Mapping[str, FileSource], excludes_file: Optional[Path] = None
+) -> GitIgnore:
+    """Matcher for the ``.gitignore`` files among ``files`` plus the global excludes."""
+
+    matcher = GitIgnore()
+    if excludes_file is not None:
+        try:
+            matcher.add("", excludes_file.read_text(encoding="utf-8", errors="replace"))
+        except OSError:
+            pass
+    names = sorted(
+        (path for path in files if path.rsplit("/", 1)[-1] == ".gitignore"),
+        key=lambda path: path.count("/"),
+    )
+    for path in names:
+        source = files[path]
+        data = source if isinstance(source, bytes) else source.read_bytes()
+        matcher.add(path.rpartition("/")[0], data.decode("utf-8", errors="replace"))
+    return matcher
+
+
+class _ObjectWriter:
+    """Loose objects under ``.git/objects``."""
+
+    def __init__(self, git_dir: Path) -> None:
+        self.objects = git_dir / "objects"
+
+    def _publish(self, sha: str, compressed: Iterable[bytes]) -> None:
+        directory = self.objects / sha[:2]
+        target = directory / sha[2:]
+        if target.exists():
+            return
+        directory.mkdir(exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=directory, prefix="tmp_obj_")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in compressed:
+                    f.write(chunk)
+            os.chmod(temporary, 0o444)
+            os.replace(temporary, target)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+
+    def write(self, kind: str, data: bytes) -> str:
+        raw = b"%s %d\0" % (kind.encode("ascii"), len(data)) + data
+        sha = hashlib.sha1(raw).hexdigest()
+        self._publish(sha, [zlib.compress(raw, 1)])
+        return sha
+
+    def write_file(self, path: Path) -> str:
+        """Store a file as a blob, reading it twice instead of holding it in memory."""
+
+        header = b"blob %d\0" % path.stat().st_size
+        digest = hashlib.sha1(header)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        sha = digest.hexdigest()
+
+        def compressed() -> Iterable[bytes]:
+            compressor = zlib.compressobj(1)
+            yield compressor.compress(header)
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                    yield compressor.compress(chunk)
+            yield compressor.flush()
+
+        self._publish(sha, compressed())
+        return sha
+
+
+def _file_mode(stat: os.stat_result) -> int:
+    return 0o100755 if os.name != "nt" and stat.st_mode & 0o111 else 0o100644
+
+
+def _write_trees(writer: _ObjectWriter, entries: Dict[str, Tuple[int, str]]) -> str:
+    """Write the tree objects for ``{path: (mode, sha)}``; returns the root tree."""
+
+    children: Dict[str, Dict[str, Tuple[int, str]]] = {}
+    blobs: Dict[str, Tuple[int, str]] = {}
+    for path, entry in entries.items():
+        head, _, rest = path.partition("/")
+        if rest:
+            children.setdefault(head, {})[rest] = entry
+        else:
+            blobs[head] = entry
+
+    items: List[Tuple[bytes, bytes]] = []
+    for name, (mode, sha) in blobs.items():
+        encoded = name.encode("utf-8")
+        items.append((encoded, b"%o %s\0" % (mode, encoded) + bytes.fromhex(sha)))
+    for name, subtree in children.items():
+        sha = _write_trees(writer, subtree)
+        encoded = name.encode("utf-8")
+        # Git orders directories as if their name ended with "/"
+        items.append((encoded + b"/", b"40000 %s\0" % encoded + bytes.fromhex(sha)))
+    items.sort(key=lambda item: item[0])
+    return writer.write("tree", b"".join(record for _, record in items))
+
+
+def _write_index(
+    git_dir: Path,
+    root: Path,
+    entries: Dict[str, Tuple[int, str]],
+    stats: Mapping[str, os.stat_result],
+) -> None:
+    """Index v2 with the stat data of the working tree, as ``git add`` leaves it."""
+
+    records = []
+    for path in sorted(entries, key=lambda path: path.encode("utf-8")):
+        mode, sha = entries[path]
+        stat = stats.get(path) or os.lstat(root / path)
+        encoded = path.encode("utf-8")
+        fields = [
+            int(stat.st_ctime), stat.st_ctime_ns % 1_000_000_000,
+            int(stat.st_mtime), stat.st_mtime_ns % 1_000_000_000,
+            stat.st_dev, stat.st_ino, mode, stat.st_uid, stat.st_gid, stat.st_size,
+        ]
+        record = struct.pack(">10I", *(value & 0xFFFFFFFF for value in fields))
+        record += bytes.fromhex(sha) + struct.pack(">H", min(len(encoded), 0xFFF)) + encoded
+        record += b"\0" * (8 - len(record) % 8)  # At least one NUL, padded to 8 bytes
+        records.append(record)
+
+    data = b"DIRC" + struct.pack(">II", 2, len(records)) + b"".join(records)
+    fd, temporary = tempfile.mkstemp(dir=git_dir, prefix="index-")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data + hashlib.sha1(data).digest())
+    os.replace(temporary, git_dir / "index")
+
+
+def init_repository(root: Path, branch: str = DEFAULT_BRANCH) -> Path:
+    """Create an empty repository in ``root``, like ``git init``; returns the git dir."""
+
+    git_dir = root / ".git"
+    for directory in ("objects/info", "objects/pack", "refs/heads", "refs/tags", "info"):
+        (git_dir / directory).mkdir(parents=True, exist_ok=True)
+    core = [
+        "[core]",
+        "\trepositoryformatversion = 0",
+        f"\tfilemode = {'false' if os.name == 'nt' else 'true'}",
+        "\tbare = false",
+        "\tlogallrefupdates = true",
+    ]
+    if os.name == "nt" or sys.platform == "darwin":
+        core.append("\tignorecase = true")
+    (git_dir / "config").write_text("\n".join(core) + "\n", encoding="utf-8")
+    (git_dir / "HEAD").write_text(f"ref: refs/heads/{branch}\n", encoding="utf-8")
+    (git_dir / "description").write_text(
+        "Unnamed repository; edit this file 'description' to name the repository.\n",
+        encoding="utf-8",
+    )
+    return git_dir
+
+
+def _signature(identity: Tuple[str, str], timestamp: int, offset: int) -> str:
+    sign = "+" if offset >= 0 else "-"
+    hours, minutes = divmod(abs(offset) // 60, 60)
+    return f"{identity[0]} <{identity[1]}> {timestamp} {sign}{hours:02d}{minutes:02d}"
+
+
+def commit_files(
+    root: Path,
+    files: Mapping[str, FileSource],
+    message: str,
+    settings: GitSettings = GitSettings(),
+    stats: Optional[Mapping[str, os.stat_result]] = None,
+) -> Optional[str]:
+    """Commit ``files`` (relative POSIX paths) as the first commit of the repository in ``root``.
+
+    Paths matched by ``.gitignore`` are left out, as ``git add .`` would.
+    ``stats`` gives the stat data matching an in-memory body when the file
+    on disk may have changed since; the index records it instead of the
+    current one. Returns the commit id, or None when every path was ignored.
+    """
+
+    stats = stats or {}
+    git_dir = root / ".git"
+    writer = _ObjectWriter(git_dir)
+    ignore = build_ignore(files, settings.excludes_file)
+
+    entries: Dict[str, Tuple[int, str]] = {}
+    for path, source in files.items():
+        if ignore.ignored(path):
+            continue
+        mode = _file_mode(stats.get(path) or os.stat(root / path))
+        if isinstance(source, bytes):
+            sha = writer.write("blob", source)
+        else:
+            sha = writer.write_file(source)
+        entries[path] = (mode, sha)
+    if not entries:
+        return None
+
+    tree = _write_trees(writer, entries)
+    _write_index(git_dir, root, entries, stats)
+
+    timestamp = int(time.time())
+    offset = time.localtime(timestamp).tm_gmtoff
+    author = _signature(settings.author, timestamp, offset)
+    committer = _signature(settings.committer, timestamp, offset)
+    commit = writer.write(
+        "commit",
+        f"tree {tree}\nauthor {author}\ncommitter {committer}\n\n{message}\n".encode("utf-8"),
+    )
+
+    branch = settings.branch
+    ref = git_dir / "refs" / "heads" / branch
+    ref.parent.mkdir(parents=True, exist_ok=True)
+    ref.write_text(commit + "\n", encoding="ascii")
+    (git_dir / "HEAD").write_text(f"ref: refs/heads/{branch}\n", encoding="utf-8")
+
+    subject = message.splitlines()[0] if message else ""
+    reflog = f"{_ZERO_SHA} {commit} {committer}\tcommit (initial): {subject}\n"
+    for log in (git_dir / "logs" / "HEAD", git_dir / "logs" / "refs" / "heads" / branch):
+        log.parent.mkdir(parents=True, exist_ok=True)
+        log.write_text(reflog, encoding="utf-8")
+    return commit
+
+
+__all__ = [
+    "GitIgnore",
+    "GitSettings",
+    "build_ignore",
+    "commit_files",
+    "init_repository",
+    "read_git_settings",
+]
@@ -0,0 +1,224 @@
+"""Content manifests recorded in ``.devgenesis.json`` and drift verification."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+try:  # Optional, much faster than any hashlib digest
+    import xxhash
+except ImportError:  # pragma: no cover - depends on the environment
+    xxhash = None
+
+SUMMARY_FILE = ".devgenesis.json"
+MANIFEST_ALGORITHM = "xxh3_128" if xxhash is not None else "blake2b"
+VERIFY_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+_CHUNK_SIZE = 1024 * 1024
+_MMAP_THRESHOLD = 256 * 1024  # Smaller files are cheaper to read() than to map
+
+
+def _new_hasher(algorithm: str) -> Any:
+    if algorithm == "blake2b":
+        return hashlib.blake2b(digest_size=20)
+    if algorithm == "xxh3_128":
+        if xxhash is None:
+            raise ValueError("Le manifeste utilise xxh3_128 mais le module xxhash est absent")
+        return xxhash.xxh3_128()
+    raise ValueError(f"Algorithme de manifeste inconnu: {algorithm}")
+
+
+def hash_bytes(data: bytes, algorithm: str = MANIFEST_ALGORITHM) -> str:
+    """Return the manifest hash of an in-memory body."""
+
+    hasher = _new_hasher(algorithm)
+    hasher.update(data)
+    return hasher.hexdigest()
+
+
+def hash_chunks(chunks: Iterable[bytes], algorithm: str = MANIFEST_ALGORITHM) -> str:
+    """Return the manifest hash of a body produced chunk by chunk."""
+
+    hasher = _new_hasher(algorithm)
+    for chunk in chunks:
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def hash_file(path: Path, algorithm: str = MANIFEST_ALGORITHM) -> str:
+    """Return the manifest hash of a file on disk, memory-mapping large files."""
+
+    hasher = _new_hasher(algorithm)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+        else:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def manifest_entry(
+    root: Path, relative: str, digest: str, stat: Optional[os.stat_result] = None
+) -> Dict[str, Any]:
+    """Build one manifest record, capturing size and mtime for the verify shortcut.
+
+    ``stat`` is the file as ``digest`` describes it, when it may have changed since.
+    """
+
+    if stat is None:
+        stat = os.stat(root / relative)
+    return {
+        "path": relative,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "hash": digest,
+    }
+
+
+def load_manifest(project: Path) -> Dict[str, Any]:
+    """Return the manifest stored in a project's ``.devgenesis.json``."""
+
+    with open(project / SUMMARY_FILE, "r", encoding="utf-8") as f:
+        summary = json.load(f)
+    manifest = summary.get("manifest")
+    if not isinstance(manifest, dict) or "files" not in manifest:
+        raise ValueError(f"{project / SUMMARY_FILE} ne contient pas de manifeste")
+    return manifest
+
+
+@dataclass
+class VerifyReport:
+    """Drift of a project relative to its manifest."""
+
+    project: Path
+    modified: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+    stat_only: int = 0  # Files trusted from size + mtime without reading them
+    hashed: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.modified and not self.missing
+
+    def describe(self) -> str:
+        status = "OK" if self.ok else "DÉRIVE"
+        return (
+            f"{status} {self.project}: {len(self.modified)} modifié(s), "
+            f"{len(self.missing)} manquant(s), {self.hashed} haché(s), "
+            f"{self.stat_only} vérifié(s) par stat"
+        )
+
+
+def _check_entry(root: Path, entry: Dict[str, Any], algorithm: str, full: bool) -> str:
+    """Return 'missing', 'modified', 'stat' or 'hashed' for one manifest record."""
+
+    path = root / entry["path"]
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return "missing"
+
+    size = entry.get("size")
+    if size is not None and stat.st_size != size:
+        return "modified"
+    if not full and size is not None and stat.st_mtime_ns == entry.get("mtime_ns"):
+        return "stat"
+    return "hashed" if hash_file(path, algorithm) == entry["hash"] else "modified"
+
+
+def verify_project(
+    project: Path,
+    workers: int = VERIFY_WORKERS,
+    full: bool = False,
+) -> VerifyReport:
+    """Check a generated project against its manifest.
+
+    Files whose size and mtime still match the manifest are trusted without
+    being read unless ``full`` is set; the rest are hashed in parallel.
+    """
+
+    manifest = load_manifest(project)
+    algorithm = manifest.get("algorithm", "blake2b")
+    entries = manifest["files"]
+    report = VerifyReport(project=project)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        outcomes = executor.map(
+            lambda entry: _check_entry(project, entry, algorithm, full), entries
+        )
+        for entry, outcome in zip(entries, outcomes):
+            if outcome == "missing":
+                report.missing.append(entry["path"])
+            elif outcome == "modified":
+                report.modified.append(entry["path"])
+            elif outcome == "stat":
+                report.stat_only += 1
+            else:
+                report.hashed += 1
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None, output: Callable[[str], None] = print) -> int:
+    """Verify one or more projects; exit status 1 when any of them drifted."""
+
+    parser = argparse.ArgumentParser(
+        prog="devgenesis-verify",
+        description="Vérifie des projets générés par rapport à leur manifeste .devgenesis.json",
+    )
+    parser.add_argument("projects", nargs="+", type=Path, help="Dossiers de projets à vérifier")
+    parser.add_argument(
+        "--full", action="store_true", help="Hacher tous les fichiers (ignore mtime)"
+    )
+    parser.add_argument("--workers", type=int, default=VERIFY_WORKERS, help="Threads de hachage")
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Lister les fichiers en dérive"
+    )
+    args = parser.parse_args(argv)
+
+    status = 0
+    for project in args.projects:
+        try:
+            report = verify_project(project, workers=args.workers, full=args.full)
+        except (OSError, ValueError) as exc:
+            output(f"ERREUR {project}: {exc}")
+            status = 1
+            continue
+
+        output(report.describe())
+        if not report.ok:
+            status = 1
+            if args.verbose:
+                for path in report.modified:
+                    output(f"  modifié: {path}")
+                for path in report.missing:
+                    output(f"  manquant: {path}")
+    return status
+
+
+__all__ = [
+    "MANIFEST_ALGORITHM",
+    "SUMMARY_FILE",
+    "VerifyReport",
+    "hash_bytes",
+    "hash_chunks",
+    "hash_file",
+    "load_manifest",
+    "main",
+    "manifest_entry",
+    "verify_project",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""Subprocess runner that streams output line by line instead of buffering it."""
+
+from __future__ import annotations
+
+import os
+import queue
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Callable, Deque, List, Optional, Sequence, Tuple
+
+from devgenesis.config import COMMAND_IDLE_TIMEOUT, COMMAND_TIMEOUT
+
+TAIL_LINES = 50
+QUEUE_SIZE = 256  # Lines in flight; readers block beyond this, and so does the child
+_DRAIN_TIMEOUT = 5.0  # Grandchildren may keep the pipes open after a kill
+_EOF = None
+
+
+class IdleTimeoutExpired(subprocess.TimeoutExpired):
+    """The process printed nothing for longer than the idle timeout."""
+
+
+@dataclass
+class StreamResult:
+    """Exit status and the last lines of a streamed process."""
+
+    args: Sequence[str]
+    returncode: int
+    duration: float
+    tail: List[str] = field(default_factory=list)  # Last lines of stdout and stderr, interleaved
+    stderr_tail: List[str] = field(default_factory=list)
+
+
+def terminate(process: subprocess.Popen, kill: bool = False) -> None:
+    """Stop a process started by :func:`run_streaming`, children included on POSIX."""
+
+    if process.poll() is not None:
+        return
+    if os.name == "posix":
+        try:
+            os.killpg(process.pid, signal.SIGKILL if kill else signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    elif kill:
+        process.kill()
+    else:
+        process.terminate()
+
+
+def _pump(stream: IO[str], name: str, lines: "queue.Queue[Optional[Tuple[str, str]]]") -> None:
+    try:
+        for line in stream:
+            lines.put((name, line.rstrip("\r\n")))  # Blocks while the consumer lags behind
+    finally:
+        stream.close()
+        lines.put(_EOF)
+
+
+def run_streaming(
+    args: Sequence[str],
+    on_line: Callable[[str, str], None],
+    cwd: Optional[Path] = None,
+    timeout: Optional[float] = COMMAND_TIMEOUT,
+    idle_timeout: Optional[float] = COMMAND_IDLE_TIMEOUT,
+    tail_lines: int = TAIL_LINES,
+    on_start: Optional[Callable[[subprocess.Popen], None]] = None,
+) -> StreamResult:
+    """Run ``args`` and hand every output line to ``on_line(stream, line)`` as it arrives.
+
+    ``stream`` is ``"stdout"`` or ``"stderr"``. Only the last ``tail_lines``
+    are kept. Raises ``subprocess.TimeoutExpired`` after ``timeout`` seconds
+    in total and :class:`IdleTimeoutExpired` after ``idle_timeout`` seconds
+    without output; the process is killed in both cases, and also when
+    ``on_line`` raises.
+    """
+
+    start = time.monotonic()
+    process = subprocess.Popen(
+        list(args),
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        start_new_session=os.name == "posix",  # Own process group, see terminate()
+    )
+    if on_start is not None:
+        on_start(process)
+
+    lines: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue(maxsize=QUEUE_SIZE)
+    readers = [
+        threading.Thread(target=_pump, args=(process.stdout, "stdout", lines), daemon=True),
+        threading.Thread(target=_pump, args=(process.stderr, "stderr", lines), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    tail: Deque[str] = deque(maxlen=tail_lines)
+    stderr_tail: Deque[str] = deque(maxlen=tail_lines)
+    open_streams = len(readers)
+    last_output = start
+
+    stopped = False
+
+    def stop() -> None:
+        nonlocal stopped
+        stopped = True
+        terminate(process, kill=True)
+        # Unblock the readers so their threads and pipes go away
+        deadline = time.monotonic() + _DRAIN_TIMEOUT
+        remaining_streams = open_streams
+        while remaining_streams and time.monotonic() < deadline:
+            try:
+                item = lines.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if item is _EOF:
+                remaining_streams -= 1
+            else:
+                tail.append(item[1])
+        process.wait()
+
+    def kill(error: subprocess.TimeoutExpired) -> None:
+        stop()
+        error.output = "\n".join(tail)
+        error.stderr = "\n".join(stderr_tail)
+        raise error
+
+    try:
+        while open_streams:
+            now = time.monotonic()
+            waits = []
+            if timeout is not None:
+                waits.append(start + timeout - now)
+            if idle_timeout is not None:
+                waits.append(last_output + idle_timeout - now)
+            wait = min(waits) if waits else None
+            if wait is not None and wait <= 0:
+                if timeout is not None and now - start >= timeout:
+                    kill(subprocess.TimeoutExpired(list(args), timeout))
+                kill(IdleTimeoutExpired(list(args), idle_timeout))
+
+            try:
+                item = lines.get(timeout=wait)
+            except queue.Empty:
+                continue
+            if item is _EOF:
+                open_streams -= 1
+                continue
+
+            last_output = time.monotonic()
+            stream, line = item
+            tail.append(line)
+            if stream == "stderr":
+                stderr_tail.append(line)
+            on_line(stream, line)
+
+        remaining = None if timeout is None else max(0.0, start + timeout - time.monotonic())
+        try:
+            returncode = process.wait(timeout=remaining)
+        except subprocess.TimeoutExpired:
+            kill(subprocess.TimeoutExpired(list(args), timeout))
+    except BaseException:
+        # A failing on_line (or an interrupt) must not leave the process group running
+        if not stopped:
+            stop()
+        raise
+
+    return StreamResult(
+        args=list(args),
+        returncode=returncode,
+        duration=time.monotonic() - start,
+        tail=list(tail),
+        stderr_tail=list(stderr_tail),
+    )
+
+
+__all__ = ["IdleTimeoutExpired", "StreamResult", "run_streaming", "terminate"]
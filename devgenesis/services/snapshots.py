@@ -0,0 +1,133 @@
+"""Cache of rendered project trees reused for identical generations."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from devgenesis.config import SNAPSHOT_CACHE_DIR, SNAPSHOT_CACHE_MAX_ENTRIES
+from devgenesis.plan import GenerationPlan
+from devgenesis.services.filesystem import clone_tree
+
+SNAPSHOT_FORMAT_VERSION = 2
+_TREE_DIR = "tree"
+_PLAN_FILE = "plan.json"
+
+
+def snapshot_key(plan: GenerationPlan) -> str:
+    """Digest of everything that shapes the rendered tree.
+
+    Combines the hash of the rendered files and commands, the rendering
+    context and the generation options, so any change produces a different
+    key. The rendered hash rather than the template sources is used because
+    a plan loaded from JSON no longer carries its template's files.
+    """
+
+    config = plan.config
+    payload = {
+        "format": SNAPSHOT_FORMAT_VERSION,
+        "content_hash": plan.content_hash,
+        "directories": list(plan.directories),
+        "context": plan.context,
+        "options": {
+            "git_init": config.git_init,
+            "create_venv": config.create_venv,
+            "run_commands": config.run_commands,
+        },
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=20).hexdigest()
+
+
+class SnapshotCache:
+    """Rendered trees stored under ``~/.devgenesis/snapshots/<key>``.
+
+    Each entry holds the materialised ``tree`` and the ``plan.json`` it was
+    written from. Entries are published with an atomic rename, so concurrent
+    generations never observe a half-written snapshot.
+    """
+
+    def __init__(
+        self, root: Path = SNAPSHOT_CACHE_DIR, max_entries: int = SNAPSHOT_CACHE_MAX_ENTRIES
+    ) -> None:
+        self.root = root
+        self.max_entries = max_entries
+
+    def _entry(self, key: str) -> Path:
+        return self.root / key
+
+    def contains(self, key: str) -> bool:
+        return (self._entry(key) / _PLAN_FILE).is_file()
+
+    def load_plan(self, key: str) -> Optional[GenerationPlan]:
+        """Return the plan stored with ``key``, or None on a miss or unreadable entry."""
+
+        plan_path = self._entry(key) / _PLAN_FILE
+        if not plan_path.is_file():
+            return None
+        try:
+            plan = GenerationPlan.load(plan_path)
+        except (OSError, ValueError, KeyError):
+            return None
+        os.utime(self._entry(key))  # Mark as recently used for pruning
+        return plan
+
+    def materialise(self, key: str, destination: Path) -> int:
+        """Clone the cached tree into ``destination``; returns the number of files."""
+
+        os.utime(self._entry(key))  # Mark as recently used for pruning
+        return clone_tree(self._entry(key) / _TREE_DIR, destination)
+
+    def store(self, key: str, tree: Path, plan: GenerationPlan) -> bool:
+        """Copy ``tree`` and its plan into the cache. Returns False if it already existed."""
+
+        if self.contains(key):
+            return False
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{key}-", dir=self.root))
+        try:
+            (staging / _TREE_DIR).mkdir()
+            clone_tree(tree, staging / _TREE_DIR)
+            plan.save(staging / _PLAN_FILE)
+            os.rename(staging, self._entry(key))
+        except OSError:
+            # Lost a race with another writer, or the cache is not writable
+            shutil.rmtree(staging, ignore_errors=True)
+            return False
+
+        self.prune()
+        return True
+
+    def prune(self) -> None:
+        """Drop the least recently used entries beyond ``max_entries``."""
+
+        try:
+            entries = [entry for entry in self.root.iterdir() if not entry.name.startswith(".")]
+        except OSError:
+            return
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[: len(entries) - self.max_entries]:
+            shutil.rmtree(entry, ignore_errors=True)
+
+
+_cache: Optional[SnapshotCache] = None
+
+
+def get_snapshot_cache() -> SnapshotCache:
+    """Return the default snapshot cache."""
+
+    global _cache
+    if _cache is None:
+        _cache = SnapshotCache()
+    return _cache
+
+
+__all__ = ["SnapshotCache", "get_snapshot_cache", "snapshot_key"]
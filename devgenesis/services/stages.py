@@ -0,0 +1,115 @@
+"""Dependency-ordered execution of post-generation stages on a thread pool."""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class Stage:
+    """A unit of work that may start once every stage in ``depends_on`` succeeded."""
+
+    name: str
+    action: Callable[[], None]
+    depends_on: Tuple[str, ...] = ()
+
+
+@dataclass
+class StageReport:
+    """Outcome of :func:`run_stages`."""
+
+    timings: Dict[str, float] = field(default_factory=dict)  # Seconds per completed stage
+    failed: Dict[str, BaseException] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)  # Never started: a dependency failed
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed and not self.skipped
+
+
+def _validate(stages: Sequence[Stage]) -> Dict[str, Stage]:
+    by_name: Dict[str, Stage] = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise ValueError(f"Étape en double: {stage.name}")
+        by_name[stage.name] = stage
+    for stage in stages:
+        for dependency in stage.depends_on:
+            if dependency not in by_name:
+                raise ValueError(f"L'étape {stage.name} dépend d'une étape inconnue: {dependency}")
+
+    # Kahn's algorithm, only to reject cycles before anything runs
+    remaining = {stage.name: set(stage.depends_on) for stage in stages}
+    while remaining:
+        ready = [name for name, dependencies in remaining.items() if not dependencies]
+        if not ready:
+            raise ValueError("Cycle entre les étapes: " + ", ".join(sorted(remaining)))
+        for name in ready:
+            del remaining[name]
+        for dependencies in remaining.values():
+            dependencies.difference_update(ready)
+    return by_name
+
+
+def run_stages(stages: Sequence[Stage], max_workers: Optional[int] = None) -> StageReport:
+    """Run ``stages`` as soon as their dependencies are done, independent ones in parallel.
+
+    A failing stage does not interrupt the others, but its dependents are
+    skipped. Exceptions are collected in the report rather than raised.
+    """
+
+    by_name = _validate(stages)
+    report = StageReport()
+    done: set = set()
+    started: set = set()
+
+    def timed(stage: Stage) -> float:
+        start = time.perf_counter()
+        stage.action()
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=max_workers or max(1, len(stages))) as executor:
+        running: Dict[Future, str] = {}
+
+        def submit_ready() -> None:
+            for stage in stages:
+                if stage.name in started:
+                    continue
+                if any(dependency in report.failed or dependency in report.skipped
+                       for dependency in stage.depends_on):
+                    started.add(stage.name)
+                    report.skipped.append(stage.name)
+                elif all(dependency in done for dependency in stage.depends_on):
+                    started.add(stage.name)
+                    running[executor.submit(timed, stage)] = stage.name
+
+        # Skips can cascade, so resubmit until the set of started stages is stable
+        previous = -1
+        while len(started) != previous:
+            previous = len(started)
+            submit_ready()
+
+        while running:
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                error = future.exception()
+                if error is None:
+                    report.timings[name] = future.result()
+                    done.add(name)
+                else:
+                    report.failed[name] = error
+            previous = -1
+            while len(started) != previous:
+                previous = len(started)
+                submit_ready()
+
+    # Keep the caller's declaration order in the report
+    report.timings = {name: report.timings[name] for name in by_name if name in report.timings}
+    return report
+
+
+__all__ = ["Stage", "StageReport", "run_stages"]
@@ -0,0 +1,257 @@
+"""Shared Jinja2 rendering engine with compiled-template caching."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+from devgenesis.config import (
+    TEMPLATE_BYTECODE_CACHE_DIR,
+    TEMPLATE_BYTECODE_CACHE_MAX_ENTRIES,
+    TEMPLATE_CACHE_SIZE,
+)
+
+
+if TYPE_CHECKING:
+    from jinja2 import Template
+
+_NEWLINE_RE = re.compile(r"(\r\n|\r|\n)")
+
+
+def content_hash(source: str) -> str:
+    """Return a stable digest identifying a template source."""
+
+    return hashlib.blake2b(source.encode("utf-8"), digest_size=20).hexdigest()
+
+
+def _literal_output(source: str) -> str:
+    """Return what Jinja2 would render for a source without any syntax.
+
+    Jinja normalises newlines and drops a single trailing newline, so the fast
+    path has to do the same to keep output byte-identical.
+    """
+
+    if "\n" not in source and "\r" not in source:
+        return source
+    lines = _NEWLINE_RE.split(source)[::2]
+    if lines[-1] == "":
+        del lines[-1]
+    return "\n".join(lines)
+
+
+def _prune_bytecode_cache(directory: Path, max_entries: int) -> None:
+    """Delete the oldest Jinja2 bytecode files beyond ``max_entries``."""
+
+    entries = []
+    try:
+        with os.scandir(directory) as scan:
+            for entry in scan:
+                if entry.name.startswith("__jinja2_") and entry.name.endswith(".cache"):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        continue
+    except OSError:
+        return
+    if len(entries) <= max_entries:
+        return
+    entries.sort()
+    for _, path in entries[: len(entries) - max_entries]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass  # Already removed by another process
+
+
+@dataclass(frozen=True)
+class PreparedText:
+    """A template source classified once as literal or templated."""
+
+    source: str
+    literal: Optional[str] = None  # Rendered output when the source has no Jinja syntax
+
+    @property
+    def is_literal(self) -> bool:
+        return self.literal is not None
+
+    def render(self, context: Dict[str, Any]) -> str:
+        """Render the text, bypassing Jinja2 entirely for literals."""
+
+        if self.literal is not None:
+            return self.literal
+        return get_template_engine().render(self.source, context)
+
+
+class TemplateEngine:
+    """Render Jinja2 sources through one environment and an LRU of compiled templates."""
+
+    def __init__(
+        self,
+        cache_size: int = TEMPLATE_CACHE_SIZE,
+        bytecode_cache_dir: Optional[Path] = None,
+        bytecode_cache_max_entries: int = TEMPLATE_BYTECODE_CACHE_MAX_ENTRIES,
+    ) -> None:
+        from jinja2 import Environment, FileSystemBytecodeCache
+
+        bytecode_cache = None
+        if bytecode_cache_dir is not None:
+            try:
+                bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+                _prune_bytecode_cache(bytecode_cache_dir, bytecode_cache_max_entries)
+                bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+            except OSError:
+                bytecode_cache = None
+
+        # Same defaults as ``jinja2.Template(source)`` so rendered output is unchanged.
+        self.environment = Environment(bytecode_cache=bytecode_cache)
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._templates: "OrderedDict[str, Template]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_template(self, source: str) -> Template:
+        """Return the compiled template for ``source``, compiling it at most once."""
+
+        key = content_hash(source)
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+                return template
+            self.misses += 1
+
+        template = self._compile(key, source)
+
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.cache_size:
+                self._templates.popitem(last=False)
+        return template
+
+    def render(self, source: str, context: Dict[str, Any]) -> str:
+        """Render ``source`` with the given context."""
+
+        return self.get_template(source).render(**context)
+
+    def generate(self, source: str, context: Dict[str, Any]) -> Iterator[str]:
+        """Yield the rendered output of ``source`` chunk by chunk."""
+
+        return self.get_template(source).generate(**context)
+
+    def render_prefix(self, source: str, context: Dict[str, Any], limit: int) -> str:
+        """Render at most ``limit`` characters, stopping the template early."""
+
+        chunks = []
+        size = 0
+        stream = self.generate(source, context)
+        try:
+            for chunk in stream:
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= limit:
+                    break
+        finally:
+            stream.close()
+        return "".join(chunks)[:limit]
+
+    def is_literal(self, source: str) -> bool:
+        """Return True when ``source`` contains no Jinja2 delimiters."""
+
+        environment = self.environment
+        return (
+            environment.variable_start_string not in source
+            and environment.block_start_string not in source
+            and environment.comment_start_string not in source
+        )
+
+    def prepare(self, source: str) -> PreparedText:
+        """Classify ``source`` so later renders can skip the template engine."""
+
+        if self.is_literal(source):
+            return PreparedText(source, _literal_output(source))
+        return PreparedText(source)
+
+    def cache_info(self) -> Dict[str, int]:
+        """Return hit/miss counters for the in-memory cache."""
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._templates),
+                "max_size": self.cache_size,
+            }
+
+    def clear(self) -> None:
+        """Drop every compiled template held in memory."""
+
+        with self._lock:
+            self._templates.clear()
+
+    def _compile(self, key: str, source: str) -> Template:
+        environment = self.environment
+        bytecode_cache = environment.bytecode_cache
+        if bytecode_cache is None:
+            return environment.from_string(source)
+
+        # Mirrors ``BaseLoader.load`` so compiled code is shared across processes.
+        bucket = bytecode_cache.get_bucket(environment, key, None, source)
+        code = bucket.code
+        if code is None:
+            code = environment.compile(source)
+            bucket.code = code
+            try:
+                bytecode_cache.set_bucket(bucket)
+            except OSError:
+                pass
+
+        return environment.template_class.from_code(
+            environment, code, environment.make_globals(None)
+        )
+
+
+_engine: Optional[TemplateEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_template_engine() -> TemplateEngine:
+    """Return the process-wide template engine.
+
+    The on-disk bytecode cache under ``~/.devgenesis`` is enabled unless the
+    ``DEVGENESIS_BYTECODE_CACHE`` environment variable is set to ``0``; its
+    oldest files are pruned when the engine is created.
+    """
+
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                use_bytecode_cache = os.environ.get("DEVGENESIS_BYTECODE_CACHE", "1") != "0"
+                _engine = TemplateEngine(
+                    bytecode_cache_dir=TEMPLATE_BYTECODE_CACHE_DIR if use_bytecode_cache else None
+                )
+    return _engine
+
+
+def render_source(source: str, context: Dict[str, Any]) -> str:
+    """Render ``source`` with the process-wide engine (picklable for process pools)."""
+
+    return get_template_engine().render(source, context)
+
+
+__all__ = [
+    "PreparedText",
+    "TemplateEngine",
+    "content_hash",
+    "get_template_engine",
+    "render_source",
+]
@@ -0,0 +1,268 @@
+"""Pool of ready-made virtual environments, and moving venvs between directories."""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Iterator, Optional
+
+from devgenesis.config import EXIT_DRAIN_TIMEOUT, VENV_POOL_DIR, VENV_POOL_SIZE
+from devgenesis.services.filesystem import clone_tree
+from devgenesis.services.process import terminate
+
+_BUILDING_PREFIX = ".building-"
+_STALE_BUILD_SECONDS = 3600  # A build left behind by a process that exited mid-way
+_MAX_RELOCATED_SIZE = 1024 * 1024  # Scripts and .pth files are tiny; skip anything large
+
+
+def _relocatable_files(venv: Path) -> Iterator[Path]:
+    """Text files in which a venv records absolute paths."""
+
+    yield venv / "pyvenv.cfg"
+    for directory in (venv / "bin", venv / "Scripts"):
+        if directory.is_dir():
+            yield from directory.iterdir()
+    for site_packages in (*venv.glob("lib/python*/site-packages"), venv / "Lib" / "site-packages"):
+        if not site_packages.is_dir():
+            continue
+        # .pth files and editable finders point at the project sources
+        yield from site_packages.glob("*.pth")
+        yield from site_packages.glob("__editable__*.py")
+        yield from site_packages.glob("*.dist-info/direct_url.json")
+
+
+def relocate_venv(venv: Path, old_root: Path, new_root: Path) -> int:
+    """Rewrite absolute paths under ``old_root`` to ``new_root`` inside ``venv``.
+
+    Covers the activation scripts, console-script shebangs, ``pyvenv.cfg``
+    and editable-install hooks. The venv itself is not moved. Returns the
+    number of files rewritten.
+    """
+
+    old = os.fsencode(old_root)
+    new = os.fsencode(new_root)
+    rewritten = 0
+    for path in _relocatable_files(venv):
+        try:
+            if path.is_symlink() or not path.is_file() or path.stat().st_size > _MAX_RELOCATED_SIZE:
+                continue
+            data = path.read_bytes()
+            if old not in data:
+                continue
+            mode = path.stat().st_mode
+            path.write_bytes(data.replace(old, new))
+            os.chmod(path, mode)
+            rewritten += 1
+        except OSError:
+            continue
+    return rewritten
+
+
+@functools.lru_cache(maxsize=None)
+def _interpreter_tag(python: str) -> Optional[str]:
+    """Identify the interpreter ``python`` resolves to, so pooled venvs never mix versions."""
+
+    try:
+        result = subprocess.run(
+            [python, "-c", "import sys; print(sys.executable); print(sys.version)"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    digest = hashlib.blake2b(result.stdout.encode("utf-8"), digest_size=8).hexdigest()
+    version = result.stdout.splitlines()[-1].split()[0] if result.stdout.strip() else "unknown"
+    return f"{version}-{digest}"
+
+
+class VenvPool:
+    """Virtual environments built ahead of time under ``~/.devgenesis/venv-pool/<interpreter>``.
+
+    Taking a venv is a rename (a clone across filesystems) followed by a
+    path fix-up, instead of ``python -m venv`` and its ensurepip bootstrap.
+    The pool is refilled on a background thread. Each venv is built in a
+    staging directory and renamed into the pool once complete.
+    """
+
+    def __init__(
+        self, root: Path = VENV_POOL_DIR, size: int = VENV_POOL_SIZE, python: str = "python"
+    ) -> None:
+        self.root = root
+        self.size = size
+        self.python = python
+        self._refill_lock = threading.Lock()
+        self._refill_thread: Optional[threading.Thread] = None
+        self._building: Optional[subprocess.Popen] = None
+        self._stop = threading.Event()
+        self._drain_registered = False
+
+    def _directory(self) -> Optional[Path]:
+        tag = _interpreter_tag(self.python)
+        return None if tag is None else self.root / tag
+
+    def ready(self) -> int:
+        """Number of venvs waiting in the pool."""
+
+        directory = self._directory()
+        if directory is None or not directory.is_dir():
+            return 0
+        return sum(1 for entry in directory.iterdir() if not entry.name.startswith("."))
+
+    def acquire(self, destination: Path) -> bool:
+        """Move a pooled venv to ``destination``; False when the pool is empty.
+
+        Either way a refill is scheduled.
+        """
+
+        directory = self._directory()
+        if directory is None:
+            return False
+        try:
+            try:
+                entries = sorted(e for e in directory.iterdir() if not e.name.startswith("."))
+            except OSError:
+                return False
+            for entry in entries:
+                if self._take(entry, destination):
+                    return True
+            return False
+        finally:
+            self.refill_async()
+
+    def _take(self, entry: Path, destination: Path) -> bool:
+        try:
+            os.rename(entry, destination)
+        except FileNotFoundError:
+            return False  # Another generation took it first
+        except OSError:
+            # Different filesystem: claim the entry, then copy it
+            claimed = entry.with_name(f".claimed-{uuid.uuid4().hex}")
+            try:
+                os.rename(entry, claimed)
+            except OSError:
+                return False
+            try:
+                destination.mkdir()
+                clone_tree(claimed, destination)
+            finally:
+                shutil.rmtree(claimed, ignore_errors=True)
+        relocate_venv(destination, entry, destination)
+        return True
+
+    def fill(self) -> int:
+        """Build venvs until the pool holds ``size`` of them; returns how many were built."""
+
+        directory = self._directory()
+        if directory is None:
+            return 0
+        directory.mkdir(parents=True, exist_ok=True)
+        self._remove_stale_builds(directory)
+
+        built = 0
+        while self.ready() < self.size:
+            staging = Path(tempfile.mkdtemp(prefix=_BUILDING_PREFIX, dir=directory))
+            venv = staging / "venv"
+            try:
+                with self._refill_lock:
+                    if self._stop.is_set():
+                        break
+                    process = subprocess.Popen(
+                        [self.python, "-m", "venv", str(venv)],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        start_new_session=os.name == "posix",  # ensurepip runs in a child
+                    )
+                    self._building = process
+                if process.wait() != 0:
+                    return built  # Failed, or killed by drain()
+                final = directory / uuid.uuid4().hex
+                relocate_venv(venv, venv, final)
+                os.rename(venv, final)
+            except OSError:
+                return built
+            finally:
+                self._building = None
+                shutil.rmtree(staging, ignore_errors=True)
+            built += 1
+        return built
+
+    @staticmethod
+    def _remove_stale_builds(directory: Path) -> None:
+        now = time.time()
+        for entry in directory.iterdir():
+            if not entry.name.startswith("."):
+                continue
+            try:
+                if now - entry.stat().st_mtime > _STALE_BUILD_SECONDS:
+                    shutil.rmtree(entry, ignore_errors=True)
+            except OSError:
+                continue
+
+    def refill_async(self) -> None:
+        """Top the pool up on a daemon thread, unless a refill is already running.
+
+        At interpreter exit the venv being built gets ``EXIT_DRAIN_TIMEOUT``
+        seconds to finish before it is cancelled; the rest are skipped.
+        """
+
+        with self._refill_lock:
+            if self._refill_thread is not None and self._refill_thread.is_alive():
+                return
+            self._refill_thread = threading.Thread(
+                target=self.fill, name="devgenesis-venv-pool", daemon=True
+            )
+            if not self._drain_registered:
+                atexit.register(self.drain, EXIT_DRAIN_TIMEOUT)
+                self._drain_registered = True
+            self._refill_thread.start()
+
+    def drain(self, timeout: Optional[float] = None) -> None:
+        """Let a running refill finish its current venv, then stop it.
+
+        After ``timeout`` seconds the venv being built is abandoned instead.
+        """
+
+        with self._refill_lock:
+            thread = self._refill_thread
+            self._stop.set()
+        if thread is None:
+            self._stop.clear()
+            return
+        try:
+            thread.join(timeout)
+            if thread.is_alive():
+                with self._refill_lock:
+                    if self._building is not None:
+                        terminate(self._building, kill=True)
+                thread.join()
+        finally:
+            self._stop.clear()
+
+
+_pool: Optional[VenvPool] = None
+
+
+def get_venv_pool() -> Optional[VenvPool]:
+    """Return the default venv pool, or None when ``DEVGENESIS_VENV_POOL=0`` or on Windows."""
+
+    global _pool
+    if os.environ.get("DEVGENESIS_VENV_POOL") == "0" or os.name == "nt":
+        # Windows console scripts are .exe launchers with the venv path compiled in
+        return None
+    if _pool is None:
+        _pool = VenvPool()
+    return _pool
+
+
+__all__ = ["VenvPool", "get_venv_pool", "relocate_venv"]
@@ -0,0 +1,378 @@
+"""Local wheelhouse so Python templates install without reaching an index."""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import functools
+import hashlib
+import json
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from devgenesis.config import EXIT_DRAIN_TIMEOUT, WHEELHOUSE_DIR, WHEELHOUSE_PREFETCH_TIMEOUT
+from devgenesis.services.dependency_cache import platform_tag
+from devgenesis.services.process import terminate
+
+_INDEX_FILE = "index.json"
+_REQUIREMENT_FLAGS = ("-r", "--requirement")
+_STAGING_PREFIX = ".wheels-"  # pip --find-links does not look inside these
+_STALE_STAGING_AGE = 24 * 3600  # Seconds before a leftover staging directory is removed
+
+
+def _minor_version(version: Optional[str]) -> Optional[str]:
+    if not version:
+        return None
+    return ".".join(version.split(".")[:2])
+
+
+@functools.lru_cache(maxsize=None)
+def interpreter_version(python: str) -> Optional[str]:
+    """``major.minor`` of the interpreter ``python`` resolves to."""
+
+    try:
+        result = subprocess.run(
+            [python, "-c", "import sys; print('%d.%d' % sys.version_info[:2])"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def _pip_install_position(args: Sequence[str]) -> Optional[int]:
+    """Index of ``install`` in ``pip install ...`` or ``python -m pip install ...``."""
+
+    if len(args) >= 2 and Path(args[0]).name.lower().startswith("pip") and args[1] == "install":
+        return 1
+    if len(args) >= 4 and list(args[1:4]) == ["-m", "pip", "install"]:
+        return 3
+    return None
+
+
+def is_pip_install(args: Sequence[str]) -> bool:
+    return _pip_install_position(args) is not None
+
+
+def requirements_file(args: Sequence[str]) -> Optional[str]:
+    """The single ``-r FILE`` of a pip install command, if it has exactly one."""
+
+    files = [
+        args[index + 1]
+        for index, arg in enumerate(args[:-1])
+        if arg in _REQUIREMENT_FLAGS
+    ]
+    return files[0] if len(files) == 1 else None
+
+
+class Wheelhouse:
+    """Wheels collected under ``~/.devgenesis/wheelhouse``.
+
+    ``index.json`` records which requirement sets (per Python version and
+    platform) the directory fully satisfies, so pip is only pointed at the
+    wheelhouse alone when it is known to succeed.
+    """
+
+    def __init__(self, root: Path = WHEELHOUSE_DIR) -> None:
+        self.root = root
+        self._lock = threading.Lock()
+        self._collecting: set = set()
+        self._threads: List[threading.Thread] = []
+        self._downloads: set = set()  # Running "pip wheel" processes
+        self._cancelled = threading.Event()
+        self._drain_registered = False
+
+    @staticmethod
+    def key(requirements: str, python_version: str) -> str:
+        payload = json.dumps(
+            {
+                "requirements": sorted(
+                    line.strip() for line in requirements.splitlines() if line.strip()
+                ),
+                "python": _minor_version(python_version),
+                "platform": platform_tag(),
+            },
+            sort_keys=True,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+    def _load_index(self) -> Dict[str, Any]:
+        try:
+            with open(self.root / _INDEX_FILE, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _record(self, key: str, requirements: str, python_version: str) -> None:
+        with self._lock:
+            index = self._load_index()
+            index[key] = {
+                "python": _minor_version(python_version),
+                "requirements": requirements,
+                "collected_at": datetime.now().isoformat(),
+            }
+            fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=".index-")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(index, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_name, self.root / _INDEX_FILE)
+
+    def satisfies(self, requirements: str, python_version: str) -> bool:
+        return self.key(requirements, python_version) in self._load_index()
+
+    def install_args(self, args: Sequence[str]) -> List[str]:
+        """``args`` with pip restricted to the wheelhouse (no-op for non-pip commands)."""
+
+        position = _pip_install_position(args)
+        if position is None:
+            return list(args)
+        return [
+            *args[: position + 1],
+            "--no-index",
+            "--find-links",
+            str(self.root),
+            *args[position + 1 :],
+        ]
+
+    def prefetch(
+        self,
+        requirements: str,
+        python: str = "python",
+        timeout: Optional[float] = WHEELHOUSE_PREFETCH_TIMEOUT,
+    ) -> bool:
+        """Download or build every wheel ``requirements`` needs, dependencies included.
+
+        Gives up after ``timeout`` seconds, e.g. on a stalled network.
+        """
+
+        version = interpreter_version(python)
+        if version is None:
+            return False
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._remove_stale_staging()
+        # pip writes into a staging directory; only complete wheels are renamed into place
+        staging = Path(tempfile.mkdtemp(prefix=_STAGING_PREFIX, dir=self.root))
+        requirements_path = staging / "requirements.txt"
+        try:
+            requirements_path.write_text(requirements, encoding="utf-8")
+            command = [
+                python,
+                "-m",
+                "pip",
+                "wheel",
+                "--quiet",
+                "-r",
+                str(requirements_path),
+                "-w",
+                str(staging),
+            ]
+            with self._lock:
+                if self._cancelled.is_set():
+                    return False
+                process = subprocess.Popen(
+                    command,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=os.name == "posix",  # pip may spawn build backends
+                )
+                self._downloads.add(process)
+            try:
+                returncode = process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                terminate(process, kill=True)
+                process.wait()
+                return False
+            finally:
+                with self._lock:
+                    self._downloads.discard(process)
+            if returncode != 0:
+                return False
+            for wheel in staging.glob("*.whl"):
+                os.replace(wheel, self.root / wheel.name)
+        except (OSError, subprocess.SubprocessError):
+            return False
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        self._record(self.key(requirements, version), requirements, version)
+        return True
+
+    def _remove_stale_staging(self) -> None:
+        """Delete staging directories left behind by a process killed mid-download."""
+
+        cutoff = time.time() - _STALE_STAGING_AGE
+        for staging in self.root.glob(f"{_STAGING_PREFIX}*"):
+            try:
+                if staging.stat().st_mtime < cutoff:
+                    shutil.rmtree(staging, ignore_errors=True)
+            except OSError:
+                continue
+
+    def collect_async(self, requirements: str, python: str = "python") -> None:
+        """Prefetch ``requirements`` on a background thread after an online install.
+
+        At interpreter exit, pending collections get ``EXIT_DRAIN_TIMEOUT``
+        seconds to finish before they are cancelled.
+        """
+
+        with self._lock:
+            if requirements in self._collecting:
+                return
+            self._collecting.add(requirements)
+
+        def collect() -> None:
+            try:
+                self.prefetch(requirements, python)
+            finally:
+                with self._lock:
+                    self._collecting.discard(requirements)
+
+        thread = threading.Thread(target=collect, name="devgenesis-wheelhouse", daemon=True)
+        with self._lock:
+            self._threads = [running for running in self._threads if running.is_alive()]
+            self._threads.append(thread)
+            if not self._drain_registered:
+                atexit.register(self.drain, EXIT_DRAIN_TIMEOUT)
+                self._drain_registered = True
+        thread.start()
+
+    def drain(self, timeout: Optional[float] = None) -> None:
+        """Block until every background collection has finished.
+
+        Downloads still running after ``timeout`` seconds are cancelled.
+        """
+
+        with self._lock:
+            threads = list(self._threads)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+        if not any(thread.is_alive() for thread in threads):
+            return
+        with self._lock:
+            self._cancelled.set()
+            for process in self._downloads:
+                terminate(process, kill=True)
+        try:
+            for thread in threads:
+                thread.join()
+        finally:
+            self._cancelled.clear()
+
+    def entries(self) -> Dict[str, Any]:
+        return self._load_index()
+
+
+def _template_requirements(template: Dict[str, Any]) -> List[str]:
+    """Rendered requirement files installed by a template's pip commands."""
+
+    from devgenesis.generator import build_generation_plan
+
+    with tempfile.TemporaryDirectory() as directory:
+        plan = build_generation_plan(
+            template,
+            "wheelhouse",
+            str(Path(directory) / "wheelhouse"),
+            git_init=False,
+            create_venv=False,
+            install_deps=True,
+        )
+    files = {planned.path: planned for planned in plan.files if not planned.is_asset}
+    found: List[str] = []
+    for command in plan.commands:
+        run = command if isinstance(command, str) else command.run
+        cwd = "" if isinstance(command, str) or not command.cwd else command.cwd.rstrip("/") + "/"
+        name = requirements_file(shlex.split(run))
+        if name is not None and cwd + name in files:
+            planned = files[cwd + name]
+            found.append(
+                planned.prefix(plan.context, sys.maxsize) if planned.is_streamed else planned.text()
+            )
+    return found
+
+
+_wheelhouse: Optional[Wheelhouse] = None
+
+
+def get_wheelhouse() -> Wheelhouse:
+    """Return the default wheelhouse."""
+
+    global _wheelhouse
+    if _wheelhouse is None:
+        _wheelhouse = Wheelhouse()
+    return _wheelhouse
+
+
+def main(argv: Optional[Sequence[str]] = None, output: Callable[[str], None] = print) -> int:
+    """Fill the wheelhouse ahead of time, e.g. on a build host before going offline."""
+
+    parser = argparse.ArgumentParser(
+        prog="devgenesis-wheelhouse",
+        description="Prépare le wheelhouse local pour des installations pip hors ligne",
+    )
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    prefetch = subcommands.add_parser("prefetch", help="Télécharger les wheels nécessaires")
+    prefetch.add_argument(
+        "templates", nargs="*", help="Noms de templates intégrés (tous par défaut)"
+    )
+    prefetch.add_argument(
+        "-r", "--requirement", action="append", default=[], type=Path, help="Fichier requirements"
+    )
+    prefetch.add_argument("--python", default="python", help="Interpréteur cible")
+    subcommands.add_parser("list", help="Lister les ensembles de dépendances disponibles")
+    args = parser.parse_args(argv)
+
+    wheelhouse = get_wheelhouse()
+    if args.command == "list":
+        for key, entry in sorted(wheelhouse.entries().items()):
+            packages = [line for line in entry["requirements"].splitlines() if line.strip()]
+            output(f"{key[:12]}  python {entry['python']}  {len(packages)} paquet(s)")
+        output(f"Wheelhouse: {wheelhouse.root}")
+        return 0
+
+    requirement_sets: List[str] = [path.read_text(encoding="utf-8") for path in args.requirement]
+    if args.templates or not args.requirement:
+        from devgenesis.templates.builtin_templates import get_all_builtin_templates
+
+        wanted = {name.lower() for name in args.templates}
+        for template in get_all_builtin_templates():
+            if wanted and template["name"].lower() not in wanted:
+                continue
+            try:
+                requirement_sets.extend(_template_requirements(template))
+            except ValueError as exc:
+                output(f"ERREUR {template['name']}: {exc}")
+
+    status = 0
+    for requirements in requirement_sets:
+        ok = wheelhouse.prefetch(requirements, args.python)
+        packages = len([line for line in requirements.splitlines() if line.strip()])
+        output(f"{'OK' if ok else 'ÉCHEC'}: {packages} paquet(s)")
+        status = status or (0 if ok else 1)
+    return status
+
+
+__all__ = [
+    "Wheelhouse",
+    "get_wheelhouse",
+    "interpreter_version",
+    "is_pip_install",
+    "main",
+    "requirements_file",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
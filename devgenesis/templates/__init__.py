@@ -1,5 +1,12 @@
 """Template system for DevGenesis"""
 
-from .builtin_templates import get_all_builtin_templates, get_template_by_name
-
 __all__ = ["get_all_builtin_templates", "get_template_by_name"]
+
+
+def __getattr__(name):
+    # The builtin catalog is large; load it when a template is first asked for
+    if name in __all__:
+        from . import builtin_templates
+
+        return getattr(builtin_templates, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
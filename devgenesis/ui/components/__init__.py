@@ -1,5 +1,6 @@
 """UI Components for DevGenesis"""
 
 from .header import HeaderWidget
+from .lazy_tab import LazyTab
 
-__all__ = ["HeaderWidget"]
+__all__ = ["HeaderWidget", "LazyTab"]
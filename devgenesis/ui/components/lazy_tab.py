@@ -0,0 +1,39 @@
+"""Tab page whose content is built the first time it is shown."""
+
+from __future__ import annotations
+
+import time
+from typing import Callable
+
+from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+from devgenesis.logger import get_logger
+
+
+class LazyTab(QWidget):
+    """Empty page standing in a QTabWidget until :meth:`widget` builds the real one."""
+
+    def __init__(self, name: str, factory: Callable[[], QWidget], parent: QWidget | None = None):
+        super().__init__(parent)
+        self.name = name
+        self._factory = factory
+        self._widget: QWidget | None = None
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    @property
+    def is_built(self) -> bool:
+        return self._widget is not None
+
+    def widget(self) -> QWidget:
+        """Return the page content, building it on first call."""
+        if self._widget is None:
+            started = time.perf_counter()
+            self._widget = self._factory()
+            self.layout().addWidget(self._widget)
+            get_logger("ui").info(
+                "Onglet %s construit en %.0f ms",
+                self.name,
+                (time.perf_counter() - started) * 1000,
+            )
+        return self._widget
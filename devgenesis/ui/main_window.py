@@ -1,8 +1,10 @@
 """Main window for DevGenesis application - Refactored version."""
 
-from typing import Any, Dict, Optional
+from __future__ import annotations
 
-from PySide6.QtCore import QObject, QThread, Signal, Slot
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+from PySide6.QtCore import QObject, QThread, QTimer, Signal, Slot
 from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -14,14 +16,19 @@ from PySide6.QtWidgets import (
 )
 
 from devgenesis.config import UI_CONFIG
-from devgenesis.database import DatabaseService
+from devgenesis.custom_config import CustomProjectConfig
 from devgenesis.generator import generate_project_from_template
+from devgenesis.logger import get_logger
+from devgenesis.ui.startup import DatabaseLoader, StartupData, StartupTimer
 from devgenesis.ui.styles import get_theme
 
 # Import refactored components
-from devgenesis.ui.components import HeaderWidget
+from devgenesis.ui.components import HeaderWidget, LazyTab
 from devgenesis.ui.tabs import CustomTemplateTab, HistoryTab, NewProjectTab, SettingsTab, TemplatesTab
 
+if TYPE_CHECKING:
+    from devgenesis.database import DatabaseService
+
 
 class GenerationWorker(QObject):
     """Worker object responsible for project generation."""
@@ -46,6 +53,7 @@ class GenerationWorker(QObject):
                 create_venv=self._config.get("create_venv", True),
                 install_deps=self._config.get("install_deps", True),
                 progress_callback=self._handle_progress,
+                plan=self._config.get("plan"),
             )
             self.finished.emit(success)
         except Exception as exc:  # pragma: no cover - defensive
@@ -59,14 +67,21 @@ class GenerationWorker(QObject):
 class MainWindow(QMainWindow):
     """Main application window - Refactored to use component-based architecture"""
 
-    def __init__(self):
+    def __init__(self, startup: Optional[StartupTimer] = None):
         super().__init__()
-        self.db = DatabaseService()
+        self.startup = startup or StartupTimer()
+        # Opened by DatabaseLoader after the first paint; tabs show a loading state until then
+        self.db: Optional[DatabaseService] = None
         self.generator_thread: Optional[QThread] = None
         self.generation_worker: Optional[GenerationWorker] = None
+        self.loader_thread: Optional[QThread] = None
+        self.database_loader: Optional[DatabaseLoader] = None
+        self._first_show = True
+        self._pages: Dict[str, LazyTab] = {}
         self.theme = "dark"
 
         self.init_ui()
+        self.startup.mark("fenêtre construite")
 
     def init_ui(self):
         """Initialize the user interface"""
@@ -103,33 +118,153 @@ class MainWindow(QMainWindow):
 
         main_layout.addWidget(content_widget)
 
-        # Create tabs using refactored components
-        self.new_project_tab = NewProjectTab(self.db)
-        self.new_project_tab.generate_requested.connect(self.on_generate_project)
-        
-        self.templates_tab = TemplatesTab(self.db)
-        self.custom_template_tab = CustomTemplateTab(self.db)
-        self.history_tab = HistoryTab(self.db)
-        self.settings_tab = SettingsTab(self.db)
-
-        # Add tabs to tab widget
-        self._add_tab(self.new_project_tab, QStyle.SP_FileDialogNewFolder, "Nouveau projet")
-        self._add_tab(self.templates_tab, QStyle.SP_FileDialogListView, "Templates")
-        self._add_tab(self.custom_template_tab, QStyle.SP_FileDialogDetailedView, "Créer template")
-        self._add_tab(self.history_tab, QStyle.SP_FileDialogInfoView, "Historique")
-        self._add_tab(self.settings_tab, QStyle.SP_FileDialogContentsView, "Paramètres")
+        # Tabs are placeholders until first shown; only the visible one is built at startup
+        self._add_tab(
+            "new_project",
+            self._build_new_project_tab,
+            QStyle.SP_FileDialogNewFolder,
+            "Nouveau projet",
+        )
+        self._add_tab(
+            "templates", lambda: TemplatesTab(self.db), QStyle.SP_FileDialogListView, "Templates"
+        )
+        self._add_tab(
+            "custom_template",
+            lambda: CustomTemplateTab(CustomProjectConfig()),
+            QStyle.SP_FileDialogDetailedView,
+            "Créer template",
+        )
+        self._add_tab(
+            "history", lambda: HistoryTab(self.db), QStyle.SP_FileDialogInfoView, "Historique"
+        )
+        self._add_tab(
+            "settings", lambda: SettingsTab(self.db), QStyle.SP_FileDialogContentsView, "Paramètres"
+        )
+        self.tabs.currentChanged.connect(self._on_current_tab_changed)
+        self._on_current_tab_changed(self.tabs.currentIndex())
 
         self._register_shortcuts()
 
-    def _add_tab(self, widget: QWidget, icon_name: QStyle.StandardPixmap, label: str) -> None:
+    def _build_new_project_tab(self) -> NewProjectTab:
+        tab = NewProjectTab(self.db)
+        tab.generate_requested.connect(self.on_generate_project)
+        return tab
+
+    @property
+    def new_project_tab(self) -> NewProjectTab:
+        return self._pages["new_project"].widget()
+
+    @property
+    def templates_tab(self) -> TemplatesTab:
+        return self._pages["templates"].widget()
+
+    @property
+    def custom_template_tab(self) -> CustomTemplateTab:
+        return self._pages["custom_template"].widget()
+
+    @property
+    def history_tab(self) -> HistoryTab:
+        return self._pages["history"].widget()
+
+    @property
+    def settings_tab(self) -> SettingsTab:
+        return self._pages["settings"].widget()
+
+    def _on_current_tab_changed(self, index: int) -> None:
+        page = self.tabs.widget(index)
+        if isinstance(page, LazyTab):
+            page.widget()
+
+    def _show_tab(self, name: str) -> QWidget:
+        """Make tab ``name`` current, building it if needed, and return its content."""
+        page = self._pages[name]
+        self.tabs.setCurrentWidget(page)
+        return page.widget()
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if self._first_show:
+            self._first_show = False
+            # Queued behind the paint events of the show, so it runs once the window is drawn
+            QTimer.singleShot(0, self._on_first_paint)
+
+    def _on_first_paint(self) -> None:
+        self.startup.mark("première image")
+        self._start_database_loader()
+
+    def _start_database_loader(self) -> None:
+        """Open the database and read the catalog on a worker thread."""
+        self.loader_thread = QThread(self)
+        self.database_loader = DatabaseLoader()
+        self.database_loader.moveToThread(self.loader_thread)
+
+        self.loader_thread.started.connect(self.database_loader.run)
+        self.database_loader.loaded.connect(self._on_database_ready)
+        self.database_loader.failed.connect(self._on_database_failed)
+        self.database_loader.loaded.connect(self.loader_thread.quit)
+        self.database_loader.failed.connect(self.loader_thread.quit)
+        self.loader_thread.finished.connect(self._cleanup_loader_thread)
+        self.loader_thread.start()
+
+    def _on_database_ready(self, db: DatabaseService, data: StartupData) -> None:
+        self.db = db
+        # Tabs built later receive the database in their constructor
+        if self._pages["new_project"].is_built:
+            self.new_project_tab.set_database(db)
+        if self._pages["templates"].is_built:
+            self.templates_tab.set_database(db, data.templates)
+        if self._pages["history"].is_built:
+            self.history_tab.set_database(db)
+        if self._pages["settings"].is_built:
+            self.settings_tab.set_database(db)
+        self.startup.mark("catalogue chargé")
+
+    def _on_database_failed(self, message: str) -> None:
+        get_logger("startup").error("Ouverture de la base de données impossible: %s", message)
+        QMessageBox.critical(
+            self, "Base de données", f"Impossible d'ouvrir la base de données:\n{message}"
+        )
+
+    def _cleanup_loader_thread(self) -> None:
+        if self.database_loader:
+            self.database_loader.deleteLater()
+            self.database_loader = None
+        if self.loader_thread:
+            self.loader_thread.deleteLater()
+            self.loader_thread = None
+
+    def _add_tab(
+        self,
+        name: str,
+        factory: Callable[[], QWidget],
+        icon_name: QStyle.StandardPixmap,
+        label: str,
+    ) -> None:
+        page = LazyTab(name, factory)
+        self._pages[name] = page
         icon = self.style().standardIcon(icon_name)
-        self.tabs.addTab(widget, icon, label)
+        self.tabs.addTab(page, icon, label)
 
     def _register_shortcuts(self) -> None:
         actions = [
-            ("new_project", "Nouveau projet", QKeySequence("Ctrl+N"), lambda: self.tabs.setCurrentWidget(self.new_project_tab)),
-            ("generate", "Générer", QKeySequence("Ctrl+G"), self.new_project_tab.generate_project),
-            ("focus_logs", "Focus logs", QKeySequence("Ctrl+L"), self.new_project_tab.focus_logs),
+            (
+                "new_project",
+                "Nouveau projet",
+                QKeySequence("Ctrl+N"),
+                lambda: self._show_tab("new_project"),
+            ),
+            (
+                "generate",
+                "Générer",
+                QKeySequence("Ctrl+G"),
+                lambda: self._show_tab("new_project").generate_project(),
+            ),
+            (
+                "focus_logs",
+                "Focus logs",
+                QKeySequence("Ctrl+L"),
+                lambda: self._show_tab("new_project").focus_logs(),
+            ),
             ("refresh", "Actualiser", QKeySequence("F5"), self._refresh_current_tab),
         ]
 
@@ -142,12 +277,15 @@ class MainWindow(QMainWindow):
 
     def _refresh_current_tab(self) -> None:
         """Refresh the currently visible tab if it provides a refresh action."""
-        current = self.tabs.currentWidget()
-        if current is self.templates_tab:
-            self.templates_tab.load_templates()
-        elif current is self.history_tab:
+        page = self.tabs.currentWidget()
+        if not isinstance(page, LazyTab):
+            return
+        current = page.widget()
+        if page.name == "templates":
+            self.templates_tab.reload_templates()
+        elif page.name == "history":
             self.history_tab.load_history()
-        elif current is self.settings_tab:
+        elif page.name == "settings":
             self.settings_tab.refresh_statistics()
         elif hasattr(current, "refresh"):
             current.refresh()
@@ -181,8 +319,8 @@ class MainWindow(QMainWindow):
         """Handle generation completion with additional actions"""
         self.new_project_tab.on_generation_finished(success)
 
-        if success:
-            # Reload history tab
+        if success and self._pages["history"].is_built:
+            # Reload history tab; otherwise it reads the history when first shown
             self.history_tab.load_history()
 
     def _cleanup_generation_thread(self) -> None:
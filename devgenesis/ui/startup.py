@@ -0,0 +1,65 @@
+"""Startup instrumentation and the background database loader for the GUI."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from devgenesis.logger import get_logger
+
+if TYPE_CHECKING:
+    from devgenesis.database import TemplateSummary
+
+
+class StartupTimer:
+    """Record how long each startup phase takes and write it to the log."""
+
+    def __init__(self, started: Optional[float] = None):
+        self.started = time.perf_counter() if started is None else started
+        self.phases: Dict[str, float] = {}  # Milliseconds since ``started``
+        self._last = self.started
+        self._logger = get_logger("startup")
+
+    def mark(self, phase: str) -> float:
+        """Close ``phase`` now; returns the milliseconds elapsed since startup."""
+        now = time.perf_counter()
+        elapsed = (now - self.started) * 1000
+        self.phases[phase] = elapsed
+        self._logger.info(
+            "Démarrage: %s à %.0f ms (+%.0f ms)", phase, elapsed, (now - self._last) * 1000
+        )
+        self._last = now
+        return elapsed
+
+
+@dataclass
+class StartupData:
+    """What the startup tabs need to leave their loading state."""
+
+    templates: List[TemplateSummary] = field(default_factory=list)
+
+
+class DatabaseLoader(QObject):
+    """Open the database and read the first catalog off the GUI thread."""
+
+    loaded = Signal(object, object)  # DatabaseService, StartupData
+    failed = Signal(str)
+
+    @Slot()
+    def run(self) -> None:
+        try:
+            from devgenesis.database import DatabaseService
+
+            db = DatabaseService()
+            # History and statistics are read by their tabs, which are built on first show
+            data = StartupData(templates=db.list_template_summaries())
+        except Exception as exc:  # pragma: no cover - reported in the window
+            self.failed.emit(str(exc))
+            return
+        self.loaded.emit(db, data)
+
+
+__all__ = ["DatabaseLoader", "StartupData", "StartupTimer"]
@@ -1,6 +1,9 @@
 """History tab widget"""
 
+from __future__ import annotations
+
 import shutil
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
@@ -16,16 +19,18 @@ from PySide6.QtWidgets import (
     QStyle,
 )
 
-from devgenesis.database import DatabaseService
 from devgenesis.generator import preview_project_from_template
 from devgenesis.logger import LOG_FILE
 from devgenesis.ui.dialogs.preview_dialog import PreviewDialog
 
+if TYPE_CHECKING:
+    from devgenesis.database import DatabaseService
+
 
 class HistoryTab(QWidget):
     """Project history tab"""
     
-    def __init__(self, db: DatabaseService, parent=None):
+    def __init__(self, db: Optional[DatabaseService] = None, parent=None):
         super().__init__(parent)
         self.db = db
         self._init_ui()
@@ -71,14 +76,33 @@ class HistoryTab(QWidget):
         btn_layout.addStretch()
         layout.addLayout(btn_layout)
         
-        # Load initial history
+        # Load initial history, or wait for the startup loader to provide it
+        if self.db is not None:
+            self.load_history()
+        else:
+            self.show_loading()
+
+    def show_loading(self) -> None:
+        """Show a placeholder until the database is ready"""
+        self.history_list.clear()
+        item = QListWidgetItem("Chargement de l'historique…")
+        item.setFlags(Qt.ItemFlag.NoItemFlags)
+        self.history_list.addItem(item)
+
+    def set_database(self, db: DatabaseService) -> None:
+        """Attach the database once it is open and read the history"""
+        self.db = db
         self.load_history()
-    
+
     def load_history(self):
         """Load project history"""
-        self.history_list.clear()
-        history = self.db.get_project_history()
+        if self.db is None:
+            return
+        self.show_history(self.db.get_project_history())
 
+    def show_history(self, history: List[Dict[str, Any]]) -> None:
+        """Fill the list with ``history`` entries"""
+        self.history_list.clear()
         for item in history:
             item_text = f"{item['project_name']} - {item['template_name']} ({item['created_at'][:10]})"
             list_item = QListWidgetItem(item_text)
@@ -94,7 +118,7 @@ class HistoryTab(QWidget):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
         )
 
-        if reply == QMessageBox.StandardButton.Yes:
+        if reply == QMessageBox.StandardButton.Yes and self.db is not None:
             self.db.clear_history()
             self.load_history()
             QMessageBox.information(self, "Succès", "L'historique a été effacé")
@@ -130,7 +154,7 @@ class HistoryTab(QWidget):
             return
 
         data = item.data(Qt.ItemDataRole.UserRole)
-        if not data or not data.get("template_name"):
+        if not data or not data.get("template_name") or self.db is None:
             QMessageBox.warning(self, "Template manquant", "Impossible de retrouver le template associé.")
             return
 
@@ -6,7 +6,7 @@ import os
 import re
 import shutil
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
@@ -33,23 +33,27 @@ from PySide6.QtWidgets import (
 )
 
 from devgenesis.config import PROJECT_TYPES
-from devgenesis.database import DatabaseService
-from devgenesis.generator import preview_project_from_template
+from devgenesis.generator import build_generation_plan
+from devgenesis.plan import GenerationPlan
 from devgenesis.ui.dialogs.preview_dialog import PreviewDialog
 
+if TYPE_CHECKING:
+    from devgenesis.database import DatabaseService, TemplateSummary
+
 
 class NewProjectTab(QWidget):
     """New project creation tab"""
 
     generate_requested = Signal(dict)  # Signal with project configuration
 
-    def __init__(self, db: DatabaseService, parent=None):
+    def __init__(self, db: Optional[DatabaseService] = None, parent=None):
         super().__init__(parent)
         self.db = db
-        self.current_template: Optional[Dict[str, Any]] = None
+        self.current_template: Optional[TemplateSummary] = None  # Full template read on use
         self._error_labels: Dict[str, QLabel] = {}
         self._config_panel: Optional[QWidget] = None
         self.preview_dialog: Optional[PreviewDialog] = None
+        self._preview_plan: Optional[Tuple[Tuple[Any, ...], GenerationPlan]] = None
         self._init_ui()
 
     def _init_ui(self):
@@ -79,6 +83,9 @@ class NewProjectTab(QWidget):
 
         layout.addLayout(content_layout)
 
+        # Selecting the first type fills the template combo, which must exist by now
+        self.project_types_list.setCurrentRow(0)
+
     def _create_project_types_panel(self) -> QWidget:
         """Create project types selection panel"""
         widget = QWidget()
@@ -116,7 +123,6 @@ class NewProjectTab(QWidget):
 
         self.project_types_list.currentItemChanged.connect(self.on_project_type_selected)
         layout.addWidget(self.project_types_list)
-        self.project_types_list.setCurrentRow(0)
 
         return widget
 
@@ -239,6 +245,7 @@ class NewProjectTab(QWidget):
         self.generate_btn = QPushButton("Générer le projet")
         self.generate_btn.setMinimumHeight(42)
         self.generate_btn.clicked.connect(self.generate_project)
+        self.generate_btn.setEnabled(self.db is not None)  # Enabled by set_database
         buttons_layout.addWidget(self.generate_btn, 1)
         root.addLayout(buttons_layout)
 
@@ -271,21 +278,32 @@ class NewProjectTab(QWidget):
         project_type_key = current.data(Qt.ItemDataRole.UserRole)
         project_type = PROJECT_TYPES[project_type_key]
 
+        # Show recommended technologies
+        recommended = ", ".join(project_type["recommended_tech"])
+        self.tech_label.setText(f"<b>Technologies recommandées:</b> {recommended}")
+
         # Update template combo box
         self.template_combo.clear()
-        templates = self.db.get_templates_by_type(project_type_key)
+        self.template_combo.setEnabled(self.db is not None)
+        if self.db is None:
+            self.template_combo.setPlaceholderText("Chargement des templates…")
+            return
+        templates = self.db.list_template_summaries(project_type_key)
 
         if not templates:
             # If no templates for this type, show all templates
-            templates = self.db.get_all_templates()
+            templates = self.db.list_template_summaries()
 
         for template in templates:
-            self.template_combo.addItem(template["name"], template)
-
-        # Show recommended technologies
-        recommended = ", ".join(project_type["recommended_tech"])
-        self.tech_label.setText(f"<b>Technologies recommandées:</b> {recommended}")
+            self.template_combo.addItem(template.name, template)
     
+    def set_database(self, db: DatabaseService) -> None:
+        """Attach the database once it is open and list the templates of the selected type"""
+        self.db = db
+        self.template_combo.setPlaceholderText("")
+        self.generate_btn.setEnabled(True)
+        self.on_project_type_selected(self.project_types_list.currentItem(), None)
+
     def on_template_selected(self, index):
         """Handle template selection"""
         if index < 0:
@@ -294,7 +312,7 @@ class NewProjectTab(QWidget):
         template = self.template_combo.itemData(index)
         if template:
             self.current_template = template
-            self.template_desc_label.setText(template["description"])
+            self.template_desc_label.setText(template.description or "")
             error_label = self._error_labels.get("template")
             if error_label:
                 error_label.setVisible(False)
@@ -327,6 +345,10 @@ class NewProjectTab(QWidget):
             if reply == QMessageBox.StandardButton.No:
                 return
 
+        # Reuse the plan rendered by the last preview when nothing changed since
+        if self._preview_plan and self._preview_plan[0] == self._plan_key(config):
+            config["plan"] = self._preview_plan[1]
+
         self.generate_requested.emit(config)
 
     def preview_generation(self) -> None:
@@ -335,7 +357,7 @@ class NewProjectTab(QWidget):
             return
 
         try:
-            preview = preview_project_from_template(
+            plan = build_generation_plan(
                 template=config["template"],
                 project_name=config["project_name"],
                 project_path=config["project_path"],
@@ -348,20 +370,43 @@ class NewProjectTab(QWidget):
             QMessageBox.critical(self, "Aperçu impossible", str(exc))
             return
 
-        self.preview_dialog = PreviewDialog(config["project_name"], preview, self)
+        self._preview_plan = (self._plan_key(config), plan)
+        self.preview_dialog = PreviewDialog(config["project_name"], plan.preview(), self)
         self.preview_dialog.exec()
 
+    @staticmethod
+    def _plan_key(config: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Identify the inputs a generation plan was rendered from."""
+        template = config["template"]
+        return (
+            template.get("id"),
+            template.get("name"),
+            template.get("updated_at"),
+            config["project_name"],
+            config["project_path"],
+            config.get("description"),
+            config.get("git_init", True),
+            config.get("create_venv", True),
+            config.get("install_deps", True),
+        )
+
     def _build_generation_config(self) -> Optional[Dict[str, Any]]:
         validated = self._validate_inputs()
         if not validated:
             return None
 
+        # The combo only holds summaries; files and commands are read now
+        template = self.db.get_template_by_id(self.current_template.id)
+        if template is None:
+            self._set_error("template", "Ce template n'existe plus.")
+            return None
+
         project_name = validated["project_name"]
         base_path = Path(validated["base_path"])
         full_path = str(base_path / project_name)
 
         config = {
-            "template": self.current_template,
+            "template": template,
             "project_name": project_name,
             "project_path": full_path,
             "description": self.project_desc_input.toPlainText().strip(),
@@ -406,7 +451,10 @@ class NewProjectTab(QWidget):
                         self._set_error("path", "Impossible de vérifier l'espace disque.")
                         valid = False
 
-        if not self.current_template:
+        if self.db is None:
+            self._set_error("template", "Chargement des templates…")
+            valid = False
+        elif not self.current_template:
             self._set_error("template", "Veuillez sélectionner un template.")
             valid = False
 
@@ -445,7 +493,7 @@ class NewProjectTab(QWidget):
     
     def set_generation_in_progress(self, in_progress: bool):
         """Set UI state for generation in progress"""
-        self.generate_btn.setEnabled(not in_progress)
+        self.generate_btn.setEnabled(not in_progress and self.db is not None)
         self.preview_btn.setEnabled(not in_progress and self.current_template is not None)
         if self._config_panel:
             self._config_panel.setEnabled(not in_progress)
@@ -1,5 +1,9 @@
 """Settings tab widget"""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor, QBrush
 from PySide6.QtWidgets import (
@@ -14,14 +18,16 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from devgenesis.database import DatabaseService
 from devgenesis.services.environment import check_environment
 
+if TYPE_CHECKING:
+    from devgenesis.database import DatabaseService
+
 
 class SettingsTab(QWidget):
     """Settings and about tab"""
     
-    def __init__(self, db: DatabaseService, parent=None):
+    def __init__(self, db: Optional[DatabaseService] = None, parent=None):
         super().__init__(parent)
         self.db = db
         self._init_ui()
@@ -88,12 +94,25 @@ class SettingsTab(QWidget):
         layout.addWidget(about_group)
         layout.addStretch()
         
-        # Load initial statistics
+        # Load initial statistics, or wait for the startup loader to provide them
+        if self.db is not None:
+            self.refresh_statistics()
+        else:
+            self.stats_label.setText("Chargement des statistiques…")
+
+    def set_database(self, db: DatabaseService) -> None:
+        """Attach the database once it is open and read the statistics"""
+        self.db = db
         self.refresh_statistics()
 
     def refresh_statistics(self):
         """Refresh statistics display"""
-        stats = self.db.get_statistics()
+        if self.db is None:
+            return
+        self.show_statistics(self.db.get_statistics())
+
+    def show_statistics(self, stats: Dict[str, Any]) -> None:
+        """Display ``stats`` as returned by ``DatabaseService.get_statistics``"""
         stats_text = f"""
         <b>Templates disponibles:</b> {stats['total_templates']}<br>
         <b>Templates intégrés:</b> {stats['builtin_templates']}<br>
@@ -1,6 +1,9 @@
 """Templates management tab widget"""
 
+from __future__ import annotations
+
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
 from PySide6.QtWidgets import (
     QWidget,
@@ -16,17 +19,19 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import QStyle
 
-from devgenesis.database import DatabaseService
 from devgenesis.generator import preview_project_from_template
 from devgenesis.ui.dialogs.preview_dialog import PreviewDialog
 
+if TYPE_CHECKING:
+    from devgenesis.database import DatabaseService, TemplateSummary
+
 
 class TemplatesTab(QWidget):
     """Templates management tab"""
     
     refresh_requested = Signal()  # Signal when refresh is requested
     
-    def __init__(self, db: DatabaseService, parent=None):
+    def __init__(self, db: Optional[DatabaseService] = None, parent=None):
         super().__init__(parent)
         self.db = db
         self._init_ui()
@@ -59,22 +64,38 @@ class TemplatesTab(QWidget):
         btn_layout.addStretch()
         layout.addLayout(btn_layout)
         
-        # Load initial templates
-        self.load_templates()
+        # Load initial templates, or wait for the startup loader to provide them
+        if self.db is not None:
+            self.load_templates()
+        else:
+            self.show_loading()
     
     def _on_refresh(self):
         """Handle refresh button click"""
-        self.load_templates()
+        self.reload_templates()
         self.refresh_requested.emit()
 
+    def reload_templates(self) -> None:
+        """Read the templates from the database again, bypassing the catalog cache"""
+        if self.db is None:
+            return
+        self.db.invalidate_catalog()
+        self.load_templates()
+
     def _on_preview(self):
         """Open a dry-run preview for the selected template."""
+        if self.db is None:
+            QMessageBox.information(
+                self, "Chargement", "Les templates sont en cours de chargement, veuillez patienter."
+            )
+            return
         item = self.templates_list.currentItem()
         if not item:
             QMessageBox.information(self, "Aucun template", "Veuillez sélectionner un template à prévisualiser.")
             return
 
-        template = item.data(Qt.ItemDataRole.UserRole)
+        template_id = item.data(Qt.ItemDataRole.UserRole)
+        template = self.db.get_template_by_id(template_id) if template_id is not None else None
         if not template:
             QMessageBox.warning(self, "Template invalide", "Le template sélectionné est introuvable.")
             return
@@ -101,16 +122,36 @@ class TemplatesTab(QWidget):
         dialog = PreviewDialog(project_name.strip(), preview, self)
         dialog.exec()
 
+    def show_loading(self) -> None:
+        """Show a placeholder until the database is ready"""
+        self.templates_list.clear()
+        item = QListWidgetItem("Chargement des templates…")
+        item.setFlags(Qt.ItemFlag.NoItemFlags)
+        self.templates_list.addItem(item)
+
+    def set_database(
+        self, db: DatabaseService, templates: Optional[List[TemplateSummary]] = None
+    ) -> None:
+        """Attach the database once it is open, with the catalog already read if available"""
+        self.db = db
+        if templates is None:
+            self.load_templates()
+        else:
+            self.show_templates(templates)
+
     def load_templates(self):
         """Load templates from database"""
-        templates = self.db.get_all_templates()
+        if self.db is None:
+            return
+        self.show_templates(self.db.list_template_summaries())
 
-        # Update templates list
+    def show_templates(self, templates: List[TemplateSummary]) -> None:
+        """Fill the list with ``templates``; items keep only the template id"""
         self.templates_list.clear()
         for template in templates:
-            item_text = f"{template['name']} - {template['description']}"
-            if template['is_builtin']:
+            item_text = f"{template.name} - {template.description}"
+            if template.is_builtin:
                 item_text += " [Intégré]"
             item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, template)
+            item.setData(Qt.ItemDataRole.UserRole, template.id)
             self.templates_list.addItem(item)
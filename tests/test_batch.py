@@ -0,0 +1,46 @@
+"""Generating several builtin templates from one manifest."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import List
+
+from devgenesis.batch import load_batch_manifest, main
+from devgenesis.services.manifest import verify_project
+
+MANIFEST = {
+    "defaults": {
+        "output": "projets",
+        "git_init": False,
+        "create_venv": False,
+        "install_deps": False,
+    },
+    "projects": [
+        {"template": "Python CLI + Rich", "name": "outil"},
+        {"template": "FastAPI + Docker", "name": "api", "path": "services/api"},
+    ],
+}
+
+
+def test_batch_generates_each_project(tmp_path: Path) -> None:
+    manifest = tmp_path / "lot.json"
+    manifest.write_text(json.dumps(MANIFEST), encoding="utf-8")
+    jobs = load_batch_manifest(manifest)
+    assert [job.path for job in jobs] == [
+        str(tmp_path / "projets" / "outil"),
+        str(tmp_path / "services" / "api"),
+    ]
+
+    lines: List[str] = []
+    assert main([str(manifest), "--workers", "2"], output=lines.append) == 0
+
+    report = json.loads((tmp_path / "lot.report.json").read_text(encoding="utf-8"))
+    assert (report["succeeded"], report["failed"], report["workers"]) == (2, 0, 2)
+    assert [project["name"] for project in report["projects"]] == ["outil", "api"]
+    for job in jobs:
+        project = Path(job.path)
+        assert verify_project(project, full=True).ok
+        assert not (project / ".git").exists()
+        assert not (project / "venv").exists()
+    assert any("2 réussi(s)" in line for line in lines)
@@ -0,0 +1,37 @@
+"""The headless command line starts without the GUI or the generator stack."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from devgenesis.import_budget import BUDGETS, ImportMeasure, measure, violations
+
+ROOT = Path(__file__).resolve().parent.parent
+CLI_BUDGET = next(budget for budget in BUDGETS if budget.module == "devgenesis.cli")
+
+
+def test_help_stays_within_the_import_budget(tmp_path: Path) -> None:
+    env = {**os.environ, "HOME": str(tmp_path), "PYTHONPATH": str(ROOT)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "devgenesis.cli", "--help"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "usage: devgenesis" in result.stdout
+
+    # ``--help`` must not pull in what a bare import of the CLI leaves out
+    loaded = {
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and line.count("|") == 2
+    }
+    assert "devgenesis" in loaded
+    assert violations(CLI_BUDGET, ImportMeasure(CLI_BUDGET.module, loaded=loaded)) == []
+    assert list(tmp_path.iterdir()) == []
+
+    assert violations(CLI_BUDGET, measure(CLI_BUDGET.module, runs=3)) == []
@@ -0,0 +1,80 @@
+"""Post-generation commands and their console output."""
+
+from __future__ import annotations
+
+import shlex
+import sys
+from pathlib import Path
+
+import pytest
+
+from devgenesis.generator import generate_project_from_template
+
+PYTHON = shlex.quote(sys.executable)
+
+
+def _template(commands: list) -> dict:
+    return {
+        "name": "Test",
+        "description": "Projet de test",
+        "project_type": "cli_tool",
+        "technologies": [{"name": "Python"}],
+        "structure": [],
+        "files": [{"path": "README.md", "content": "# Test\n"}],
+        "commands": commands,
+    }
+
+
+def _generate(tmp_path: Path, commands: list) -> bool:
+    return generate_project_from_template(
+        _template(commands), "demo", str(tmp_path / "demo"), git_init=False, create_venv=False
+    )
+
+
+def test_labelled_output_keeps_its_prefix(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    commands = [
+        {"name": "npm", "run": f"{PYTHON} -c \"print('[notice] uvicorn[standard]')\""},
+        {"name": "pip", "run": f"{PYTHON} -c \"print('[/x] fini')\""},
+    ]
+    assert _generate(tmp_path, commands)
+
+    output = capsys.readouterr().out
+    assert "[npm] [notice] uvicorn[standard]" in output
+    assert "[pip] [/x] fini" in output
+
+
+
+def _python(code: str) -> str:
+    return f"{PYTHON} -c {shlex.quote(code)}"
+
+
+def test_dependent_command_waits(tmp_path: Path) -> None:
+    commands = [
+        {
+            "name": "b",
+            "run": _python("import os; open('b', 'w').write(str(os.path.exists('a')))"),
+            "depends_on": ["a"],
+        },
+        {"name": "a", "run": _python("import time; time.sleep(0.3); open('a', 'w').close()")},
+    ]
+    assert _generate(tmp_path, commands)
+
+    assert (tmp_path / "demo" / "b").read_text() == "True"
+
+
+def test_failed_command_skips_its_dependents(tmp_path: Path) -> None:
+    commands = [
+        {"name": "a", "run": _python("import sys; sys.exit(3)")},
+        {"name": "b", "run": _python("open('b', 'w').close()"), "depends_on": ["a"]},
+    ]
+    _generate(tmp_path, commands)
+
+    assert (tmp_path / "demo" / "README.md").is_file()
+    assert not (tmp_path / "demo" / "b").exists()
+
+
+def test_command_with_markup_is_run(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    assert _generate(tmp_path, [_python("open('out.txt', 'w').write('x[/y]')")])
+
+    assert (tmp_path / "demo" / "out.txt").read_text() == "x[/y]"
+    assert "Commande réussie" in capsys.readouterr().out
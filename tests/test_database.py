@@ -0,0 +1,47 @@
+"""Template catalog and body caches of the database service."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from devgenesis import orm
+from devgenesis.database import DatabaseService
+
+
+@pytest.fixture
+def db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> DatabaseService:
+    monkeypatch.setattr(orm, "DATABASE_PATH", tmp_path / "devgenesis.db")
+    monkeypatch.setattr(orm, "_engine", None)
+    monkeypatch.setattr(orm, "_session_factory", None)
+    return DatabaseService(body_cache_size=2)
+
+
+def test_templates_by_type_are_served_from_the_caches(db: DatabaseService) -> None:
+    summaries = db.list_template_summaries()
+    assert len(summaries) > 2
+    project_types = {summary.project_type for summary in summaries}
+
+    for _ in range(2):
+        for project_type in project_types:
+            templates = db.get_templates_by_type(project_type)
+            assert [template["id"] for template in templates] == [
+                summary.id for summary in db.list_template_summaries(project_type)
+            ]
+
+    info = db.catalog_info()
+    assert info["misses"] == 1
+    assert info["max_bodies"] == len(summaries)
+    # Every body was read once, then served from memory on the second pass
+    assert info["body_misses"] == len(summaries)
+    assert info["body_hits"] == len(summaries)
+
+
+def test_created_template_is_listed_by_type(db: DatabaseService) -> None:
+    created = db.create_template(
+        "Perso", "Template personnalisé", "cli_tool", [{"name": "Python"}], [], [], []
+    )
+
+    assert created["id"] in [t["id"] for t in db.get_templates_by_type("cli_tool")]
+    assert db.catalog_info()["max_bodies"] == len(db.list_template_summaries())
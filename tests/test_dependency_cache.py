@@ -0,0 +1,93 @@
+"""Installed dependencies cached by the manifest that produced them."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from devgenesis.services.dependency_cache import DependencyCache, detect_install
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="venv POSIX uniquement")
+
+
+def _venv(root: Path) -> Path:
+    venv = root / "venv"
+    (venv / "lib" / "python3.12" / "site-packages").mkdir(parents=True)
+    (venv / "bin").mkdir()
+    (venv / "bin" / "pip").write_text("#!/bin/sh\n")
+    (venv / "pyvenv.cfg").write_text("home = /usr/bin\nversion_info = 3.12.1\n")
+    return venv
+
+
+def _project(root: Path, requirements: str) -> Path:
+    root.mkdir(parents=True)
+    (root / "requirements.txt").write_text(requirements)
+    return root
+
+
+def _pip_install(venv: Path) -> list:
+    return [str(venv / "bin" / "pip"), "install", "-r", "requirements.txt"]
+
+
+def test_key_follows_the_requirements(tmp_path: Path) -> None:
+    first = _project(tmp_path / "a", "rich==13.7.0\n")
+    second = _project(tmp_path / "b", "rich==13.7.1\n")
+    venv_a, venv_b = _venv(first), _venv(second)
+
+    key_a = detect_install(_pip_install(venv_a), first, venv_a)
+    key_b = detect_install(_pip_install(venv_b), second, venv_b)
+
+    assert key_a is not None and key_b is not None
+    assert key_a.key != key_b.key
+    assert detect_install(["pip", "install", "rich"], first, venv_a) is None
+
+
+def test_local_requirements_are_not_cached(tmp_path: Path) -> None:
+    project = _project(tmp_path / "p", "-e .\n")
+    venv = _venv(project)
+
+    assert detect_install(_pip_install(venv), project, venv) is None
+
+
+def test_restore_rewrites_scripts_for_the_new_venv(tmp_path: Path) -> None:
+    cache = DependencyCache(tmp_path / "cache")
+    source = _project(tmp_path / "source", "outil==1.0\n")
+    venv = _venv(source)
+    install = detect_install(_pip_install(venv), source, venv)
+    assert install is not None
+
+    # What pip would have installed
+    (install.target / "outil").mkdir()
+    (install.target / "outil" / "__init__.py").write_text("VERSION = '1.0'\n")
+    (venv / "bin" / "outil").write_text(f"#!{venv}/bin/python\nimport outil\n")
+    assert cache.store(install)
+    assert not cache.store(install)
+
+    target = _project(tmp_path / "target", "outil==1.0\n")
+    new_venv = _venv(target)
+    restored = detect_install(_pip_install(new_venv), target, new_venv)
+    assert restored is not None and restored.key == install.key
+    assert cache.restore(restored)
+
+    assert (restored.target / "outil" / "__init__.py").read_text() == "VERSION = '1.0'\n"
+    script = new_venv / "bin" / "outil"
+    assert script.read_text() == f"#!{new_venv}/bin/python\nimport outil\n"
+    assert os.access(script, os.X_OK)
+
+
+def test_prune_keeps_the_most_recent_entries(tmp_path: Path) -> None:
+    cache = DependencyCache(tmp_path / "cache", max_entries=1)
+    keys = []
+    for index in range(2):
+        project = _project(tmp_path / f"p{index}", f"paquet=={index}\n")
+        venv = _venv(project)
+        install = detect_install(_pip_install(venv), project, venv)
+        (install.target / "paquet").mkdir()
+        assert cache.store(install)
+        keys.append(install.key)
+        os.utime(cache.root / install.key, (1000 + index, 1000 + index))
+
+    assert not cache.contains(keys[0])
+    assert cache.contains(keys[1])
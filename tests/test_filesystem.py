@@ -0,0 +1,40 @@
+"""File copies through the kernel and their fallbacks."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from devgenesis.services.filesystem import copy_file
+
+DATA = os.urandom(256 * 1024 + 7)
+
+
+def test_short_kernel_copy_falls_back(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    source = tmp_path / "source.bin"
+    source.write_bytes(DATA)
+
+    def short_copy(src: int, dst: int, count: int, offset_src: int, offset_dst: int) -> int:
+        # Copies a first block, then reports 0 as some filesystems do
+        if offset_src:
+            return 0
+        os.pwrite(dst, os.pread(src, 4096, 0), 0)
+        return 4096
+
+    monkeypatch.setattr(os, "copy_file_range", short_copy, raising=False)
+    monkeypatch.setattr(os, "sendfile", lambda *args: 0, raising=False)
+
+    copy_file(source, tmp_path, "copy.bin")
+
+    assert (tmp_path / "copy.bin").read_bytes() == DATA
+
+
+def test_kernel_copy(tmp_path: Path) -> None:
+    source = tmp_path / "source.bin"
+    source.write_bytes(DATA)
+
+    copy_file(source, tmp_path, "copy.bin")
+
+    assert (tmp_path / "copy.bin").read_bytes() == DATA
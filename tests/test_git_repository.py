@@ -0,0 +1,143 @@
+"""Compare the in-process Git writer with what ``git`` itself produces."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from devgenesis.services.git_repository import (
+    GitIgnore,
+    GitSettings,
+    commit_files,
+    init_repository,
+)
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git introuvable")
+
+IDENTITY = ("Test", "test@example.com")
+
+TREE: Dict[str, bytes] = {
+    ".gitignore": b"*.log\n!keep.log\nbuild/\n/rootonly.txt\n",
+    "README.md": b"# Projet\n",
+    "bin/run.sh": b"#!/bin/sh\necho ok\n",
+    "src/pkg/__init__.py": b"",
+    "src/pkg/mod.py": b"VALUE = 1\n",
+    "src/pkg/data/keep.log": b"garde\n",
+    "src/pkg/data/debug.log": b"ignore\n",
+    "src/.gitignore": b"*.tmp\n",
+    "src/cache.tmp": b"ignore\n",
+    "build/out.js": b"ignore\n",
+    "rootonly.txt": b"ignore\n",
+    "docs/rootonly.txt": b"garde\n",
+}
+
+
+def _git(cwd: Path, *args: str, input: str | None = None) -> subprocess.CompletedProcess:
+    env = dict(
+        os.environ,
+        GIT_CONFIG_GLOBAL=os.devnull,
+        GIT_CONFIG_NOSYSTEM="1",
+        GIT_AUTHOR_NAME=IDENTITY[0],
+        GIT_AUTHOR_EMAIL=IDENTITY[1],
+        GIT_COMMITTER_NAME=IDENTITY[0],
+        GIT_COMMITTER_EMAIL=IDENTITY[1],
+    )
+    return subprocess.run(
+        ["git", *args], cwd=cwd, env=env, input=input, capture_output=True, text=True
+    )
+
+
+def _write_tree(root: Path, files: Dict[str, bytes]) -> None:
+    for path, data in files.items():
+        target = root / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+    (root / "bin/run.sh").chmod(0o755)
+
+
+def test_commit_matches_git(tmp_path: Path) -> None:
+    native = tmp_path / "native"
+    reference = tmp_path / "reference"
+    for root in (native, reference):
+        root.mkdir()
+        _write_tree(root, TREE)
+
+    init_repository(native)
+    settings = GitSettings(author=IDENTITY, committer=IDENTITY)
+    sha = commit_files(native, {path: native / path for path in TREE}, "Initial", settings)
+    assert sha is not None
+
+    assert _git(reference, "init", "-q", "-b", "master").returncode == 0
+    assert _git(reference, "add", ".").returncode == 0
+    assert _git(reference, "commit", "-q", "-m", "Initial").returncode == 0
+
+    listing = _git(native, "ls-tree", "-r", "HEAD").stdout
+    assert listing == _git(reference, "ls-tree", "-r", "HEAD").stdout
+    assert "100755 blob" in next(line for line in listing.splitlines() if "bin/run.sh" in line)
+    committed = {line.split("\t", 1)[1] for line in listing.splitlines()}
+    assert "src/pkg/data/keep.log" in committed
+    assert committed.isdisjoint(
+        {"src/pkg/data/debug.log", "src/cache.tmp", "build/out.js", "rootonly.txt"}
+    )
+
+    assert _git(native, "rev-parse", "HEAD").stdout.strip() == sha
+    assert _git(native, "status", "--porcelain").stdout == ""
+    fsck = _git(native, "fsck", "--strict", "--no-dangling")
+    assert fsck.returncode == 0, fsck.stderr
+
+
+IGNORE_FILES: Dict[str, str] = {
+    "": "*.log\n!keep.log\nbuild/\n/rootonly.txt\ndocs/*.md\n**/deep/*.tmp\n# commentaire\n",
+    "sub": "*.txt\n!garde.txt\n/local/\n",
+}
+
+IGNORE_PATHS: List[str] = [
+    "app.log",
+    "keep.log",
+    "logs/app.log",
+    "logs/keep.log",
+    "build/out.js",
+    "src/build/out.js",
+    "build.py",
+    "rootonly.txt",
+    "src/rootonly.txt",
+    "docs/index.md",
+    "docs/api/index.md",
+    "src/docs/index.md",
+    "a/deep/x.tmp",
+    "deep/x.tmp",
+    "a/deep/b/x.tmp",
+    "sub/notes.txt",
+    "sub/garde.txt",
+    "sub/inner/notes.txt",
+    "notes.txt",
+    "sub/local/file.py",
+    "local/file.py",
+    "sub/inner/local/file.py",
+    "build/keep.log",
+]
+
+
+def test_ignore_matches_check_ignore(tmp_path: Path) -> None:
+    assert _git(tmp_path, "init", "-q").returncode == 0
+    matcher = GitIgnore()
+    for base, text in IGNORE_FILES.items():
+        directory = tmp_path / base
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / ".gitignore").write_text(text, encoding="utf-8")
+        matcher.add(base, text)
+    for path in IGNORE_PATHS:
+        target = tmp_path / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.touch()
+
+    result = _git(tmp_path, "check-ignore", "--stdin", input="\n".join(IGNORE_PATHS) + "\n")
+    assert result.returncode in (0, 1), result.stderr
+    expected = set(result.stdout.split())
+
+    assert {path for path in IGNORE_PATHS if matcher.ignored(path)} == expected
@@ -0,0 +1,74 @@
+"""Generation plans shared between preview, generate and saved replays."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from devgenesis.generator import build_generation_plan, generate_project_from_plan
+from devgenesis.plan import GenerationPlan
+
+TEMPLATE: Dict[str, Any] = {
+    "name": "Test",
+    "description": "Projet de test",
+    "project_type": "cli_tool",
+    "technologies": [{"name": "Python", "version": "3.12"}],
+    "structure": ["src/{{ project_name }}", "tests"],
+    "files": [
+        {
+            "path": "README.md",
+            "content": "# {{ project_name }}\n\n{{ description }}\n",
+            "is_template": True,
+        },
+        {"path": "src/{{ project_name }}/__init__.py", "content": "", "is_template": True},
+        {"path": "data.bin", "content": "é \n"},
+    ],
+    "commands": [
+        "echo prêt",
+        {"name": "lint", "run": "echo lint", "cwd": "src", "depends_on": []},
+    ],
+}
+
+
+def _plan(tmp_path: Path) -> GenerationPlan:
+    return build_generation_plan(
+        TEMPLATE, "demo", str(tmp_path / "demo"), git_init=False, create_venv=False
+    )
+
+
+def test_plan_survives_serialisation(tmp_path: Path) -> None:
+    plan = _plan(tmp_path)
+    path = tmp_path / "plan.json"
+    plan.save(path)
+
+    loaded = GenerationPlan.load(path)
+
+    assert loaded.to_dict() == plan.to_dict()
+    assert loaded.content_hash == plan.content_hash
+    assert loaded.files == plan.files
+    assert loaded.commands == plan.commands
+    assert loaded.mkdirs == plan.mkdirs
+    assert loaded.preview() == plan.preview()
+
+
+def test_loaded_plan_generates_the_planned_files(tmp_path: Path) -> None:
+    plan = _plan(tmp_path)
+    loaded = GenerationPlan.from_dict(json.loads(json.dumps(plan.to_dict())))
+
+    assert generate_project_from_plan(loaded)
+
+    root = tmp_path / "demo"
+    for planned in plan.files:
+        assert (root / planned.path).read_bytes() == planned.content
+    assert (root / "tests").is_dir()
+
+
+def test_tampered_plan_is_rejected(tmp_path: Path) -> None:
+    data = _plan(tmp_path).to_dict()
+    data["directories"].append("extra")
+
+    with pytest.raises(ValueError):
+        GenerationPlan.from_dict(data)
@@ -0,0 +1,95 @@
+"""Streaming subprocess runner: timeouts, process groups and callbacks."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from devgenesis.services.process import IdleTimeoutExpired, run_streaming
+
+posix_only = pytest.mark.skipif(os.name != "posix", reason="groupes de processus POSIX")
+
+
+def _python(code: str) -> List[str]:
+    return [sys.executable, "-c", code]
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def _wait_gone(pid: int, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not _alive(pid):
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_lines_are_streamed_in_order() -> None:
+    lines: List[Tuple[str, str]] = []
+    code = "import sys\nfor i in range(3): print(i, flush=True)\nprint('err', file=sys.stderr)"
+
+    result = run_streaming(_python(code), lambda stream, line: lines.append((stream, line)))
+
+    assert result.returncode == 0
+    assert [line for stream, line in lines if stream == "stdout"] == ["0", "1", "2"]
+    assert result.stderr_tail == ["err"]
+
+
+def test_total_timeout_kills_the_process() -> None:
+    code = "import time\nwhile True:\n    print('.', flush=True)\n    time.sleep(0.05)"
+    started = time.monotonic()
+
+    with pytest.raises(subprocess.TimeoutExpired) as caught:
+        run_streaming(_python(code), lambda stream, line: None, timeout=0.5, idle_timeout=None)
+
+    assert not isinstance(caught.value, IdleTimeoutExpired)
+    assert time.monotonic() - started < 5
+
+
+def test_idle_timeout_kills_the_process() -> None:
+    started = time.monotonic()
+
+    with pytest.raises(IdleTimeoutExpired) as caught:
+        run_streaming(
+            _python("import time; print('début', flush=True); time.sleep(30)"),
+            lambda stream, line: None,
+            timeout=30,
+            idle_timeout=0.5,
+        )
+
+    assert "début" in caught.value.output
+    assert time.monotonic() - started < 5
+
+
+@posix_only
+def test_failing_callback_kills_the_process_group(tmp_path: Path) -> None:
+    pid_file = tmp_path / "child.pid"
+    # The grandchild keeps running unless the whole group is killed
+    code = (
+        "import subprocess, sys, time\n"
+        f"child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])\n"
+        f"open({str(pid_file)!r}, 'w').write(str(child.pid))\n"
+        "print('[/x]', flush=True)\n"
+        "time.sleep(30)\n"
+    )
+
+    def on_line(stream: str, line: str) -> None:
+        raise RuntimeError(line)
+
+    with pytest.raises(RuntimeError):
+        run_streaming(_python(code), on_line)
+
+    assert _wait_gone(int(pid_file.read_text()))
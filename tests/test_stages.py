@@ -0,0 +1,74 @@
+"""Dependency-ordered post-generation stages."""
+
+from __future__ import annotations
+
+import threading
+from typing import List
+
+import pytest
+
+from devgenesis.services.stages import Stage, run_stages
+
+
+def test_stages_wait_for_their_dependencies() -> None:
+    order: List[str] = []
+    lock = threading.Lock()
+    both_running = threading.Barrier(2, timeout=5)
+
+    def step(name: str, parallel: bool = False):
+        def action() -> None:
+            if parallel:
+                both_running.wait()  # Fails unless the two independent stages overlap
+            with lock:
+                order.append(name)
+
+        return action
+
+    report = run_stages(
+        [
+            Stage("commit", step("commit"), depends_on=("init", "summary", "commands")),
+            Stage("commands", step("commands"), depends_on=("venv",)),
+            Stage("init", step("init", parallel=True)),
+            Stage("venv", step("venv", parallel=True)),
+            Stage("summary", step("summary")),
+        ]
+    )
+
+    assert report.ok
+    assert order.index("commands") > order.index("venv")
+    assert order[-1] == "commit"
+    assert list(report.timings) == ["commit", "commands", "init", "venv", "summary"]
+
+
+def test_failure_skips_dependents_only() -> None:
+    ran: List[str] = []
+
+    def fail() -> None:
+        raise RuntimeError("échec")
+
+    report = run_stages(
+        [
+            Stage("venv", fail),
+            Stage("commands", lambda: ran.append("commands"), depends_on=("venv",)),
+            Stage("commit", lambda: ran.append("commit"), depends_on=("commands",)),
+            Stage("summary", lambda: ran.append("summary")),
+        ]
+    )
+
+    assert not report.ok
+    assert isinstance(report.failed["venv"], RuntimeError)
+    assert sorted(report.skipped) == ["commands", "commit"]
+    assert ran == ["summary"]
+
+
+@pytest.mark.parametrize(
+    "stages",
+    [
+        [Stage("a", lambda: None, depends_on=("b",)), Stage("b", lambda: None, depends_on=("a",))],
+        [Stage("a", lambda: None, depends_on=("inconnue",))],
+        [Stage("a", lambda: None), Stage("a", lambda: None)],
+    ],
+)
+def test_invalid_graphs_are_rejected(stages: List[Stage]) -> None:
+    with pytest.raises(ValueError):
+        run_stages(stages)
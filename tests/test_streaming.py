@@ -0,0 +1,50 @@
+"""Large template bodies rendered straight to disk."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict
+
+from devgenesis.generator import ProjectGenerator, config_from_template
+from devgenesis.services.manifest import verify_project
+
+TEMPLATE: Dict[str, Any] = {
+    "name": "Test",
+    "description": "Projet de test",
+    "project_type": "cli_tool",
+    "technologies": [{"name": "Python"}],
+    "structure": [],
+    "files": [
+        {
+            "path": "data/rows.csv",
+            "content": (
+                "id;nom\n{% for i in range(20000) %}{{ i }};{{ project_name }} é\n{% endfor %}"
+            ),
+            "is_template": True,
+        },
+        {"path": "crlf.txt", "content": "{{ project_name }}\r\nfin\r\n", "is_template": True},
+    ],
+}
+
+
+def _generate(root: Path, stream: bool) -> ProjectGenerator:
+    config = config_from_template(
+        TEMPLATE, "demo", str(root), git_init=False, create_venv=False, install_deps=False
+    )
+    config.stream_render = stream
+    generator = ProjectGenerator(config)
+    assert generator.generate()
+    return generator
+
+
+def test_streamed_files_match_in_memory_render(tmp_path: Path) -> None:
+    streamed = _generate(tmp_path / "streamed", stream=True)
+    assert all(planned.is_streamed for planned in streamed.build_plan().files)
+    _generate(tmp_path / "memory", stream=False)
+
+    for name in ("data/rows.csv", "crlf.txt"):
+        expected = (tmp_path / "memory" / name).read_bytes()
+        assert (tmp_path / "streamed" / name).read_bytes() == expected
+    assert (tmp_path / "streamed" / "data/rows.csv").stat().st_size > 200_000
+
+    assert verify_project(tmp_path / "streamed", full=True).ok
@@ -0,0 +1,27 @@
+"""Template engine caches."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from devgenesis.services.template_engine import TemplateEngine
+
+
+def test_bytecode_cache_is_pruned_oldest_first(tmp_path: Path) -> None:
+    for index in range(5):
+        entry = tmp_path / f"__jinja2_{index}.cache"
+        entry.write_bytes(b"")
+        os.utime(entry, (1000 + index, 1000 + index))
+    unrelated = tmp_path / "notes.txt"
+    unrelated.write_text("garde", encoding="utf-8")
+
+    engine = TemplateEngine(bytecode_cache_dir=tmp_path, bytecode_cache_max_entries=2)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "__jinja2_3.cache",
+        "__jinja2_4.cache",
+        "notes.txt",
+    ]
+    assert engine.render("{{ name }}", {"name": "ok"}) == "ok"
+    assert len(list(tmp_path.glob("__jinja2_*.cache"))) == 3
@@ -0,0 +1,74 @@
+"""Re-applying a changed template to a generated project."""
+
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+from typing import Any, Dict
+
+from devgenesis.generator import generate_project_from_template, update_project_from_template
+from devgenesis.services.manifest import verify_project
+
+TEMPLATE: Dict[str, Any] = {
+    "name": "Test",
+    "description": "Projet de test",
+    "project_type": "cli_tool",
+    "technologies": [{"name": "Python"}],
+    "structure": ["src"],
+    "files": [
+        {"path": "README.md", "content": "# {{ project_name }}\n", "is_template": True},
+        {"path": "src/main.py", "content": "print('v1')\n"},
+        {"path": "src/config.py", "content": "DEBUG = False\n"},
+        {"path": "src/old.py", "content": "OLD = True\n"},
+    ],
+}
+
+
+def _generate(tmp_path: Path) -> Path:
+    project = tmp_path / "demo"
+    generated = generate_project_from_template(
+        TEMPLATE, "demo", str(project), git_init=False, create_venv=False, install_deps=False
+    )
+    assert generated
+    return project
+
+
+def test_update_applies_template_changes_and_keeps_local_edits(tmp_path: Path) -> None:
+    project = _generate(tmp_path)
+    assert verify_project(project, full=True).ok
+
+    (project / "src/config.py").write_text("DEBUG = True\n", encoding="utf-8")
+    drift = verify_project(project, full=True)
+    assert drift.modified == ["src/config.py"]
+
+    changed = copy.deepcopy(TEMPLATE)
+    changed["files"] = [
+        {"path": "README.md", "content": "# {{ project_name }}\n", "is_template": True},
+        {"path": "src/main.py", "content": "print('v2')\n"},
+        {"path": "src/config.py", "content": "DEBUG = False\nLEVEL = 1\n"},
+        {"path": "src/new.py", "content": "NEW = True\n"},
+    ]
+    report = update_project_from_template(changed, str(project))
+    assert report is not None
+
+    assert report.updated == ["src/main.py"]
+    assert report.created == ["src/new.py"]
+    assert report.removed == ["src/old.py"]
+    assert report.unchanged == ["README.md"]
+    assert report.conflicts == [("src/config.py", "modifié localement")]
+
+    assert (project / "src/main.py").read_text(encoding="utf-8") == "print('v2')\n"
+    assert (project / "src/new.py").read_text(encoding="utf-8") == "NEW = True\n"
+    assert not (project / "src/old.py").exists()
+    assert (project / "src/config.py").read_text(encoding="utf-8") == "DEBUG = True\n"
+
+    # The conflicting file keeps its previous manifest entry, so the edit is still reported
+    after = verify_project(project, full=True)
+    assert after.modified == ["src/config.py"]
+    assert not after.missing
+
+
+def test_update_without_manifest_fails(tmp_path: Path) -> None:
+    project = tmp_path / "vide"
+    project.mkdir()
+    assert update_project_from_template(TEMPLATE, str(project)) is None